@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Measure how long the render entry points take to start
+
+Each module is imported in a fresh interpreter with -X importtime, several
+times to smooth out the noise, and the slowest imports are listed.  Exits
+with an error if a module imports anything from the GUI, or takes longer
+than --max-ms, so that regressions are caught.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+# What each entry point imports.  A render process spawned (rather than
+# forked) by the viewer runs viewer.py as __mp_main__, like multiprocessing
+# does, before importing the module its jobs are in.
+entry_points = {
+    "mcmapper.worker": "import mcmapper.worker",
+    "render": "import render",
+    "viewer worker": "import runpy\nrunpy.run_path('viewer.py', run_name='__mp_main__')\nimport mcmapper.worker",
+}
+gui_modules = ("pyglet",)
+# Run after the import, to also time loading the color table on first use
+probe = """
+import sys, time
+start = time.perf_counter()
+from mcmapper.colors import get_color_table
+get_color_table()
+print("colors", (time.perf_counter() - start)*1e6)
+print("gui", " ".join(m for m in sys.modules if m.split(".")[0] in %r))
+""" % (gui_modules,)
+
+
+def measure(name, code):
+    """Return the total import time, {imported module: (self, cumulative) microseconds}, the color table load time and the GUI modules imported"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "%s\n%s" % (code, probe)],
+        cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
+    if result.returncode:
+        raise Exception("Importing %s failed:\n%s" % (name, result.stderr))
+    total, times = 0, {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, module = line[len("import time:"):].split("|")
+        times[module.strip()] = (int(own), int(cumulative))
+        # Nested imports are indented, and already counted in their parent's time
+        if not module[1:].startswith(" "):
+            total += int(cumulative)
+    output = dict(line.split(" ", 1) for line in result.stdout.splitlines() if " " in line)
+    return total, times, float(output["colors"]), output.get("gui", "").split()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5,
+        help="How many times to import each module, the fastest is reported")
+    parser.add_argument("--max-ms", type=float,
+        help="Fail if importing a module takes longer than this")
+    parser.add_argument("--top", type=int, default=10,
+        help="How many of the slowest imports to list")
+    args = parser.parse_args()
+
+    failed = False
+    for module, code in entry_points.items():
+        runs = [measure(module, code) for _ in range(args.repeat)]
+        total, times, colors, gui = min(runs, key=lambda run: run[0])
+        total /= 1000
+        print(f"{module}: {total:.1f} ms to import, {colors/1000:.1f} ms to load the color table")
+        slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+        for name, (own, cumulative) in slowest:
+            print(f"  {own/1000:7.1f} ms  {name}")
+        if gui:
+            print(f"  {module} imports GUI modules: {', '.join(sorted(gui))}")
+            failed = True
+        if args.max_ms is not None and total > args.max_ms:
+            print(f"  {module} took longer than {args.max_ms} ms")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Check the vectorized chunk renderer against the pure-Python reference
+
+Renders chunks with both render_chunk and render_chunk_reference and
+compares the images.  The chunks are generated, with random heights,
+palettes (including unknown blocks) and index widths, or read from a
+world's regions when one is given.  Exits with an error if any chunk
+differs.
+"""
+
+import argparse
+import numpy as np
+import sys
+
+from mcmapper.level import LevelInfo
+from mcmapper.mapper import chunk_tags, render_chunk, render_chunk_reference, get_layer
+from mcmapper.colors import get_color_table
+
+
+def pack_longs(values, bits):
+    """Pack values into a 1.16+ long array of `bits` bits each, the reverse of mapper.unpack_longs"""
+    per_long = 64 // bits
+    values = np.asarray(values, dtype=np.uint64)
+    values = np.concatenate([values, np.zeros(-len(values) % per_long, dtype=np.uint64)])
+    shifts = np.arange(0, per_long*bits, bits, dtype=np.uint64)
+    longs = np.bitwise_or.reduce(values.reshape(-1, per_long) << shifts, axis=1)
+    return longs.view(np.int64)
+
+
+def generate_chunk(rng, names, y_pos=-4, section_count=24):
+    """Return a random chunk, as parsed with mapper.chunk_tags
+
+    The heights are kept below 256, which is as high as the reference can
+    draw heightmaps, and above section -1, which both renderers skip.
+    """
+    heights = rng.integers(64, 256, 256)
+    sections = []
+    for y in range(y_pos, y_pos + section_count):
+        palette = [{"Name": "minecraft:" + name}
+            for name in rng.choice(names, rng.choice([1, 2, 5, 17, 40]))]
+        block_states = {"palette": palette}
+        if len(palette) > 1:
+            bits = max(4, (len(palette)-1).bit_length())
+            block_states["data"] = pack_longs(rng.integers(0, len(palette), 4096), bits)
+        sections.append({"Y": y, "block_states": block_states})
+    return {
+        "Status": "minecraft:full",
+        "yPos": y_pos,
+        # Plus one, since the heightmap has the air block above the surface
+        "Heightmaps": {"WORLD_SURFACE": pack_longs(heights + 1, 9)},
+        "sections": sections,
+    }
+
+
+def iter_world_chunks(world, dimension):
+    for filename in world.get_regions(dimension):
+        x, z = filename.split(".")[-3:-1]
+        with world.get_region(dimension, int(x), int(z)) as region:
+            for cx, cz in region.get_chunks():
+                yield "%s chunk %s,%s" % (filename, cx, cz), region.get_chunk(cx, cz, chunk_tags)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("world", nargs="?",
+        help="Check the chunks of a world instead of generated ones")
+    parser.add_argument("--dimension", default="overworld",
+        choices=("overworld", "nether", "end"),
+        help="Which dimension of the world to check")
+    parser.add_argument("--count", type=int, default=200,
+        help="How many chunks to generate")
+    parser.add_argument("--seed", type=int, default=0,
+        help="The seed of the generated chunks")
+    args = parser.parse_args()
+
+    if args.world:
+        layer = get_layer(args.dimension)
+        chunks = iter_world_chunks(LevelInfo(args.world), args.dimension)
+        # Real heights go past what the reference can draw as a heightmap
+        modes = (False,)
+    else:
+        layer = "WORLD_SURFACE"
+        modes = (False, True)
+        rng = np.random.default_rng(args.seed)
+        names = sorted(get_color_table().ids) + ["unknown_block_%d" % i for i in range(5)]
+        chunks = (("generated chunk %d" % i, generate_chunk(rng, names)) for i in range(args.count))
+
+    checked, failed = 0, 0
+    for name, chunk in chunks:
+        for heightmap in modes:
+            expected = np.asarray(render_chunk_reference(chunk, layer, heightmap))
+            actual = np.asarray(render_chunk(chunk, layer, heightmap))
+            if not np.array_equal(expected, actual):
+                print("%s differs%s in %d pixels" % (name, " (heightmap)" if heightmap else "",
+                    np.count_nonzero((expected != actual).any(axis=2))))
+                failed += 1
+        checked += 1
+    print("Checked %d chunks, %d differed" % (checked, failed))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
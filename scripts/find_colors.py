@@ -1,79 +1,178 @@
-#!/usr/bin/env python3
-
-import collections
-import json
-import os
-import zipfile
-
-from PIL import Image
-
-
-def get_texture(jar, data):
-    model = None
-    if "variants" in data:
-        key = sorted(data["variants"])[-1]
-        model = data["variants"][key]
-    elif "multipart" in data:
-        applier = data["multipart"][0]["apply"]
-        if type(applier) is dict:
-            model = applier["model"]
-        elif type(applier) is list:
-            model = applier[0]["model"]
-
-    if type(model) is list:
-        model = model[0]["model"]
-    elif type(model) is dict:
-        model = model["model"]
-
-    model = model.replace("minecraft:", "")
-    model = f"assets/minecraft/models/{model}.json"
-    data = json.loads(jar.read(model).decode("utf-8"))
-
-    key = "top"
-    if key not in data["textures"]:
-        key = sorted(data["textures"])[-1]
-    texture_file = data["textures"][key].replace("minecraft:", "")
-    texture_file = f"assets/minecraft/textures/{texture_file}.png"
-
-    with jar.open(texture_file) as image_data:
-        texture = Image.open(image_data)
-        texture.load()
-
-    if texture.mode == "P":
-        texture = texture.convert("RGBA")
-    result = collections.Counter(pixel for pixel in texture.getdata()
-        if not (len(pixel) == 4 and pixel[-1] == 0))
-
-    return ", ".join(map(str, result.most_common(1)[0][0][:3]))
-
-
-def main():
-    version_dir = os.path.join(os.environ["APPDATA"], ".minecraft", "versions")
-    versions = []
-    for dirname in os.listdir(version_dir):
-        try:
-            versions.append((tuple(map(int, dirname.split("."))), dirname))
-        except ValueError:
-            pass
-    latest = sorted(versions)[-1][-1]
-    print(latest)
-
-    with zipfile.ZipFile(os.path.join(version_dir, latest, f"{latest}.jar")) as jar:
-        errors = {}
-        filenames = jar.namelist()
-        blockstates = [f for f in filenames if f.startswith("assets/minecraft/blockstates/")]
-        for blockstate in blockstates:
-            basename = blockstate.split("/")[-1].split(".")[0]
-            try:
-                info = json.loads(jar.read(blockstate).decode("utf-8"))
-                print(f'"{basename}": bytes(({get_texture(jar, info)})),')
-            except Exception as e:
-                errors[basename] = f"{type(e)}: {e}"
-
-    if len(errors):
-        for blockstate, error in errors.items():
-            print(blockstate, ":", error)
-
-
-if __name__ == '__main__':
-    main()
+#!/usr/bin/env python3
+"""Generate the block color table from the textures in a Minecraft client jar
+
+Each block is colored with the most common opaque color of the texture on
+top of its model.  The colors are cached by the jar's hash, so generating
+the table again for the same game version takes no time.  The table is
+saved where the renderer loads it, with the overrides from data.py (for
+biome-tinted blocks) applied.
+"""
+
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import numpy as np
+import os
+import zipfile
+
+import mcmapper.filesystem as fs
+
+from mcmapper.colors import default_filename, save_color_table
+from PIL import Image
+
+
+# Bumped whenever the colors would come out differently, so that cached
+# colors from older versions of this script aren't reused
+GENERATOR_VERSION = 2
+BLOCKSTATES = "assets/minecraft/blockstates/"
+
+
+def get_texture_name(jar, data):
+    """Return the path in the jar of the texture on top of a blockstate's model"""
+    model = None
+    if "variants" in data:
+        key = sorted(data["variants"])[-1]
+        model = data["variants"][key]
+    elif "multipart" in data:
+        applier = data["multipart"][0]["apply"]
+        if type(applier) is dict:
+            model = applier["model"]
+        elif type(applier) is list:
+            model = applier[0]["model"]
+
+    if type(model) is list:
+        model = model[0]["model"]
+    elif type(model) is dict:
+        model = model["model"]
+
+    model = model.replace("minecraft:", "")
+    model = f"assets/minecraft/models/{model}.json"
+    data = json.loads(jar.read(model).decode("utf-8"))
+
+    key = "top"
+    if key not in data["textures"]:
+        key = sorted(data["textures"])[-1]
+    texture_file = data["textures"][key].replace("minecraft:", "")
+    return f"assets/minecraft/textures/{texture_file}.png"
+
+
+def get_dominant_color(texture):
+    """Return the most common (r, g, b) of the opaque pixels of an image
+
+    Ties go to the color that comes first in the image.
+    """
+    pixels = np.asarray(texture.convert("RGBA"), dtype=np.uint32).reshape(-1, 4)
+    pixels = pixels[pixels[:, 3] != 0]
+    packed = (pixels[:, 0] << 16) | (pixels[:, 1] << 8) | pixels[:, 2]
+    values, first, counts = np.unique(packed, return_index=True, return_counts=True)
+    best = np.flatnonzero(counts == counts.max())
+    value = int(values[best[np.argmin(first[best])]])
+    return (value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff
+
+
+# Each process opens the jar once
+worker_jar = None
+def init_worker(jar_filename):
+    global worker_jar
+    worker_jar = zipfile.ZipFile(jar_filename)
+
+
+def get_block_colors(names):
+    """Return {block: (r, g, b)} and {block: error} for some of the jar's blockstates"""
+    colors, errors = {}, {}
+    for name in names:
+        try:
+            data = json.loads(worker_jar.read(f"{BLOCKSTATES}{name}.json").decode("utf-8"))
+            with worker_jar.open(get_texture_name(worker_jar, data)) as image_data:
+                colors[name] = get_dominant_color(Image.open(image_data))
+        except Exception as e:
+            errors[name] = f"{type(e)}: {e}"
+    return colors, errors
+
+
+def find_colors(jar_filename, jobs=None):
+    """Return {block: (r, g, b)} and {block: error} for every blockstate in a jar"""
+    with zipfile.ZipFile(jar_filename) as jar:
+        names = sorted(f[len(BLOCKSTATES):-len(".json")] for f in jar.namelist()
+            if f.startswith(BLOCKSTATES) and f.endswith(".json"))
+    jobs = jobs or os.cpu_count() or 1
+    batches = [names[i::jobs*4] for i in range(jobs*4)]
+    colors, errors = {}, {}
+    with concurrent.futures.ProcessPoolExecutor(jobs, initializer=init_worker,
+            initargs=(jar_filename,)) as executor:
+        for batch_colors, batch_errors in executor.map(get_block_colors, batches):
+            colors.update(batch_colors)
+            errors.update(batch_errors)
+    return colors, errors
+
+
+def get_file_hash(filename):
+    sha1 = hashlib.sha1()
+    with open(filename, "rb") as f:
+        for block in iter(lambda: f.read(1024*1024), b""):
+            sha1.update(block)
+    return sha1.hexdigest()
+
+
+def get_latest_jar():
+    """Return the client jar of the newest release in the launcher's versions folder"""
+    version_dir = os.path.join(os.path.dirname(fs.get_minecraft_basedir()), "versions")
+    versions = []
+    for dirname in os.listdir(version_dir):
+        try:
+            versions.append((tuple(map(int, dirname.split("."))), dirname))
+        except ValueError:
+            pass
+    if not versions:
+        raise Exception(f"No release versions in {version_dir}")
+    latest = sorted(versions)[-1][-1]
+    return os.path.join(version_dir, latest, f"{latest}.jar")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("jar", nargs="?",
+        help="The client jar, such as ~/.minecraft/versions/1.20.1/1.20.1.jar (default: the newest release)")
+    parser.add_argument("--output", default=default_filename,
+        help="Where to save the color table (default: the one the renderer loads)")
+    parser.add_argument("--jobs", type=int,
+        help="The number of processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true",
+        help="Read the textures even if the jar's colors are cached")
+    parser.add_argument("--python", action="store_true",
+        help="Also print the colors as Python source for data.py")
+    args = parser.parse_args()
+
+    jar_filename = args.jar or get_latest_jar()
+    version = os.path.splitext(os.path.basename(jar_filename))[0]
+    print(f"Reading {jar_filename}...")
+    cache_dir = os.path.join(fs.get_data_root(), "colors")
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_filename = os.path.join(cache_dir, "%s-%s.json" % (get_file_hash(jar_filename), GENERATOR_VERSION))
+    if os.path.isfile(cache_filename) and not args.force:
+        with open(cache_filename) as f:
+            cached = json.load(f)
+        colors, errors = {name: tuple(color) for name, color in cached["colors"].items()}, cached["errors"]
+        print(f"Using the colors cached in {cache_filename}")
+    else:
+        colors, errors = find_colors(jar_filename, args.jobs)
+        with open(cache_filename, "w") as f:
+            json.dump({"version": version, "colors": colors, "errors": errors}, f)
+
+    if len(errors):
+        for blockstate, error in sorted(errors.items()):
+            print(blockstate, ":", error)
+    if args.python:
+        for name, color in sorted(colors.items()):
+            print(f'    "{name}": bytes(({", ".join(map(str, color))})),')
+
+    # Only imported now, since it's slow to import
+    from mcmapper.data import color_overrides, map_colors
+    colors.update(color_overrides)
+    save_color_table(args.output, colors, map_colors, version)
+    print(f"Saved {len(colors)} block colors from {version} to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,28 +1,48 @@
-#!/usr/bin/env python3
-
-import argparse
-import glob
-import os
-
-from mapper import render_map
-
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument("filename", help="The map file or folder")
-    args = parser.parse_args()
-
-    if os.path.isfile(args.filename):
-        filenames = [args.filename]
-    elif os.path.isdir(args.filename):
-        pattern = os.path.join(args.filename, "map_*.dat")
-        filenames = glob.glob(pattern)
-
-    outputfilename = os.path.join("maps", "%s.png")
-    for filename in filenames:
-        rendered_map = render_map(filename, True)
-        this_outputfilename = outputfilename % os.path.basename(filename)
-        print("Saving to %s..." % this_outputfilename)
-        rendered_map.save(this_outputfilename)
-
-if __name__ == '__main__':
-    main()
+#!/usr/bin/env python3
+
+import argparse
+import os
+
+from mcmapper.mapper import render_map
+from mcmapper.maps import get_map_filenames, render_maps, save_map_atlas
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename", help="The map file or folder (such as the world's data folder)")
+    parser.add_argument("--output", default="maps",
+        help="The folder to save the images in")
+    parser.add_argument("--jobs", type=int,
+        help="The number of processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true",
+        help="Redraw every map, not only those that changed since the last run")
+    parser.add_argument("--atlas", action="store_true",
+        help="Also stitch the maps of each dimension into one image")
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    if os.path.isfile(args.filename):
+        rendered_map = render_map(args.filename, True)
+        outputfilename = os.path.join(args.output, "%s.png" % os.path.basename(args.filename))
+        print("Saving to %s..." % outputfilename)
+        rendered_map.save(outputfilename)
+        return
+    elif not os.path.isdir(args.filename):
+        parser.error("%s is not a file or folder" % args.filename)
+
+    filenames = get_map_filenames(args.filename)
+    maps = render_maps(filenames, args.output, args.jobs, args.force)
+    rendered = sum(1 for info in maps.values() if info["rendered"])
+    print("Rendered %s of %s maps to %s" % (rendered, len(filenames), args.output))
+
+    if args.atlas:
+        dimensions = {}
+        for filename, info in maps.items():
+            dimensions.setdefault(info["dimension"], {})[filename] = info
+        for dimension, dimension_maps in sorted(dimensions.items()):
+            outputfilename = os.path.join(args.output, "atlas_%s.png" % dimension.replace(":", "_"))
+            x, z, unit = save_map_atlas(dimension_maps, args.output, outputfilename)
+            print("Saved %s %s maps to %s (top left at %s,%s, %s blocks per pixel)" % (
+                len(dimension_maps), dimension, outputfilename, x, z, unit))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""The block and map color tables, loaded from colors.npz when first needed
+
+colors.npz is generated from the game's textures by find_colors.py, or is a
+compact copy of the tables in data.py (which is slow to import, since it
+builds a bytes object per color) made with `python -m mcmapper.colors`.
+"""
+
+import hashlib
+import numpy as np
+import os
+
+
+# Bumped whenever the layout of the file changes
+COLOR_TABLE_VERSION = 1
+default_filename = os.path.join(os.path.dirname(__file__), "colors.npz")
+
+
+class ColorTable(object):
+    """The color of each block and the palettes of map items
+
+    Blocks are identified by their index into `table`, a (n, 3) uint8 array.
+    Index 0 is black (nothing to draw) and index 1 is magenta (unknown
+    block), and `ids` maps the other block names (without "minecraft:") to
+    their indexes.
+    """
+    def __init__(self, names, colors, map_versions, map_palettes, map_known):
+        self.names = [str(name) for name in names]
+        self.ids = {name: idx for idx, name in enumerate(self.names, 2)}
+        black = np.zeros(3, dtype=np.uint8)
+        magenta = colors[self.names.index("magenta_concrete")]
+        self.table = np.concatenate([[black, magenta], colors]).astype(np.uint8)
+        # Stored tiles drawn with a different table are redrawn
+        self.hash = hashlib.sha1(repr(sorted(self.ids.items())).encode("utf-8") +
+            self.table.tobytes()).hexdigest()
+        self.map_versions = [int(version) for version in map_versions]
+        self.map_palettes = map_palettes
+        self.map_known = map_known
+
+    def get_color(self, name):
+        """Return the (r, g, b) color of a block, or magenta if it's unknown"""
+        return tuple(int(c) for c in self.table[self.ids.get(name.replace("minecraft:", ""), 1)])
+
+    def get_map_palette(self, data_version):
+        """Return the (256, 3) colors of a map item's color indexes and a mask of the known indexes
+
+        The palette is the newest one that isn't newer than the map, or the
+        oldest one for maps older than all of them.
+        """
+        # The versions are sorted
+        idx = 0
+        for i, version in enumerate(self.map_versions):
+            if version <= data_version:
+                idx = i
+        return self.map_palettes[idx], self.map_known[idx]
+
+
+def load_color_table(filename=default_filename):
+    with np.load(filename) as data:
+        if int(data["version"]) != COLOR_TABLE_VERSION:
+            raise Exception("%s has version %s of the color table, expected %s" % (
+                filename, int(data["version"]), COLOR_TABLE_VERSION))
+        return ColorTable(data["block_names"], data["block_colors"], data["map_versions"],
+            data["map_palettes"], data["map_known"])
+
+
+def save_color_table(filename, block_colors, map_colors, source=""):
+    """Save {block name: (r, g, b)} and {data version: {index: (r, g, b)}} as a color table file
+
+    `source` says where the colors came from, such as the game version.
+    """
+    names = sorted(block_colors)
+    versions = sorted(map_colors)
+    palettes = np.zeros((len(versions), 256, 3), dtype=np.uint8)
+    known = np.zeros((len(versions), 256), dtype=bool)
+    for i, version in enumerate(versions):
+        for idx, color in map_colors[version].items():
+            palettes[i, idx] = tuple(color)
+            known[i, idx] = True
+    np.savez_compressed(filename,
+        version=np.array(COLOR_TABLE_VERSION),
+        source=np.array(source),
+        block_names=np.array(names),
+        block_colors=np.array([tuple(block_colors[name]) for name in names], dtype=np.uint8).reshape(-1, 3),
+        map_versions=np.array(versions, dtype=np.int64),
+        map_palettes=palettes,
+        map_known=known)
+
+
+color_table = None
+def get_color_table():
+    """Return the ColorTable, loading it on first use"""
+    global color_table
+    if color_table is None:
+        color_table = load_color_table()
+    return color_table
+
+
+if __name__ == '__main__':
+    from mcmapper.data import block_colors, map_colors
+    save_color_table(default_filename, block_colors, map_colors, "data.py")
+    print("Saved %s blocks and %s map palettes to %s" % (len(block_colors), len(map_colors), default_filename))
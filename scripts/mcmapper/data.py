@@ -1,1140 +1,1142 @@
-__all__ = ["map_colors", "block_colors"]
-
-map_colors = {}
-
-map_colors[0] = {
-    0:      bytes((0, 0, 0)),
-    1:      bytes((0, 0, 0)),
-    2:      bytes((0, 0, 0)),
-    3:      bytes((0, 0, 0)),
-    4:      bytes((89, 125, 39)),
-    5:      bytes((109, 153, 48)),
-    6:      bytes((127, 178, 56)),
-    7:      bytes((67, 94, 29)),
-    8:      bytes((174, 164, 115)),
-    9:      bytes((213, 201, 140)),
-    10:     bytes((247, 233, 163)),
-    11:     bytes((130, 123, 86)),
-    12:     bytes((140, 140, 140)),
-    13:     bytes((171, 171, 171)),
-    14:     bytes((199, 199, 199)),
-    15:     bytes((105, 105, 105)),
-    16:     bytes((180, 0, 0)),
-    17:     bytes((220, 0, 0)),
-    18:     bytes((255, 0, 0)),
-    19:     bytes((135, 0, 0)),
-    20:     bytes((112, 112, 180)),
-    21:     bytes((138, 138, 220)),
-    22:     bytes((160, 160, 255)),
-    23:     bytes((84, 84, 135)),
-    24:     bytes((117, 117, 117)),
-    25:     bytes((144, 144, 144)),
-    26:     bytes((167, 167, 167)),
-    27:     bytes((88, 88, 88)),
-    28:     bytes((0, 87, 0)),
-    29:     bytes((0, 106, 0)),
-    30:     bytes((0, 124, 0)),
-    31:     bytes((0, 65, 0)),
-    32:     bytes((180, 180, 180)),
-    33:     bytes((220, 220, 220)),
-    34:     bytes((255, 255, 255)),
-    35:     bytes((135, 135, 135)),
-    36:     bytes((115, 118, 129)),
-    37:     bytes((141, 144, 158)),
-    38:     bytes((164, 168, 184)),
-    39:     bytes((86, 88, 97)),
-    40:     bytes((106, 76, 54)),
-    41:     bytes((130, 94, 66)),
-    42:     bytes((151, 109, 77)),
-    43:     bytes((79, 57, 40)),
-    44:     bytes((79, 79, 79)),
-    45:     bytes((96, 96, 96)),
-    46:     bytes((112, 112, 112)),
-    47:     bytes((59, 59, 59)),
-    48:     bytes((45, 45, 180)),
-    49:     bytes((55, 55, 220)),
-    50:     bytes((64, 64, 255)),
-    51:     bytes((33, 33, 135)),
-    52:     bytes((100, 84, 50)),
-    53:     bytes((123, 102, 62)),
-    54:     bytes((143, 119, 72)),
-    55:     bytes((75, 63, 38)),
-    56:     bytes((180, 177, 172)),
-    57:     bytes((220, 217, 211)),
-    58:     bytes((255, 252, 245)),
-    59:     bytes((135, 133, 129)),
-    60:     bytes((152, 89, 36)),
-    61:     bytes((186, 109, 44)),
-    62:     bytes((216, 127, 51)),
-    63:     bytes((114, 67, 27)),
-    64:     bytes((125, 53, 152)),
-    65:     bytes((153, 65, 186)),
-    66:     bytes((178, 76, 216)),
-    67:     bytes((94, 40, 114)),
-    68:     bytes((72, 108, 152)),
-    69:     bytes((88, 132, 186)),
-    70:     bytes((102, 153, 216)),
-    71:     bytes((54, 81, 114)),
-    72:     bytes((161, 161, 36)),
-    73:     bytes((197, 197, 44)),
-    74:     bytes((229, 229, 51)),
-    75:     bytes((121, 121, 27)),
-    76:     bytes((89, 144, 17)),
-    77:     bytes((109, 176, 21)),
-    78:     bytes((127, 204, 25)),
-    79:     bytes((67, 108, 13)),
-    80:     bytes((170, 89, 116)),
-    81:     bytes((208, 109, 142)),
-    82:     bytes((242, 127, 165)),
-    83:     bytes((128, 67, 87)),
-    84:     bytes((53, 53, 53)),
-    85:     bytes((65, 65, 65)),
-    86:     bytes((76, 76, 76)),
-    87:     bytes((40, 40, 40)),
-    88:     bytes((108, 108, 108)),
-    89:     bytes((132, 132, 132)),
-    90:     bytes((153, 153, 153)),
-    91:     bytes((81, 81, 81)),
-    92:     bytes((53, 89, 108)),
-    93:     bytes((65, 109, 132)),
-    94:     bytes((76, 127, 153)),
-    95:     bytes((40, 67, 81)),
-    96:     bytes((89, 44, 125)),
-    97:     bytes((109, 54, 153)),
-    98:     bytes((127, 63, 178)),
-    99:     bytes((67, 33, 94)),
-    100:    bytes((36, 53, 125)),
-    101:    bytes((44, 65, 153)),
-    102:    bytes((51, 76, 178)),
-    103:    bytes((27, 40, 94)),
-    104:    bytes((72, 53, 36)),
-    105:    bytes((88, 65, 44)),
-    106:    bytes((102, 76, 51)),
-    107:    bytes((54, 40, 27)),
-    108:    bytes((72, 89, 36)),
-    109:    bytes((88, 109, 44)),
-    110:    bytes((102, 127, 51)),
-    111:    bytes((54, 67, 27)),
-    112:    bytes((108, 36, 36)),
-    113:    bytes((132, 44, 44)),
-    114:    bytes((153, 51, 51)),
-    115:    bytes((81, 27, 27)),
-    116:    bytes((17, 17, 17)),
-    117:    bytes((21, 21, 21)),
-    118:    bytes((25, 25, 25)),
-    119:    bytes((13, 13, 13)),
-    120:    bytes((176, 168, 54)),
-    121:    bytes((215, 205, 66)),
-    122:    bytes((250, 238, 77)),
-    123:    bytes((132, 126, 40)),
-    124:    bytes((64, 154, 150)),
-    125:    bytes((79, 188, 183)),
-    126:    bytes((92, 219, 213)),
-    127:    bytes((48, 115, 112)),
-    128:    bytes((52, 90, 180)),
-    129:    bytes((63, 110, 220)),
-    130:    bytes((74, 128, 255)),
-    131:    bytes((39, 67, 135)),
-    132:    bytes((0, 153, 40)),
-    133:    bytes((0, 187, 50)),
-    134:    bytes((0, 217, 58)),
-    135:    bytes((0, 114, 30)),
-    136:    bytes((91, 60, 34)),
-    137:    bytes((111, 74, 42)),
-    138:    bytes((129, 86, 49)),
-    139:    bytes((68, 45, 25)),
-    140:    bytes((79, 1, 0)),
-    141:    bytes((96, 1, 0)),
-    142:    bytes((112, 2, 0)),
-    143:    bytes((59, 1, 0)),
-    144:    bytes((147, 124, 113)),
-    145:    bytes((180, 152, 138)),
-    146:    bytes((209, 177, 161)),
-    147:    bytes((110, 93, 85)),
-    148:    bytes((112, 57, 25)),
-    149:    bytes((137, 70, 31)),
-    150:    bytes((159, 82, 36)),
-    151:    bytes((84, 43, 19)),
-    152:    bytes((105, 61, 76)),
-    153:    bytes((128, 75, 93)),
-    154:    bytes((149, 87, 108)),
-    155:    bytes((78, 46, 57)),
-    156:    bytes((79, 76, 97)),
-    157:    bytes((96, 93, 119)),
-    158:    bytes((112, 108, 138)),
-    159:    bytes((59, 57, 73)),
-    160:    bytes((131, 93, 25)),
-    161:    bytes((160, 114, 31)),
-    162:    bytes((186, 133, 36)),
-    163:    bytes((98, 70, 19)),
-    164:    bytes((72, 82, 37)),
-    165:    bytes((88, 100, 45)),
-    166:    bytes((103, 117, 53)),
-    167:    bytes((54, 61, 28)),
-    168:    bytes((112, 54, 55)),
-    169:    bytes((138, 66, 67)),
-    170:    bytes((160, 77, 78)),
-    171:    bytes((84, 40, 41)),
-    172:    bytes((40, 28, 24)),
-    173:    bytes((49, 35, 30)),
-    174:    bytes((57, 41, 35)),
-    175:    bytes((30, 21, 18)),
-    176:    bytes((95, 75, 69)),
-    177:    bytes((116, 92, 84)),
-    178:    bytes((135, 107, 98)),
-    179:    bytes((71, 56, 51)),
-    180:    bytes((61, 64, 64)),
-    181:    bytes((75, 79, 79)),
-    182:    bytes((87, 92, 92)),
-    183:    bytes((46, 48, 48)),
-    184:    bytes((86, 51, 62)),
-    185:    bytes((105, 62, 75)),
-    186:    bytes((122, 73, 88)),
-    187:    bytes((64, 38, 46)),
-    188:    bytes((53, 43, 64)),
-    189:    bytes((65, 53, 79)),
-    190:    bytes((76, 62, 92)),
-    191:    bytes((40, 32, 48)),
-    192:    bytes((53, 35, 24)),
-    193:    bytes((65, 43, 30)),
-    194:    bytes((76, 50, 35)),
-    195:    bytes((40, 26, 18)),
-    196:    bytes((53, 57, 29)),
-    197:    bytes((65, 70, 36)),
-    198:    bytes((76, 82, 42)),
-    199:    bytes((40, 43, 22)),
-    200:    bytes((100, 42, 32)),
-    201:    bytes((122, 51, 39)),
-    202:    bytes((142, 60, 46)),
-    203:    bytes((75, 31, 24)),
-    204:    bytes((26, 15, 11)),
-    205:    bytes((31, 18, 13)),
-    206:    bytes((37, 22, 16)),
-    207:    bytes((19, 11, 8)),
-}
-
-block_colors = {
-
-    "acacia_button": bytes((186, 99, 55)),
-    "acacia_door": bytes((203, 119, 79)),
-    "acacia_fence": bytes((186, 99, 55)),
-    "acacia_fence_gate": bytes((186, 99, 55)),
-    "acacia_leaves": bytes((158, 158, 158)),
-    "acacia_log": bytes((105, 98, 89)),
-    "acacia_planks": bytes((186, 99, 55)),
-    "acacia_pressure_plate": bytes((186, 99, 55)),
-    "acacia_sapling": bytes((124, 94, 18)),
-    "acacia_sign": bytes((186, 99, 55)),
-    "acacia_slab": bytes((186, 99, 55)),
-    "acacia_stairs": bytes((186, 99, 55)),
-    "acacia_trapdoor": bytes((136, 71, 40)),
-    "acacia_wall_sign": bytes((186, 99, 55)),
-    "acacia_wood": bytes((105, 98, 89)),
-    "activator_rail": bytes((156, 156, 156)),
-    "allium": bytes((210, 166, 246)),
-    "amethyst_block": bytes((122, 91, 181)),
-    "amethyst_cluster": bytes((207, 160, 243)),
-    "ancient_debris": bytes((93, 52, 44)),
-    "andesite": bytes((138, 138, 142)),
-    "andesite_slab": bytes((138, 138, 142)),
-    "andesite_stairs": bytes((138, 138, 142)),
-    "andesite_wall": bytes((138, 138, 142)),
-    "anvil": bytes((82, 82, 82)),
-    "attached_melon_stem": bytes((139, 141, 139)),
-    "attached_pumpkin_stem": bytes((140, 140, 140)),
-    "azalea": bytes((100, 114, 51)),
-    "azalea_leaves": bytes((80, 105, 44)),
-    "azure_bluet": bytes((85, 171, 45)),
-    "bamboo": bytes((89, 144, 3)),
-    "bamboo_sapling": bytes((101, 92, 30)),
-    "barrel": bytes((47, 31, 9)),
-    "barrier": bytes((227, 0, 0)),
-    "basalt": bytes((79, 75, 79)),
-    "beacon": bytes((208, 234, 233)),
-    "bedrock": bytes((51, 51, 51)),
-    "bee_nest": bytes((251, 220, 117)),
-    "beehive": bytes((184, 148, 95)),
-    "beetroots": bytes((116, 35, 3)),
-    "bell": bytes((123, 94, 13)),
-    "big_dripleaf": bytes((132, 168, 60)),
-    "big_dripleaf_stem": bytes((108, 128, 49)),
-    "birch_button": bytes((215, 193, 133)),
-    "birch_door": bytes((246, 242, 222)),
-    "birch_fence": bytes((215, 193, 133)),
-    "birch_fence_gate": bytes((215, 193, 133)),
-    "birch_leaves": bytes((112, 109, 112)),
-    "birch_log": bytes((255, 255, 255)),
-    "birch_planks": bytes((215, 193, 133)),
-    "birch_pressure_plate": bytes((215, 193, 133)),
-    "birch_sapling": bytes((108, 158, 56)),
-    "birch_sign": bytes((215, 193, 133)),
-    "birch_slab": bytes((215, 193, 133)),
-    "birch_stairs": bytes((215, 193, 133)),
-    "birch_trapdoor": bytes((158, 139, 97)),
-    "birch_wall_sign": bytes((215, 193, 133)),
-    "birch_wood": bytes((255, 255, 255)),
-    "black_banner": bytes((184, 148, 95)),
-    "black_bed": bytes((184, 148, 95)),
-    "black_candle": bytes((26, 24, 39)),
-    "black_candle_cake": bytes((255, 253, 254)),
-    "black_carpet": bytes((28, 28, 32)),
-    "black_concrete": bytes((9, 11, 16)),
-    "black_concrete_powder": bytes((28, 30, 34)),
-    "black_glazed_terracotta": bytes((142, 32, 32)),
-    "black_shulker_box": bytes((31, 31, 35)),
-    "black_stained_glass": bytes((25, 25, 25)),
-    "black_stained_glass_pane": bytes((25, 25, 25)),
-    "black_terracotta": bytes((37, 22, 16)),
-    "black_wall_banner": bytes((184, 148, 95)),
-    "black_wool": bytes((28, 28, 32)),
-    "blackstone": bytes((39, 34, 28)),
-    "blackstone_slab": bytes((49, 44, 54)),
-    "blackstone_stairs": bytes((49, 44, 54)),
-    "blackstone_wall": bytes((39, 34, 28)),
-    "blast_furnace": bytes((73, 72, 72)),
-    "blue_banner": bytes((184, 148, 95)),
-    "blue_bed": bytes((184, 148, 95)),
-    "blue_candle": bytes((53, 71, 154)),
-    "blue_candle_cake": bytes((255, 253, 254)),
-    "blue_carpet": bytes((62, 77, 178)),
-    "blue_concrete": bytes((44, 46, 143)),
-    "blue_concrete_powder": bytes((69, 72, 165)),
-    "blue_glazed_terracotta": bytes((44, 46, 143)),
-    "blue_ice": bytes((108, 163, 253)),
-    "blue_orchid": bytes((39, 169, 244)),
-    "blue_shulker_box": bytes((51, 53, 155)),
-    "blue_stained_glass": bytes((51, 76, 178)),
-    "blue_stained_glass_pane": bytes((51, 76, 178)),
-    "blue_terracotta": bytes((74, 59, 91)),
-    "blue_wall_banner": bytes((184, 148, 95)),
-    "blue_wool": bytes((62, 77, 178)),
-    "bone_block": bytes((233, 230, 212)),
-    "bookshelf": bytes((179, 140, 81)),
-    "brain_coral": bytes((157, 47, 119)),
-    "brain_coral_block": bytes((191, 70, 146)),
-    "brain_coral_fan": bytes((191, 70, 146)),
-    "brain_coral_wall_fan": bytes((191, 70, 146)),
-    "brewing_stand": bytes((49, 49, 49)),
-    "brick_slab": bytes((155, 86, 67)),
-    "brick_stairs": bytes((155, 86, 67)),
-    "brick_wall": bytes((155, 86, 67)),
-    "bricks": bytes((155, 86, 67)),
-    "brown_banner": bytes((184, 148, 95)),
-    "brown_bed": bytes((184, 148, 95)),
-    "brown_candle": bytes((100, 61, 33)),
-    "brown_candle_cake": bytes((255, 253, 254)),
-    "brown_carpet": bytes((126, 80, 47)),
-    "brown_concrete": bytes((97, 60, 32)),
-    "brown_concrete_powder": bytes((124, 82, 52)),
-    "brown_glazed_terracotta": bytes((131, 84, 50)),
-    "brown_mushroom": bytes((204, 153, 120)),
-    "brown_mushroom_block": bytes((151, 114, 81)),
-    "brown_shulker_box": bytes((115, 72, 40)),
-    "brown_stained_glass": bytes((102, 76, 51)),
-    "brown_stained_glass_pane": bytes((102, 76, 51)),
-    "brown_terracotta": bytes((77, 52, 36)),
-    "brown_wall_banner": bytes((184, 148, 95)),
-    "brown_wool": bytes((126, 80, 47)),
-    "bubble_column": bytes((165, 165, 165)),
-    "bubble_coral": bytes((165, 29, 165)),
-    "bubble_coral_block": bytes((165, 29, 165)),
-    "bubble_coral_fan": bytes((165, 29, 165)),
-    "bubble_coral_wall_fan": bytes((165, 29, 165)),
-    "budding_amethyst": bytes((122, 91, 181)),
-    "cactus": bytes((82, 125, 38)),
-    "cake": bytes((255, 253, 254)),
-    "calcite": bytes((217, 219, 215)),
-    "campfire": bytes((58, 72, 95)),
-    "candle": bytes((230, 185, 140)),
-    "candle_cake": bytes((255, 253, 254)),
-    "carrots": bytes((43, 112, 42)),
-    "cartography_table": bytes((79, 50, 24)),
-    "carved_pumpkin": bytes((196, 111, 20)),
-    "cauldron": bytes((79, 79, 79)),
-    "cave_vines": bytes((112, 146, 45)),
-    "cave_vines_plant": bytes((80, 114, 51)),
-    "chain": bytes((37, 44, 61)),
-    "chain_command_block": bytes((118, 178, 151)),
-    "chest": bytes((184, 148, 95)),
-    "chipped_anvil": bytes((66, 66, 66)),
-    "chiseled_deepslate": bytes((36, 36, 36)),
-    "chiseled_nether_bricks": bytes((48, 24, 28)),
-    "chiseled_polished_blackstone": bytes((78, 75, 84)),
-    "chiseled_quartz_block": bytes((238, 234, 230)),
-    "chiseled_red_sandstone": bytes((159, 78, 11)),
-    "chiseled_sandstone": bytes((218, 210, 163)),
-    "chiseled_stone_bricks": bytes((90, 89, 90)),
-    "chorus_flower": bytes((91, 52, 91)),
-    "chorus_plant": bytes((91, 52, 91)),
-    "clay": bytes((161, 167, 177)),
-    "coal_block": bytes((21, 21, 21)),
-    "coal_ore": bytes((116, 116, 116)),
-    "coarse_dirt": bytes((121, 85, 58)),
-    "cobbled_deepslate": bytes((74, 74, 79)),
-    "cobbled_deepslate_slab": bytes((74, 74, 79)),
-    "cobbled_deepslate_stairs": bytes((74, 74, 79)),
-    "cobbled_deepslate_wall": bytes((74, 74, 79)),
-    "cobblestone": bytes((136, 135, 136)),
-    "cobblestone_slab": bytes((136, 135, 136)),
-    "cobblestone_stairs": bytes((136, 135, 136)),
-    "cobblestone_wall": bytes((136, 135, 136)),
-    "cobweb": bytes((255, 255, 255)),
-    "cocoa": bytes((203, 142, 83)),
-    "command_block": bytes((199, 126, 79)),
-    "comparator": bytes((187, 187, 187)),
-    "composter": bytes((180, 117, 62)),
-    "conduit": bytes((180, 136, 107)),
-    "copper_block": bytes((200, 116, 86)),
-    "copper_ore": bytes((127, 127, 127)),
-    "cornflower": bytes((87, 140, 77)),
-    "cracked_deepslate_bricks": bytes((56, 55, 55)),
-    "cracked_deepslate_tiles": bytes((45, 45, 45)),
-    "cracked_nether_bricks": bytes((25, 13, 16)),
-    "cracked_polished_blackstone_bricks": bytes((49, 44, 54)),
-    "cracked_stone_bricks": bytes((127, 127, 127)),
-    "crafting_table": bytes((175, 143, 85)),
-    "creeper_head": bytes((73, 55, 44)),
-    "creeper_wall_head": bytes((73, 55, 44)),
-    "crimson_button": bytes((126, 58, 86)),
-    "crimson_door": bytes((92, 48, 66)),
-    "crimson_fence": bytes((126, 58, 86)),
-    "crimson_fence_gate": bytes((126, 58, 86)),
-    "crimson_fungus": bytes((82, 24, 16)),
-    "crimson_hyphae": bytes((82, 24, 16)),
-    "crimson_nylium": bytes((123, 0, 0)),
-    "crimson_planks": bytes((126, 58, 86)),
-    "crimson_pressure_plate": bytes((126, 58, 86)),
-    "crimson_roots": bytes((146, 6, 54)),
-    "crimson_sign": bytes((126, 58, 86)),
-    "crimson_slab": bytes((126, 58, 86)),
-    "crimson_stairs": bytes((126, 58, 86)),
-    "crimson_stem": bytes((82, 24, 16)),
-    "crimson_trapdoor": bytes((92, 48, 66)),
-    "crimson_wall_sign": bytes((126, 58, 86)),
-    "crying_obsidian": bytes((6, 3, 11)),
-    "cut_copper": bytes((227, 130, 108)),
-    "cut_copper_slab": bytes((227, 130, 108)),
-    "cut_copper_stairs": bytes((227, 130, 108)),
-    "cut_red_sandstone": bytes((192, 104, 34)),
-    "cut_red_sandstone_slab": bytes((187, 102, 34)),
-    "cut_sandstone": bytes((218, 210, 163)),
-    "cut_sandstone_slab": bytes((227, 219, 176)),
-    "cyan_banner": bytes((184, 148, 95)),
-    "cyan_bed": bytes((184, 148, 95)),
-    "cyan_candle": bytes((15, 105, 104)),
-    "cyan_candle_cake": bytes((255, 253, 254)),
-    "cyan_carpet": bytes((22, 150, 152)),
-    "cyan_concrete": bytes((21, 119, 136)),
-    "cyan_concrete_powder": bytes((37, 140, 154)),
-    "cyan_glazed_terracotta": bytes((21, 119, 136)),
-    "cyan_shulker_box": bytes((22, 135, 146)),
-    "cyan_stained_glass": bytes((76, 127, 153)),
-    "cyan_stained_glass_pane": bytes((76, 127, 153)),
-    "cyan_terracotta": bytes((86, 90, 90)),
-    "cyan_wall_banner": bytes((184, 148, 95)),
-    "cyan_wool": bytes((22, 150, 152)),
-    "damaged_anvil": bytes((56, 56, 56)),
-    "dandelion": bytes((255, 236, 79)),
-    "dark_oak_button": bytes((79, 50, 24)),
-    "dark_oak_door": bytes((73, 49, 22)),
-    "dark_oak_fence": bytes((79, 50, 24)),
-    "dark_oak_fence_gate": bytes((79, 50, 24)),
-    "dark_oak_leaves": bytes((183, 185, 183)),
-    "dark_oak_log": bytes((63, 49, 29)),
-    "dark_oak_planks": bytes((79, 50, 24)),
-    "dark_oak_pressure_plate": bytes((79, 50, 24)),
-    "dark_oak_sapling": bytes((16, 82, 16)),
-    "dark_oak_sign": bytes((79, 50, 24)),
-    "dark_oak_slab": bytes((79, 50, 24)),
-    "dark_oak_stairs": bytes((79, 50, 24)),
-    "dark_oak_trapdoor": bytes((73, 49, 22)),
-    "dark_oak_wall_sign": bytes((79, 50, 24)),
-    "dark_oak_wood": bytes((63, 49, 29)),
-    "dark_prismarine": bytes((49, 80, 65)),
-    "dark_prismarine_slab": bytes((49, 80, 65)),
-    "dark_prismarine_stairs": bytes((49, 80, 65)),
-    "daylight_detector": bytes((60, 51, 34)),
-    "dead_brain_coral": bytes((116, 106, 102)),
-    "dead_brain_coral_block": bytes((104, 100, 99)),
-    "dead_brain_coral_fan": bytes((134, 123, 119)),
-    "dead_brain_coral_wall_fan": bytes((134, 123, 119)),
-    "dead_bubble_coral": bytes((134, 123, 119)),
-    "dead_bubble_coral_block": bytes((134, 123, 119)),
-    "dead_bubble_coral_fan": bytes((153, 147, 141)),
-    "dead_bubble_coral_wall_fan": bytes((153, 147, 141)),
-    "dead_bush": bytes((81, 61, 36)),
-    "dead_fire_coral": bytes((116, 106, 102)),
-    "dead_fire_coral_block": bytes((134, 123, 119)),
-    "dead_fire_coral_fan": bytes((93, 90, 89)),
-    "dead_fire_coral_wall_fan": bytes((93, 90, 89)),
-    "dead_horn_coral": bytes((153, 147, 141)),
-    "dead_horn_coral_block": bytes((116, 106, 102)),
-    "dead_horn_coral_fan": bytes((134, 123, 119)),
-    "dead_horn_coral_wall_fan": bytes((134, 123, 119)),
-    "dead_tube_coral": bytes((116, 106, 102)),
-    "dead_tube_coral_block": bytes((134, 123, 119)),
-    "dead_tube_coral_fan": bytes((153, 147, 141)),
-    "dead_tube_coral_wall_fan": bytes((153, 147, 141)),
-    "deepslate": bytes((81, 81, 81)),
-    "deepslate_brick_slab": bytes((88, 88, 88)),
-    "deepslate_brick_stairs": bytes((88, 88, 88)),
-    "deepslate_brick_wall": bytes((88, 88, 88)),
-    "deepslate_bricks": bytes((88, 88, 88)),
-    "deepslate_coal_ore": bytes((81, 81, 81)),
-    "deepslate_copper_ore": bytes((81, 81, 81)),
-    "deepslate_diamond_ore": bytes((81, 81, 81)),
-    "deepslate_emerald_ore": bytes((100, 100, 100)),
-    "deepslate_gold_ore": bytes((81, 81, 81)),
-    "deepslate_iron_ore": bytes((61, 61, 67)),
-    "deepslate_lapis_ore": bytes((100, 100, 100)),
-    "deepslate_redstone_ore": bytes((81, 81, 81)),
-    "deepslate_tile_slab": bytes((45, 45, 45)),
-    "deepslate_tile_stairs": bytes((45, 45, 45)),
-    "deepslate_tile_wall": bytes((45, 45, 45)),
-    "deepslate_tiles": bytes((45, 45, 45)),
-    "detector_rail": bytes((156, 156, 156)),
-    "diamond_block": bytes((101, 245, 227)),
-    "diamond_ore": bytes((127, 127, 127)),
-    "diorite": bytes((233, 233, 233)),
-    "diorite_slab": bytes((233, 233, 233)),
-    "diorite_stairs": bytes((233, 233, 233)),
-    "diorite_wall": bytes((233, 233, 233)),
-    "dirt": bytes((121, 85, 58)),
-    "dirt_path": bytes((144, 117, 64)),
-    "dispenser": bytes((145, 145, 145)),
-    "dragon_egg": bytes((8, 8, 12)),
-    "dragon_head": bytes((73, 55, 44)),
-    "dragon_wall_head": bytes((73, 55, 44)),
-    "dried_kelp_block": bytes((35, 47, 23)),
-    "dripstone_block": bytes((146, 121, 101)),
-    "dropper": bytes((145, 145, 145)),
-    "emerald_block": bytes((23, 197, 68)),
-    "emerald_ore": bytes((127, 127, 127)),
-    "enchanting_table": bytes((162, 41, 41)),
-    "end_gateway": bytes((6, 3, 11)),
-    "end_portal": bytes((6, 3, 11)),
-    "end_portal_frame": bytes((66, 115, 103)),
-    "end_rod": bytes((246, 226, 205)),
-    "end_stone": bytes((213, 218, 148)),
-    "end_stone_brick_slab": bytes((232, 244, 178)),
-    "end_stone_brick_stairs": bytes((232, 244, 178)),
-    "end_stone_brick_wall": bytes((232, 244, 178)),
-    "end_stone_bricks": bytes((232, 244, 178)),
-    "ender_chest": bytes((6, 3, 11)),
-    "exposed_copper": bytes((168, 119, 98)),
-    "exposed_cut_copper": bytes((127, 114, 87)),
-    "exposed_cut_copper_slab": bytes((127, 114, 87)),
-    "exposed_cut_copper_stairs": bytes((127, 114, 87)),
-    "farmland": bytes((85, 46, 15)),
-    "fern": bytes((107, 110, 107)),
-    "fire": bytes((255, 255, 255)),
-    "fire_coral": bytes((121, 26, 38)),
-    "fire_coral_block": bytes((164, 34, 47)),
-    "fire_coral_fan": bytes((121, 26, 38)),
-    "fire_coral_wall_fan": bytes((121, 26, 38)),
-    "fletching_table": bytes((215, 193, 133)),
-    "flower_pot": bytes((137, 76, 59)),
-    "flowering_azalea": bytes((108, 128, 49)),
-    "flowering_azalea_leaves": bytes((80, 105, 44)),
-    "frosted_ice": bytes((128, 173, 251)),
-    "furnace": bytes((145, 145, 145)),
-    "gilded_blackstone": bytes((39, 34, 28)),
-    "glass": bytes((208, 234, 233)),
-    "glass_pane": bytes((208, 234, 233)),
-    "glow_item_frame": bytes((215, 193, 133)),
-    "glow_lichen": bytes((110, 126, 120)),
-    "glowstone": bytes((111, 69, 34)),
-    "gold_block": bytes((255, 216, 62)),
-    "gold_ore": bytes((127, 127, 127)),
-    "granite": bytes((159, 107, 88)),
-    "granite_slab": bytes((159, 107, 88)),
-    "granite_stairs": bytes((159, 107, 88)),
-    "granite_wall": bytes((159, 107, 88)),
-    "grass": bytes((160, 160, 160)),
-    "grass_block": bytes((151, 151, 151)),
-    "gravel": bytes((129, 127, 127)),
-    "gray_banner": bytes((184, 148, 95)),
-    "gray_bed": bytes((184, 148, 95)),
-    "gray_candle": bytes((74, 89, 90)),
-    "gray_candle_cake": bytes((255, 253, 254)),
-    "gray_carpet": bytes((71, 79, 82)),
-    "gray_concrete": bytes((55, 58, 62)),
-    "gray_concrete_powder": bytes((76, 80, 83)),
-    "gray_glazed_terracotta": bytes((54, 57, 61)),
-    "gray_shulker_box": bytes((62, 66, 70)),
-    "gray_stained_glass": bytes((76, 76, 76)),
-    "gray_stained_glass_pane": bytes((76, 76, 76)),
-    "gray_terracotta": bytes((58, 43, 36)),
-    "gray_wall_banner": bytes((184, 148, 95)),
-    "gray_wool": bytes((71, 79, 82)),
-    "green_banner": bytes((184, 148, 95)),
-    "green_bed": bytes((184, 148, 95)),
-    "green_candle": bytes((63, 83, 18)),
-    "green_candle_cake": bytes((255, 253, 254)),
-    "green_carpet": bytes((101, 134, 25)),
-    "green_concrete": bytes((73, 91, 36)),
-    "green_concrete_powder": bytes((93, 113, 48)),
-    "green_glazed_terracotta": bytes((73, 91, 36)),
-    "green_shulker_box": bytes((84, 109, 28)),
-    "green_stained_glass": bytes((102, 127, 51)),
-    "green_stained_glass_pane": bytes((102, 127, 51)),
-    "green_terracotta": bytes((75, 82, 41)),
-    "green_wall_banner": bytes((184, 148, 95)),
-    "green_wool": bytes((101, 134, 25)),
-    "grindstone": bytes((116, 116, 116)),
-    "hanging_roots": bytes((173, 125, 101)),
-    "hay_block": bytes((171, 146, 37)),
-    "heavy_weighted_pressure_plate": bytes((230, 230, 230)),
-    "honey_block": bytes((253, 193, 52)),
-    "honeycomb_block": bytes((232, 140, 8)),
-    "hopper": bytes((73, 72, 72)),
-    "horn_coral": bytes((209, 179, 65)),
-    "horn_coral_block": bytes((213, 203, 62)),
-    "horn_coral_fan": bytes((209, 179, 65)),
-    "horn_coral_wall_fan": bytes((209, 179, 65)),
-    "ice": bytes((146, 185, 254)),
-    "infested_chiseled_stone_bricks": bytes((90, 89, 90)),
-    "infested_cobblestone": bytes((136, 135, 136)),
-    "infested_cracked_stone_bricks": bytes((127, 127, 127)),
-    "infested_deepslate": bytes((81, 81, 81)),
-    "infested_mossy_stone_bricks": bytes((127, 127, 127)),
-    "infested_stone": bytes((127, 127, 127)),
-    "infested_stone_bricks": bytes((127, 127, 127)),
-    "iron_bars": bytes((114, 121, 110)),
-    "iron_block": bytes((230, 230, 230)),
-    "iron_door": bytes((205, 202, 202)),
-    "iron_ore": bytes((127, 127, 127)),
-    "iron_trapdoor": bytes((209, 207, 207)),
-    "item_frame": bytes((215, 193, 133)),
-    "jack_o_lantern": bytes((196, 111, 20)),
-    "jigsaw": bytes((16, 16, 16)),
-    "jukebox": bytes((123, 80, 57)),
-    "jungle_button": bytes((184, 135, 100)),
-    "jungle_door": bytes((185, 134, 97)),
-    "jungle_fence": bytes((184, 135, 100)),
-    "jungle_fence_gate": bytes((184, 135, 100)),
-    "jungle_leaves": bytes((136, 135, 135)),
-    "jungle_log": bytes((89, 70, 26)),
-    "jungle_planks": bytes((184, 135, 100)),
-    "jungle_pressure_plate": bytes((184, 135, 100)),
-    "jungle_sapling": bytes((43, 74, 12)),
-    "jungle_sign": bytes((184, 135, 100)),
-    "jungle_slab": bytes((184, 135, 100)),
-    "jungle_stairs": bytes((184, 135, 100)),
-    "jungle_trapdoor": bytes((177, 128, 92)),
-    "jungle_wall_sign": bytes((184, 135, 100)),
-    "jungle_wood": bytes((89, 70, 26)),
-    "kelp": bytes((89, 171, 48)),
-    "kelp_plant": bytes((92, 131, 50)),
-    "ladder": bytes((103, 80, 44)),
-    "lantern": bytes((62, 68, 83)),
-    "lapis_block": bytes((30, 66, 133)),
-    "lapis_ore": bytes((127, 127, 127)),
-    "large_amethyst_bud": bytes((141, 106, 204)),
-    "large_fern": bytes((115, 117, 115)),
-    "lava": bytes((209, 79, 12)),
-    "lava_cauldron": bytes((79, 79, 79)),
-    "lectern": bytes((181, 141, 80)),
-    "lever": bytes((136, 135, 136)),
-    "light": bytes((255, 251, 30)),
-    "light_blue_banner": bytes((184, 148, 95)),
-    "light_blue_bed": bytes((184, 148, 95)),
-    "light_blue_candle": bytes((32, 133, 197)),
-    "light_blue_candle_cake": bytes((255, 253, 254)),
-    "light_blue_carpet": bytes((78, 197, 231)),
-    "light_blue_concrete": bytes((35, 137, 199)),
-    "light_blue_concrete_powder": bytes((74, 182, 212)),
-    "light_blue_glazed_terracotta": bytes((58, 179, 218)),
-    "light_blue_shulker_box": bytes((59, 180, 219)),
-    "light_blue_stained_glass": bytes((102, 153, 216)),
-    "light_blue_stained_glass_pane": bytes((102, 153, 216)),
-    "light_blue_terracotta": bytes((112, 108, 138)),
-    "light_blue_wall_banner": bytes((184, 148, 95)),
-    "light_blue_wool": bytes((78, 197, 231)),
-    "light_gray_banner": bytes((184, 148, 95)),
-    "light_gray_bed": bytes((184, 148, 95)),
-    "light_gray_candle": bytes((106, 109, 98)),
-    "light_gray_candle_cake": bytes((255, 253, 254)),
-    "light_gray_carpet": bytes((153, 153, 147)),
-    "light_gray_concrete": bytes((125, 125, 115)),
-    "light_gray_concrete_powder": bytes((157, 157, 151)),
-    "light_gray_glazed_terracotta": bytes((204, 208, 210)),
-    "light_gray_shulker_box": bytes((140, 140, 131)),
-    "light_gray_stained_glass": bytes((153, 153, 153)),
-    "light_gray_stained_glass_pane": bytes((153, 153, 153)),
-    "light_gray_terracotta": bytes((135, 107, 98)),
-    "light_gray_wall_banner": bytes((184, 148, 95)),
-    "light_gray_wool": bytes((153, 153, 147)),
-    "light_weighted_pressure_plate": bytes((255, 216, 62)),
-    "lightning_rod": bytes((255, 255, 255)),
-    "lilac": bytes((211, 128, 211)),
-    "lily_of_the_valley": bytes((55, 127, 19)),
-    "lily_pad": bytes((150, 150, 150)),
-    "lime_banner": bytes((184, 148, 95)),
-    "lime_bed": bytes((184, 148, 95)),
-    "lime_candle": bytes((90, 165, 16)),
-    "lime_candle_cake": bytes((255, 253, 254)),
-    "lime_carpet": bytes((134, 204, 38)),
-    "lime_concrete": bytes((94, 169, 24)),
-    "lime_concrete_powder": bytes((122, 186, 40)),
-    "lime_glazed_terracotta": bytes((128, 199, 31)),
-    "lime_shulker_box": bytes((113, 188, 24)),
-    "lime_stained_glass": bytes((127, 204, 25)),
-    "lime_stained_glass_pane": bytes((127, 204, 25)),
-    "lime_terracotta": bytes((103, 117, 52)),
-    "lime_wall_banner": bytes((184, 148, 95)),
-    "lime_wool": bytes((134, 204, 38)),
-    "lodestone": bytes((143, 143, 143)),
-    "loom": bytes((82, 65, 39)),
-    "magenta_banner": bytes((184, 148, 95)),
-    "magenta_bed": bytes((184, 148, 95)),
-    "magenta_candle": bytes((156, 40, 148)),
-    "magenta_candle_cake": bytes((255, 253, 254)),
-    "magenta_carpet": bytes((214, 96, 209)),
-    "magenta_concrete": bytes((169, 48, 159)),
-    "magenta_concrete_powder": bytes((197, 91, 188)),
-    "magenta_glazed_terracotta": bytes((199, 78, 189)),
-    "magenta_shulker_box": bytes((186, 63, 175)),
-    "magenta_stained_glass": bytes((178, 76, 216)),
-    "magenta_stained_glass_pane": bytes((178, 76, 216)),
-    "magenta_terracotta": bytes((149, 87, 108)),
-    "magenta_wall_banner": bytes((184, 148, 95)),
-    "magenta_wool": bytes((214, 96, 209)),
-    "magma_block": bytes((101, 40, 40)),
-    "medium_amethyst_bud": bytes((207, 160, 243)),
-    "melon": bytes((167, 172, 29)),
-    "melon_stem": bytes((177, 177, 177)),
-    "moss_block": bytes((100, 114, 51)),
-    "moss_carpet": bytes((100, 114, 51)),
-    "mossy_cobblestone": bytes((82, 93, 57)),
-    "mossy_cobblestone_slab": bytes((82, 93, 57)),
-    "mossy_cobblestone_stairs": bytes((82, 93, 57)),
-    "mossy_cobblestone_wall": bytes((82, 93, 57)),
-    "mossy_stone_brick_slab": bytes((127, 127, 127)),
-    "mossy_stone_brick_stairs": bytes((127, 127, 127)),
-    "mossy_stone_brick_wall": bytes((127, 127, 127)),
-    "mossy_stone_bricks": bytes((127, 127, 127)),
-    "moving_piston": bytes((83, 81, 81)),
-    "mushroom_stem": bytes((211, 204, 196)),
-    "mycelium": bytes((151, 151, 151)),
-    "nether_brick_fence": bytes((48, 24, 28)),
-    "nether_brick_slab": bytes((48, 24, 28)),
-    "nether_brick_stairs": bytes((48, 24, 28)),
-    "nether_brick_wall": bytes((48, 24, 28)),
-    "nether_bricks": bytes((48, 24, 28)),
-    "nether_gold_ore": bytes((101, 40, 40)),
-    "nether_portal": bytes((73, 2, 185)),
-    "nether_quartz_ore": bytes((114, 50, 50)),
-    "nether_sprouts": bytes((17, 155, 133)),
-    "nether_wart": bytes((72, 0, 0)),
-    "nether_wart_block": bytes((123, 0, 0)),
-    "netherite_block": bytes((77, 73, 77)),
-    "netherrack": bytes((101, 40, 40)),
-    "note_block": bytes((41, 40, 32)),
-    "oak_button": bytes((184, 148, 95)),
-    "oak_door": bytes((150, 116, 65)),
-    "oak_fence": bytes((184, 148, 95)),
-    "oak_fence_gate": bytes((184, 148, 95)),
-    "oak_leaves": bytes((152, 153, 152)),
-    "oak_log": bytes((116, 90, 54)),
-    "oak_planks": bytes((184, 148, 95)),
-    "oak_pressure_plate": bytes((184, 148, 95)),
-    "oak_sapling": bytes((112, 83, 46)),
-    "oak_sign": bytes((184, 148, 95)),
-    "oak_slab": bytes((184, 148, 95)),
-    "oak_stairs": bytes((184, 148, 95)),
-    "oak_trapdoor": bytes((156, 121, 74)),
-    "oak_wall_sign": bytes((184, 148, 95)),
-    "oak_wood": bytes((116, 90, 54)),
-    "observer": bytes((70, 66, 66)),
-    "obsidian": bytes((6, 3, 11)),
-    "orange_banner": bytes((184, 148, 95)),
-    "orange_bed": bytes((184, 148, 95)),
-    "orange_candle": bytes((213, 89, 0)),
-    "orange_candle_cake": bytes((255, 253, 254)),
-    "orange_carpet": bytes((249, 147, 43)),
-    "orange_concrete": bytes((225, 97, 0)),
-    "orange_concrete_powder": bytes((222, 121, 19)),
-    "orange_glazed_terracotta": bytes((249, 128, 29)),
-    "orange_shulker_box": bytes((245, 116, 16)),
-    "orange_stained_glass": bytes((216, 127, 51)),
-    "orange_stained_glass_pane": bytes((216, 127, 51)),
-    "orange_terracotta": bytes((159, 82, 36)),
-    "orange_tulip": bytes((23, 124, 4)),
-    "orange_wall_banner": bytes((184, 148, 95)),
-    "orange_wool": bytes((249, 147, 43)),
-    "oxeye_daisy": bytes((247, 247, 247)),
-    "oxidized_copper": bytes((89, 178, 146)),
-    "oxidized_cut_copper": bytes((81, 164, 139)),
-    "oxidized_cut_copper_slab": bytes((81, 164, 139)),
-    "oxidized_cut_copper_stairs": bytes((81, 164, 139)),
-    "packed_ice": bytes((146, 185, 254)),
-    "peony": bytes((235, 197, 253)),
-    "petrified_oak_slab": bytes((184, 148, 95)),
-    "pink_banner": bytes((184, 148, 95)),
-    "pink_bed": bytes((184, 148, 95)),
-    "pink_candle": bytes((197, 89, 131)),
-    "pink_candle_cake": bytes((255, 253, 254)),
-    "pink_carpet": bytes((244, 178, 201)),
-    "pink_concrete": bytes((214, 101, 143)),
-    "pink_concrete_powder": bytes((230, 149, 179)),
-    "pink_glazed_terracotta": bytes((244, 181, 203)),
-    "pink_shulker_box": bytes((243, 139, 170)),
-    "pink_stained_glass": bytes((242, 127, 165)),
-    "pink_stained_glass_pane": bytes((242, 127, 165)),
-    "pink_terracotta": bytes((160, 77, 78)),
-    "pink_tulip": bytes((23, 124, 4)),
-    "pink_wall_banner": bytes((184, 148, 95)),
-    "pink_wool": bytes((244, 178, 201)),
-    "piston": bytes((83, 81, 81)),
-    "piston_head": bytes((179, 140, 81)),
-    "player_head": bytes((73, 55, 44)),
-    "player_wall_head": bytes((73, 55, 44)),
-    "podzol": bytes((151, 151, 151)),
-    "pointed_dripstone": bytes((146, 121, 101)),
-    "polished_andesite": bytes((134, 136, 135)),
-    "polished_andesite_slab": bytes((134, 136, 135)),
-    "polished_andesite_stairs": bytes((134, 136, 135)),
-    "polished_basalt": bytes((116, 116, 116)),
-    "polished_blackstone": bytes((60, 57, 71)),
-    "polished_blackstone_brick_slab": bytes((60, 57, 71)),
-    "polished_blackstone_brick_stairs": bytes((60, 57, 71)),
-    "polished_blackstone_brick_wall": bytes((60, 57, 71)),
-    "polished_blackstone_bricks": bytes((60, 57, 71)),
-    "polished_blackstone_button": bytes((60, 57, 71)),
-    "polished_blackstone_pressure_plate": bytes((60, 57, 71)),
-    "polished_blackstone_slab": bytes((60, 57, 71)),
-    "polished_blackstone_stairs": bytes((60, 57, 71)),
-    "polished_blackstone_wall": bytes((60, 57, 71)),
-    "polished_deepslate": bytes((88, 88, 88)),
-    "polished_deepslate_slab": bytes((88, 88, 88)),
-    "polished_deepslate_stairs": bytes((88, 88, 88)),
-    "polished_deepslate_wall": bytes((88, 88, 88)),
-    "polished_diorite": bytes((200, 201, 200)),
-    "polished_diorite_slab": bytes((200, 201, 200)),
-    "polished_diorite_stairs": bytes((200, 201, 200)),
-    "polished_granite": bytes((159, 107, 88)),
-    "polished_granite_slab": bytes((159, 107, 88)),
-    "polished_granite_stairs": bytes((159, 107, 88)),
-    "poppy": bytes((237, 48, 44)),
-    "potatoes": bytes((43, 112, 42)),
-    "potted_acacia_sapling": bytes((124, 94, 18)),
-    "potted_allium": bytes((210, 166, 246)),
-    "potted_azalea_bush": bytes((100, 114, 51)),
-    "potted_azure_bluet": bytes((85, 171, 45)),
-    "potted_bamboo": bytes((137, 76, 59)),
-    "potted_birch_sapling": bytes((108, 158, 56)),
-    "potted_blue_orchid": bytes((39, 169, 244)),
-    "potted_brown_mushroom": bytes((204, 153, 120)),
-    "potted_cactus": bytes((137, 76, 59)),
-    "potted_cornflower": bytes((87, 140, 77)),
-    "potted_crimson_fungus": bytes((82, 24, 16)),
-    "potted_crimson_roots": bytes((102, 6, 39)),
-    "potted_dandelion": bytes((255, 236, 79)),
-    "potted_dark_oak_sapling": bytes((16, 82, 16)),
-    "potted_dead_bush": bytes((81, 61, 36)),
-    "potted_fern": bytes((107, 110, 107)),
-    "potted_flowering_azalea_bush": bytes((100, 114, 51)),
-    "potted_jungle_sapling": bytes((43, 74, 12)),
-    "potted_lily_of_the_valley": bytes((55, 127, 19)),
-    "potted_oak_sapling": bytes((112, 83, 46)),
-    "potted_orange_tulip": bytes((23, 124, 4)),
-    "potted_oxeye_daisy": bytes((247, 247, 247)),
-    "potted_pink_tulip": bytes((23, 124, 4)),
-    "potted_poppy": bytes((237, 48, 44)),
-    "potted_red_mushroom": bytes((226, 18, 18)),
-    "potted_red_tulip": bytes((23, 124, 4)),
-    "potted_spruce_sapling": bytes((34, 53, 34)),
-    "potted_warped_fungus": bytes((20, 180, 133)),
-    "potted_warped_roots": bytes((22, 126, 134)),
-    "potted_white_tulip": bytes((85, 171, 45)),
-    "potted_wither_rose": bytes((56, 69, 26)),
-    "powder_snow": bytes((255, 255, 255)),
-    "powder_snow_cauldron": bytes((79, 79, 79)),
-    "powered_rail": bytes((156, 156, 156)),
-    "prismarine": bytes((155, 203, 191)),
-    "prismarine_brick_slab": bytes((110, 185, 174)),
-    "prismarine_brick_stairs": bytes((110, 185, 174)),
-    "prismarine_bricks": bytes((110, 185, 174)),
-    "prismarine_slab": bytes((155, 203, 191)),
-    "prismarine_stairs": bytes((155, 203, 191)),
-    "prismarine_wall": bytes((155, 203, 191)),
-    "pumpkin": bytes((227, 138, 29)),
-    "pumpkin_stem": bytes((139, 141, 139)),
-    "purple_banner": bytes((184, 148, 95)),
-    "purple_bed": bytes((184, 148, 95)),
-    "purple_candle": bytes((98, 28, 156)),
-    "purple_candle_cake": bytes((255, 253, 254)),
-    "purple_carpet": bytes((151, 67, 205)),
-    "purple_concrete": bytes((101, 32, 157)),
-    "purple_concrete_powder": bytes((124, 51, 172)),
-    "purple_glazed_terracotta": bytes((137, 50, 184)),
-    "purple_shulker_box": bytes((116, 38, 169)),
-    "purple_stained_glass": bytes((127, 63, 178)),
-    "purple_stained_glass_pane": bytes((127, 63, 178)),
-    "purple_terracotta": bytes((115, 68, 84)),
-    "purple_wall_banner": bytes((184, 148, 95)),
-    "purple_wool": bytes((151, 67, 205)),
-    "purpur_block": bytes((178, 134, 178)),
-    "purpur_pillar": bytes((178, 134, 178)),
-    "purpur_slab": bytes((178, 134, 178)),
-    "purpur_stairs": bytes((178, 134, 178)),
-    "quartz_block": bytes((238, 234, 230)),
-    "quartz_bricks": bytes((238, 234, 230)),
-    "quartz_pillar": bytes((242, 239, 237)),
-    "quartz_slab": bytes((238, 234, 230)),
-    "quartz_stairs": bytes((238, 234, 230)),
-    "rail": bytes((103, 80, 44)),
-    "raw_copper_block": bytes((157, 87, 63)),
-    "raw_gold_block": bytes((201, 140, 28)),
-    "raw_iron_block": bytes((175, 142, 119)),
-    "red_banner": bytes((184, 148, 95)),
-    "red_bed": bytes((184, 148, 95)),
-    "red_candle": bytes((144, 33, 32)),
-    "red_candle_cake": bytes((255, 253, 254)),
-    "red_carpet": bytes((184, 52, 44)),
-    "red_concrete": bytes((142, 32, 32)),
-    "red_concrete_powder": bytes((164, 51, 50)),
-    "red_glazed_terracotta": bytes((176, 46, 38)),
-    "red_mushroom": bytes((226, 18, 18)),
-    "red_mushroom_block": bytes((195, 40, 38)),
-    "red_nether_brick_slab": bytes((68, 5, 7)),
-    "red_nether_brick_stairs": bytes((68, 5, 7)),
-    "red_nether_brick_wall": bytes((68, 5, 7)),
-    "red_nether_bricks": bytes((68, 5, 7)),
-    "red_sand": bytes((191, 103, 33)),
-    "red_sandstone": bytes((187, 102, 34)),
-    "red_sandstone_slab": bytes((187, 102, 34)),
-    "red_sandstone_stairs": bytes((187, 102, 34)),
-    "red_sandstone_wall": bytes((192, 104, 34)),
-    "red_shulker_box": bytes((156, 37, 34)),
-    "red_stained_glass": bytes((153, 51, 51)),
-    "red_stained_glass_pane": bytes((153, 51, 51)),
-    "red_terracotta": bytes((141, 59, 46)),
-    "red_tulip": bytes((23, 124, 4)),
-    "red_wall_banner": bytes((184, 148, 95)),
-    "red_wool": bytes((184, 52, 44)),
-    "redstone_block": bytes((230, 32, 8)),
-    "redstone_lamp": bytes((59, 32, 21)),
-    "redstone_ore": bytes((127, 127, 127)),
-    "redstone_torch": bytes((253, 0, 0)),
-    "redstone_wall_torch": bytes((253, 0, 0)),
-    "redstone_wire": bytes((254, 254, 254)),
-    "repeater": bytes((139, 141, 139)),
-    "repeating_command_block": bytes((106, 79, 199)),
-    "respawn_anchor": bytes((87, 63, 127)),
-    "rooted_dirt": bytes((121, 85, 58)),
-    "rose_bush": bytes((191, 37, 41)),
-    "sand": bytes((218, 207, 163)),
-    "sandstone": bytes((227, 219, 176)),
-    "sandstone_slab": bytes((227, 219, 176)),
-    "sandstone_stairs": bytes((227, 219, 176)),
-    "sandstone_wall": bytes((218, 210, 163)),
-    "scaffolding": bytes((171, 115, 65)),
-    "sculk_sensor": bytes((6, 38, 45)),
-    "sea_lantern": bytes((227, 235, 228)),
-    "sea_pickle": bytes((108, 114, 42)),
-    "seagrass": bytes((47, 130, 0)),
-    "short_grass": bytes((160, 160, 160)),
-    "shroomlight": bytes((254, 172, 109)),
-    "shulker_box": bytes((151, 105, 151)),
-    "skeleton_skull": bytes((73, 55, 44)),
-    "skeleton_wall_skull": bytes((73, 55, 44)),
-    "slime_block": bytes((115, 194, 98)),
-    "small_amethyst_bud": bytes((100, 71, 158)),
-    "small_dripleaf": bytes((112, 146, 45)),
-    "smithing_table": bytes((47, 20, 17)),
-    "smoker": bytes((80, 78, 78)),
-    "smooth_basalt": bytes((79, 75, 79)),
-    "smooth_quartz": bytes((238, 234, 230)),
-    "smooth_quartz_slab": bytes((238, 234, 230)),
-    "smooth_quartz_stairs": bytes((238, 234, 230)),
-    "smooth_red_sandstone": bytes((187, 102, 34)),
-    "smooth_red_sandstone_slab": bytes((187, 102, 34)),
-    "smooth_red_sandstone_stairs": bytes((187, 102, 34)),
-    "smooth_sandstone": bytes((227, 219, 176)),
-    "smooth_sandstone_slab": bytes((227, 219, 176)),
-    "smooth_sandstone_stairs": bytes((227, 219, 176)),
-    "smooth_stone": bytes((168, 168, 168)),
-    "smooth_stone_slab": bytes((168, 168, 168)),
-    "snow": bytes((255, 255, 255)),
-    "snow_block": bytes((255, 255, 255)),
-    "soul_campfire": bytes((58, 72, 95)),
-    "soul_fire": bytes((255, 255, 255)),
-    "soul_lantern": bytes((62, 68, 83)),
-    "soul_sand": bytes((73, 55, 44)),
-    "soul_soil": bytes((73, 55, 44)),
-    "soul_torch": bytes((159, 127, 80)),
-    "soul_wall_torch": bytes((159, 127, 80)),
-    "spawner": bytes((24, 44, 57)),
-    "sponge": bytes((205, 206, 74)),
-    "spore_blossom": bytes((244, 105, 189)),
-    "spruce_button": bytes((130, 97, 58)),
-    "spruce_door": bytes((128, 94, 54)),
-    "spruce_fence": bytes((130, 97, 58)),
-    "spruce_fence_gate": bytes((130, 97, 58)),
-    "spruce_leaves": bytes((138, 138, 138)),
-    "spruce_log": bytes((59, 39, 19)),
-    "spruce_planks": bytes((130, 97, 58)),
-    "spruce_pressure_plate": bytes((130, 97, 58)),
-    "spruce_sapling": bytes((34, 53, 34)),
-    "spruce_sign": bytes((130, 97, 58)),
-    "spruce_slab": bytes((130, 97, 58)),
-    "spruce_stairs": bytes((130, 97, 58)),
-    "spruce_trapdoor": bytes((102, 77, 40)),
-    "spruce_wall_sign": bytes((130, 97, 58)),
-    "spruce_wood": bytes((59, 39, 19)),
-    "sticky_piston": bytes((83, 81, 81)),
-    "stone": bytes((127, 127, 127)),
-    "stone_brick_slab": bytes((127, 127, 127)),
-    "stone_brick_stairs": bytes((127, 127, 127)),
-    "stone_brick_wall": bytes((127, 127, 127)),
-    "stone_bricks": bytes((127, 127, 127)),
-    "stone_button": bytes((127, 127, 127)),
-    "stone_pressure_plate": bytes((127, 127, 127)),
-    "stone_slab": bytes((127, 127, 127)),
-    "stone_stairs": bytes((127, 127, 127)),
-    "stonecutter": bytes((127, 127, 127)),
-    "stripped_acacia_log": bytes((178, 91, 59)),
-    "stripped_acacia_wood": bytes((178, 91, 59)),
-    "stripped_birch_log": bytes((196, 172, 114)),
-    "stripped_birch_wood": bytes((196, 172, 114)),
-    "stripped_crimson_hyphae": bytes((137, 57, 91)),
-    "stripped_crimson_stem": bytes((137, 57, 91)),
-    "stripped_dark_oak_log": bytes((91, 72, 48)),
-    "stripped_dark_oak_wood": bytes((91, 72, 48)),
-    "stripped_jungle_log": bytes((180, 134, 90)),
-    "stripped_jungle_wood": bytes((180, 134, 90)),
-    "stripped_oak_log": bytes((185, 149, 88)),
-    "stripped_oak_wood": bytes((185, 149, 88)),
-    "stripped_spruce_log": bytes((103, 86, 49)),
-    "stripped_spruce_wood": bytes((103, 86, 49)),
-    "stripped_warped_hyphae": bytes((59, 153, 151)),
-    "stripped_warped_stem": bytes((59, 153, 151)),
-    "structure_block": bytes((38, 29, 42)),
-    "structure_void": bytes((15, 72, 78)),
-    "sugar_cane": bytes((130, 168, 89)),
-    "sunflower": bytes((254, 214, 57)),
-    "sweet_berry_bush": bytes((41, 82, 48)),
-    "tall_grass": bytes((172, 170, 172)),
-    "tall_seagrass": bytes((56, 147, 6)),
-    "target": bytes((239, 226, 208)),
-    "terracotta": bytes((150, 93, 67)),
-    "tinted_glass": bytes((39, 37, 40)),
-    "tnt": bytes((234, 67, 24)),
-    "torch": bytes((159, 127, 80)),
-    "trapped_chest": bytes((184, 148, 95)),
-    "tripwire": bytes((143, 143, 143)),
-    "tripwire_hook": bytes((184, 148, 95)),
-    "tube_coral": bytes((49, 79, 221)),
-    "tube_coral_block": bytes((49, 79, 221)),
-    "tube_coral_fan": bytes((63, 108, 229)),
-    "tube_coral_wall_fan": bytes((63, 108, 229)),
-    "tuff": bytes((106, 110, 111)),
-    "turtle_egg": bytes((247, 241, 217)),
-    "twisting_vines": bytes((20, 180, 133)),
-    "twisting_vines_plant": bytes((17, 155, 133)),
-    "vine": bytes((131, 131, 131)),
-    "wall_torch": bytes((159, 127, 80)),
-    "warped_button": bytes((57, 131, 130)),
-    "warped_door": bytes((57, 131, 130)),
-    "warped_fence": bytes((57, 131, 130)),
-    "warped_fence_gate": bytes((57, 131, 130)),
-    "warped_fungus": bytes((20, 180, 133)),
-    "warped_hyphae": bytes((69, 45, 92)),
-    "warped_nylium": bytes((22, 97, 91)),
-    "warped_planks": bytes((57, 131, 130)),
-    "warped_pressure_plate": bytes((57, 131, 130)),
-    "warped_roots": bytes((22, 126, 134)),
-    "warped_sign": bytes((57, 131, 130)),
-    "warped_slab": bytes((57, 131, 130)),
-    "warped_stairs": bytes((57, 131, 130)),
-    "warped_stem": bytes((69, 45, 92)),
-    "warped_trapdoor": bytes((46, 95, 81)),
-    "warped_wall_sign": bytes((57, 131, 130)),
-    "warped_wart_block": bytes((22, 126, 134)),
-    "water": bytes((165, 165, 165)),
-    "water_cauldron": bytes((79, 79, 79)),
-    "waxed_copper_block": bytes((200, 116, 86)),
-    "waxed_cut_copper": bytes((227, 130, 108)),
-    "waxed_cut_copper_slab": bytes((227, 130, 108)),
-    "waxed_cut_copper_stairs": bytes((227, 130, 108)),
-    "waxed_exposed_copper": bytes((168, 119, 98)),
-    "waxed_exposed_cut_copper": bytes((127, 114, 87)),
-    "waxed_exposed_cut_copper_slab": bytes((127, 114, 87)),
-    "waxed_exposed_cut_copper_stairs": bytes((127, 114, 87)),
-    "waxed_oxidized_copper": bytes((89, 178, 146)),
-    "waxed_oxidized_cut_copper": bytes((81, 164, 139)),
-    "waxed_oxidized_cut_copper_slab": bytes((81, 164, 139)),
-    "waxed_oxidized_cut_copper_stairs": bytes((81, 164, 139)),
-    "waxed_weathered_copper": bytes((100, 160, 119)),
-    "waxed_weathered_cut_copper": bytes((100, 160, 119)),
-    "waxed_weathered_cut_copper_slab": bytes((100, 160, 119)),
-    "waxed_weathered_cut_copper_stairs": bytes((100, 160, 119)),
-    "weathered_copper": bytes((100, 160, 119)),
-    "weathered_cut_copper": bytes((100, 160, 119)),
-    "weathered_cut_copper_slab": bytes((100, 160, 119)),
-    "weathered_cut_copper_stairs": bytes((100, 160, 119)),
-    "weeping_vines": bytes((90, 0, 0)),
-    "weeping_vines_plant": bytes((123, 0, 0)),
-    "wet_sponge": bytes((176, 191, 76)),
-    "wheat": bytes((166, 149, 83)),
-    "white_banner": bytes((184, 148, 95)),
-    "white_bed": bytes((184, 148, 95)),
-    "white_candle": bytes((199, 211, 211)),
-    "white_candle_cake": bytes((255, 253, 254)),
-    "white_carpet": bytes((254, 254, 254)),
-    "white_concrete": bytes((207, 213, 214)),
-    "white_concrete_powder": bytes((224, 226, 226)),
-    "white_glazed_terracotta": bytes((249, 255, 254)),
-    "white_shulker_box": bytes((230, 234, 234)),
-    "white_stained_glass": bytes((255, 255, 255)),
-    "white_stained_glass_pane": bytes((255, 255, 255)),
-    "white_terracotta": bytes((210, 177, 161)),
-    "white_tulip": bytes((85, 171, 45)),
-    "white_wall_banner": bytes((184, 148, 95)),
-    "white_wool": bytes((254, 254, 254)),
-    "wither_rose": bytes((56, 69, 26)),
-    "wither_skeleton_skull": bytes((73, 55, 44)),
-    "wither_skeleton_wall_skull": bytes((73, 55, 44)),
-    "yellow_banner": bytes((184, 148, 95)),
-    "yellow_bed": bytes((184, 148, 95)),
-    "yellow_candle": bytes((197, 152, 37)),
-    "yellow_candle_cake": bytes((255, 253, 254)),
-    "yellow_carpet": bytes((254, 217, 63)),
-    "yellow_concrete": bytes((241, 175, 21)),
-    "yellow_concrete_powder": bytes((237, 201, 51)),
-    "yellow_glazed_terracotta": bytes((255, 236, 157)),
-    "yellow_shulker_box": bytes((252, 199, 36)),
-    "yellow_stained_glass": bytes((229, 229, 51)),
-    "yellow_stained_glass_pane": bytes((229, 229, 51)),
-    "yellow_terracotta": bytes((184, 131, 34)),
-    "yellow_wall_banner": bytes((184, 148, 95)),
-    "yellow_wool": bytes((254, 217, 63)),
-    "zombie_head": bytes((73, 55, 44)),
-    "zombie_wall_head": bytes((73, 55, 44)),
-
-}
-
-# TODO: figure out how to color blocks correctly based on biome
-block_colors.update({
-
-    "acacia_leaves": bytes((0, 109, 0)),
-    "attached_melon_stem": bytes((0, 106, 0)),
-    "attached_pumpkin_stem": bytes((0, 106, 0)),
-    "birch_leaves": bytes((0, 109, 0)),
-    "dark_oak_leaves": bytes((0, 109, 0)),
-    "fire": bytes((255, 0, 0)),
-    "grass": bytes((0, 109, 0)),
-    "grass_block": bytes((109, 153, 48)),
-    "jungle_leaves": bytes((0, 109, 0)),
-    "large_fern": bytes((0, 106, 0)),
-    "melon_stem": bytes((0, 106, 0)),
-    "oak_leaves": bytes((0, 109, 0)),
-    "pumpkin_stem": bytes((0, 106, 0)),
-    "spruce_leaves": bytes((0, 109, 0)),
-    "tall_grass": bytes((0, 109, 0)),
-    "vine": bytes((0, 109, 0)),
-    "water": bytes((55, 55, 220)),
-
-})
+__all__ = ["map_colors", "block_colors", "color_overrides"]
+
+map_colors = {}
+
+map_colors[0] = {
+    0:      bytes((0, 0, 0)),
+    1:      bytes((0, 0, 0)),
+    2:      bytes((0, 0, 0)),
+    3:      bytes((0, 0, 0)),
+    4:      bytes((89, 125, 39)),
+    5:      bytes((109, 153, 48)),
+    6:      bytes((127, 178, 56)),
+    7:      bytes((67, 94, 29)),
+    8:      bytes((174, 164, 115)),
+    9:      bytes((213, 201, 140)),
+    10:     bytes((247, 233, 163)),
+    11:     bytes((130, 123, 86)),
+    12:     bytes((140, 140, 140)),
+    13:     bytes((171, 171, 171)),
+    14:     bytes((199, 199, 199)),
+    15:     bytes((105, 105, 105)),
+    16:     bytes((180, 0, 0)),
+    17:     bytes((220, 0, 0)),
+    18:     bytes((255, 0, 0)),
+    19:     bytes((135, 0, 0)),
+    20:     bytes((112, 112, 180)),
+    21:     bytes((138, 138, 220)),
+    22:     bytes((160, 160, 255)),
+    23:     bytes((84, 84, 135)),
+    24:     bytes((117, 117, 117)),
+    25:     bytes((144, 144, 144)),
+    26:     bytes((167, 167, 167)),
+    27:     bytes((88, 88, 88)),
+    28:     bytes((0, 87, 0)),
+    29:     bytes((0, 106, 0)),
+    30:     bytes((0, 124, 0)),
+    31:     bytes((0, 65, 0)),
+    32:     bytes((180, 180, 180)),
+    33:     bytes((220, 220, 220)),
+    34:     bytes((255, 255, 255)),
+    35:     bytes((135, 135, 135)),
+    36:     bytes((115, 118, 129)),
+    37:     bytes((141, 144, 158)),
+    38:     bytes((164, 168, 184)),
+    39:     bytes((86, 88, 97)),
+    40:     bytes((106, 76, 54)),
+    41:     bytes((130, 94, 66)),
+    42:     bytes((151, 109, 77)),
+    43:     bytes((79, 57, 40)),
+    44:     bytes((79, 79, 79)),
+    45:     bytes((96, 96, 96)),
+    46:     bytes((112, 112, 112)),
+    47:     bytes((59, 59, 59)),
+    48:     bytes((45, 45, 180)),
+    49:     bytes((55, 55, 220)),
+    50:     bytes((64, 64, 255)),
+    51:     bytes((33, 33, 135)),
+    52:     bytes((100, 84, 50)),
+    53:     bytes((123, 102, 62)),
+    54:     bytes((143, 119, 72)),
+    55:     bytes((75, 63, 38)),
+    56:     bytes((180, 177, 172)),
+    57:     bytes((220, 217, 211)),
+    58:     bytes((255, 252, 245)),
+    59:     bytes((135, 133, 129)),
+    60:     bytes((152, 89, 36)),
+    61:     bytes((186, 109, 44)),
+    62:     bytes((216, 127, 51)),
+    63:     bytes((114, 67, 27)),
+    64:     bytes((125, 53, 152)),
+    65:     bytes((153, 65, 186)),
+    66:     bytes((178, 76, 216)),
+    67:     bytes((94, 40, 114)),
+    68:     bytes((72, 108, 152)),
+    69:     bytes((88, 132, 186)),
+    70:     bytes((102, 153, 216)),
+    71:     bytes((54, 81, 114)),
+    72:     bytes((161, 161, 36)),
+    73:     bytes((197, 197, 44)),
+    74:     bytes((229, 229, 51)),
+    75:     bytes((121, 121, 27)),
+    76:     bytes((89, 144, 17)),
+    77:     bytes((109, 176, 21)),
+    78:     bytes((127, 204, 25)),
+    79:     bytes((67, 108, 13)),
+    80:     bytes((170, 89, 116)),
+    81:     bytes((208, 109, 142)),
+    82:     bytes((242, 127, 165)),
+    83:     bytes((128, 67, 87)),
+    84:     bytes((53, 53, 53)),
+    85:     bytes((65, 65, 65)),
+    86:     bytes((76, 76, 76)),
+    87:     bytes((40, 40, 40)),
+    88:     bytes((108, 108, 108)),
+    89:     bytes((132, 132, 132)),
+    90:     bytes((153, 153, 153)),
+    91:     bytes((81, 81, 81)),
+    92:     bytes((53, 89, 108)),
+    93:     bytes((65, 109, 132)),
+    94:     bytes((76, 127, 153)),
+    95:     bytes((40, 67, 81)),
+    96:     bytes((89, 44, 125)),
+    97:     bytes((109, 54, 153)),
+    98:     bytes((127, 63, 178)),
+    99:     bytes((67, 33, 94)),
+    100:    bytes((36, 53, 125)),
+    101:    bytes((44, 65, 153)),
+    102:    bytes((51, 76, 178)),
+    103:    bytes((27, 40, 94)),
+    104:    bytes((72, 53, 36)),
+    105:    bytes((88, 65, 44)),
+    106:    bytes((102, 76, 51)),
+    107:    bytes((54, 40, 27)),
+    108:    bytes((72, 89, 36)),
+    109:    bytes((88, 109, 44)),
+    110:    bytes((102, 127, 51)),
+    111:    bytes((54, 67, 27)),
+    112:    bytes((108, 36, 36)),
+    113:    bytes((132, 44, 44)),
+    114:    bytes((153, 51, 51)),
+    115:    bytes((81, 27, 27)),
+    116:    bytes((17, 17, 17)),
+    117:    bytes((21, 21, 21)),
+    118:    bytes((25, 25, 25)),
+    119:    bytes((13, 13, 13)),
+    120:    bytes((176, 168, 54)),
+    121:    bytes((215, 205, 66)),
+    122:    bytes((250, 238, 77)),
+    123:    bytes((132, 126, 40)),
+    124:    bytes((64, 154, 150)),
+    125:    bytes((79, 188, 183)),
+    126:    bytes((92, 219, 213)),
+    127:    bytes((48, 115, 112)),
+    128:    bytes((52, 90, 180)),
+    129:    bytes((63, 110, 220)),
+    130:    bytes((74, 128, 255)),
+    131:    bytes((39, 67, 135)),
+    132:    bytes((0, 153, 40)),
+    133:    bytes((0, 187, 50)),
+    134:    bytes((0, 217, 58)),
+    135:    bytes((0, 114, 30)),
+    136:    bytes((91, 60, 34)),
+    137:    bytes((111, 74, 42)),
+    138:    bytes((129, 86, 49)),
+    139:    bytes((68, 45, 25)),
+    140:    bytes((79, 1, 0)),
+    141:    bytes((96, 1, 0)),
+    142:    bytes((112, 2, 0)),
+    143:    bytes((59, 1, 0)),
+    144:    bytes((147, 124, 113)),
+    145:    bytes((180, 152, 138)),
+    146:    bytes((209, 177, 161)),
+    147:    bytes((110, 93, 85)),
+    148:    bytes((112, 57, 25)),
+    149:    bytes((137, 70, 31)),
+    150:    bytes((159, 82, 36)),
+    151:    bytes((84, 43, 19)),
+    152:    bytes((105, 61, 76)),
+    153:    bytes((128, 75, 93)),
+    154:    bytes((149, 87, 108)),
+    155:    bytes((78, 46, 57)),
+    156:    bytes((79, 76, 97)),
+    157:    bytes((96, 93, 119)),
+    158:    bytes((112, 108, 138)),
+    159:    bytes((59, 57, 73)),
+    160:    bytes((131, 93, 25)),
+    161:    bytes((160, 114, 31)),
+    162:    bytes((186, 133, 36)),
+    163:    bytes((98, 70, 19)),
+    164:    bytes((72, 82, 37)),
+    165:    bytes((88, 100, 45)),
+    166:    bytes((103, 117, 53)),
+    167:    bytes((54, 61, 28)),
+    168:    bytes((112, 54, 55)),
+    169:    bytes((138, 66, 67)),
+    170:    bytes((160, 77, 78)),
+    171:    bytes((84, 40, 41)),
+    172:    bytes((40, 28, 24)),
+    173:    bytes((49, 35, 30)),
+    174:    bytes((57, 41, 35)),
+    175:    bytes((30, 21, 18)),
+    176:    bytes((95, 75, 69)),
+    177:    bytes((116, 92, 84)),
+    178:    bytes((135, 107, 98)),
+    179:    bytes((71, 56, 51)),
+    180:    bytes((61, 64, 64)),
+    181:    bytes((75, 79, 79)),
+    182:    bytes((87, 92, 92)),
+    183:    bytes((46, 48, 48)),
+    184:    bytes((86, 51, 62)),
+    185:    bytes((105, 62, 75)),
+    186:    bytes((122, 73, 88)),
+    187:    bytes((64, 38, 46)),
+    188:    bytes((53, 43, 64)),
+    189:    bytes((65, 53, 79)),
+    190:    bytes((76, 62, 92)),
+    191:    bytes((40, 32, 48)),
+    192:    bytes((53, 35, 24)),
+    193:    bytes((65, 43, 30)),
+    194:    bytes((76, 50, 35)),
+    195:    bytes((40, 26, 18)),
+    196:    bytes((53, 57, 29)),
+    197:    bytes((65, 70, 36)),
+    198:    bytes((76, 82, 42)),
+    199:    bytes((40, 43, 22)),
+    200:    bytes((100, 42, 32)),
+    201:    bytes((122, 51, 39)),
+    202:    bytes((142, 60, 46)),
+    203:    bytes((75, 31, 24)),
+    204:    bytes((26, 15, 11)),
+    205:    bytes((31, 18, 13)),
+    206:    bytes((37, 22, 16)),
+    207:    bytes((19, 11, 8)),
+}
+
+block_colors = {
+
+    "acacia_button": bytes((186, 99, 55)),
+    "acacia_door": bytes((203, 119, 79)),
+    "acacia_fence": bytes((186, 99, 55)),
+    "acacia_fence_gate": bytes((186, 99, 55)),
+    "acacia_leaves": bytes((158, 158, 158)),
+    "acacia_log": bytes((105, 98, 89)),
+    "acacia_planks": bytes((186, 99, 55)),
+    "acacia_pressure_plate": bytes((186, 99, 55)),
+    "acacia_sapling": bytes((124, 94, 18)),
+    "acacia_sign": bytes((186, 99, 55)),
+    "acacia_slab": bytes((186, 99, 55)),
+    "acacia_stairs": bytes((186, 99, 55)),
+    "acacia_trapdoor": bytes((136, 71, 40)),
+    "acacia_wall_sign": bytes((186, 99, 55)),
+    "acacia_wood": bytes((105, 98, 89)),
+    "activator_rail": bytes((156, 156, 156)),
+    "allium": bytes((210, 166, 246)),
+    "amethyst_block": bytes((122, 91, 181)),
+    "amethyst_cluster": bytes((207, 160, 243)),
+    "ancient_debris": bytes((93, 52, 44)),
+    "andesite": bytes((138, 138, 142)),
+    "andesite_slab": bytes((138, 138, 142)),
+    "andesite_stairs": bytes((138, 138, 142)),
+    "andesite_wall": bytes((138, 138, 142)),
+    "anvil": bytes((82, 82, 82)),
+    "attached_melon_stem": bytes((139, 141, 139)),
+    "attached_pumpkin_stem": bytes((140, 140, 140)),
+    "azalea": bytes((100, 114, 51)),
+    "azalea_leaves": bytes((80, 105, 44)),
+    "azure_bluet": bytes((85, 171, 45)),
+    "bamboo": bytes((89, 144, 3)),
+    "bamboo_sapling": bytes((101, 92, 30)),
+    "barrel": bytes((47, 31, 9)),
+    "barrier": bytes((227, 0, 0)),
+    "basalt": bytes((79, 75, 79)),
+    "beacon": bytes((208, 234, 233)),
+    "bedrock": bytes((51, 51, 51)),
+    "bee_nest": bytes((251, 220, 117)),
+    "beehive": bytes((184, 148, 95)),
+    "beetroots": bytes((116, 35, 3)),
+    "bell": bytes((123, 94, 13)),
+    "big_dripleaf": bytes((132, 168, 60)),
+    "big_dripleaf_stem": bytes((108, 128, 49)),
+    "birch_button": bytes((215, 193, 133)),
+    "birch_door": bytes((246, 242, 222)),
+    "birch_fence": bytes((215, 193, 133)),
+    "birch_fence_gate": bytes((215, 193, 133)),
+    "birch_leaves": bytes((112, 109, 112)),
+    "birch_log": bytes((255, 255, 255)),
+    "birch_planks": bytes((215, 193, 133)),
+    "birch_pressure_plate": bytes((215, 193, 133)),
+    "birch_sapling": bytes((108, 158, 56)),
+    "birch_sign": bytes((215, 193, 133)),
+    "birch_slab": bytes((215, 193, 133)),
+    "birch_stairs": bytes((215, 193, 133)),
+    "birch_trapdoor": bytes((158, 139, 97)),
+    "birch_wall_sign": bytes((215, 193, 133)),
+    "birch_wood": bytes((255, 255, 255)),
+    "black_banner": bytes((184, 148, 95)),
+    "black_bed": bytes((184, 148, 95)),
+    "black_candle": bytes((26, 24, 39)),
+    "black_candle_cake": bytes((255, 253, 254)),
+    "black_carpet": bytes((28, 28, 32)),
+    "black_concrete": bytes((9, 11, 16)),
+    "black_concrete_powder": bytes((28, 30, 34)),
+    "black_glazed_terracotta": bytes((142, 32, 32)),
+    "black_shulker_box": bytes((31, 31, 35)),
+    "black_stained_glass": bytes((25, 25, 25)),
+    "black_stained_glass_pane": bytes((25, 25, 25)),
+    "black_terracotta": bytes((37, 22, 16)),
+    "black_wall_banner": bytes((184, 148, 95)),
+    "black_wool": bytes((28, 28, 32)),
+    "blackstone": bytes((39, 34, 28)),
+    "blackstone_slab": bytes((49, 44, 54)),
+    "blackstone_stairs": bytes((49, 44, 54)),
+    "blackstone_wall": bytes((39, 34, 28)),
+    "blast_furnace": bytes((73, 72, 72)),
+    "blue_banner": bytes((184, 148, 95)),
+    "blue_bed": bytes((184, 148, 95)),
+    "blue_candle": bytes((53, 71, 154)),
+    "blue_candle_cake": bytes((255, 253, 254)),
+    "blue_carpet": bytes((62, 77, 178)),
+    "blue_concrete": bytes((44, 46, 143)),
+    "blue_concrete_powder": bytes((69, 72, 165)),
+    "blue_glazed_terracotta": bytes((44, 46, 143)),
+    "blue_ice": bytes((108, 163, 253)),
+    "blue_orchid": bytes((39, 169, 244)),
+    "blue_shulker_box": bytes((51, 53, 155)),
+    "blue_stained_glass": bytes((51, 76, 178)),
+    "blue_stained_glass_pane": bytes((51, 76, 178)),
+    "blue_terracotta": bytes((74, 59, 91)),
+    "blue_wall_banner": bytes((184, 148, 95)),
+    "blue_wool": bytes((62, 77, 178)),
+    "bone_block": bytes((233, 230, 212)),
+    "bookshelf": bytes((179, 140, 81)),
+    "brain_coral": bytes((157, 47, 119)),
+    "brain_coral_block": bytes((191, 70, 146)),
+    "brain_coral_fan": bytes((191, 70, 146)),
+    "brain_coral_wall_fan": bytes((191, 70, 146)),
+    "brewing_stand": bytes((49, 49, 49)),
+    "brick_slab": bytes((155, 86, 67)),
+    "brick_stairs": bytes((155, 86, 67)),
+    "brick_wall": bytes((155, 86, 67)),
+    "bricks": bytes((155, 86, 67)),
+    "brown_banner": bytes((184, 148, 95)),
+    "brown_bed": bytes((184, 148, 95)),
+    "brown_candle": bytes((100, 61, 33)),
+    "brown_candle_cake": bytes((255, 253, 254)),
+    "brown_carpet": bytes((126, 80, 47)),
+    "brown_concrete": bytes((97, 60, 32)),
+    "brown_concrete_powder": bytes((124, 82, 52)),
+    "brown_glazed_terracotta": bytes((131, 84, 50)),
+    "brown_mushroom": bytes((204, 153, 120)),
+    "brown_mushroom_block": bytes((151, 114, 81)),
+    "brown_shulker_box": bytes((115, 72, 40)),
+    "brown_stained_glass": bytes((102, 76, 51)),
+    "brown_stained_glass_pane": bytes((102, 76, 51)),
+    "brown_terracotta": bytes((77, 52, 36)),
+    "brown_wall_banner": bytes((184, 148, 95)),
+    "brown_wool": bytes((126, 80, 47)),
+    "bubble_column": bytes((165, 165, 165)),
+    "bubble_coral": bytes((165, 29, 165)),
+    "bubble_coral_block": bytes((165, 29, 165)),
+    "bubble_coral_fan": bytes((165, 29, 165)),
+    "bubble_coral_wall_fan": bytes((165, 29, 165)),
+    "budding_amethyst": bytes((122, 91, 181)),
+    "cactus": bytes((82, 125, 38)),
+    "cake": bytes((255, 253, 254)),
+    "calcite": bytes((217, 219, 215)),
+    "campfire": bytes((58, 72, 95)),
+    "candle": bytes((230, 185, 140)),
+    "candle_cake": bytes((255, 253, 254)),
+    "carrots": bytes((43, 112, 42)),
+    "cartography_table": bytes((79, 50, 24)),
+    "carved_pumpkin": bytes((196, 111, 20)),
+    "cauldron": bytes((79, 79, 79)),
+    "cave_vines": bytes((112, 146, 45)),
+    "cave_vines_plant": bytes((80, 114, 51)),
+    "chain": bytes((37, 44, 61)),
+    "chain_command_block": bytes((118, 178, 151)),
+    "chest": bytes((184, 148, 95)),
+    "chipped_anvil": bytes((66, 66, 66)),
+    "chiseled_deepslate": bytes((36, 36, 36)),
+    "chiseled_nether_bricks": bytes((48, 24, 28)),
+    "chiseled_polished_blackstone": bytes((78, 75, 84)),
+    "chiseled_quartz_block": bytes((238, 234, 230)),
+    "chiseled_red_sandstone": bytes((159, 78, 11)),
+    "chiseled_sandstone": bytes((218, 210, 163)),
+    "chiseled_stone_bricks": bytes((90, 89, 90)),
+    "chorus_flower": bytes((91, 52, 91)),
+    "chorus_plant": bytes((91, 52, 91)),
+    "clay": bytes((161, 167, 177)),
+    "coal_block": bytes((21, 21, 21)),
+    "coal_ore": bytes((116, 116, 116)),
+    "coarse_dirt": bytes((121, 85, 58)),
+    "cobbled_deepslate": bytes((74, 74, 79)),
+    "cobbled_deepslate_slab": bytes((74, 74, 79)),
+    "cobbled_deepslate_stairs": bytes((74, 74, 79)),
+    "cobbled_deepslate_wall": bytes((74, 74, 79)),
+    "cobblestone": bytes((136, 135, 136)),
+    "cobblestone_slab": bytes((136, 135, 136)),
+    "cobblestone_stairs": bytes((136, 135, 136)),
+    "cobblestone_wall": bytes((136, 135, 136)),
+    "cobweb": bytes((255, 255, 255)),
+    "cocoa": bytes((203, 142, 83)),
+    "command_block": bytes((199, 126, 79)),
+    "comparator": bytes((187, 187, 187)),
+    "composter": bytes((180, 117, 62)),
+    "conduit": bytes((180, 136, 107)),
+    "copper_block": bytes((200, 116, 86)),
+    "copper_ore": bytes((127, 127, 127)),
+    "cornflower": bytes((87, 140, 77)),
+    "cracked_deepslate_bricks": bytes((56, 55, 55)),
+    "cracked_deepslate_tiles": bytes((45, 45, 45)),
+    "cracked_nether_bricks": bytes((25, 13, 16)),
+    "cracked_polished_blackstone_bricks": bytes((49, 44, 54)),
+    "cracked_stone_bricks": bytes((127, 127, 127)),
+    "crafting_table": bytes((175, 143, 85)),
+    "creeper_head": bytes((73, 55, 44)),
+    "creeper_wall_head": bytes((73, 55, 44)),
+    "crimson_button": bytes((126, 58, 86)),
+    "crimson_door": bytes((92, 48, 66)),
+    "crimson_fence": bytes((126, 58, 86)),
+    "crimson_fence_gate": bytes((126, 58, 86)),
+    "crimson_fungus": bytes((82, 24, 16)),
+    "crimson_hyphae": bytes((82, 24, 16)),
+    "crimson_nylium": bytes((123, 0, 0)),
+    "crimson_planks": bytes((126, 58, 86)),
+    "crimson_pressure_plate": bytes((126, 58, 86)),
+    "crimson_roots": bytes((146, 6, 54)),
+    "crimson_sign": bytes((126, 58, 86)),
+    "crimson_slab": bytes((126, 58, 86)),
+    "crimson_stairs": bytes((126, 58, 86)),
+    "crimson_stem": bytes((82, 24, 16)),
+    "crimson_trapdoor": bytes((92, 48, 66)),
+    "crimson_wall_sign": bytes((126, 58, 86)),
+    "crying_obsidian": bytes((6, 3, 11)),
+    "cut_copper": bytes((227, 130, 108)),
+    "cut_copper_slab": bytes((227, 130, 108)),
+    "cut_copper_stairs": bytes((227, 130, 108)),
+    "cut_red_sandstone": bytes((192, 104, 34)),
+    "cut_red_sandstone_slab": bytes((187, 102, 34)),
+    "cut_sandstone": bytes((218, 210, 163)),
+    "cut_sandstone_slab": bytes((227, 219, 176)),
+    "cyan_banner": bytes((184, 148, 95)),
+    "cyan_bed": bytes((184, 148, 95)),
+    "cyan_candle": bytes((15, 105, 104)),
+    "cyan_candle_cake": bytes((255, 253, 254)),
+    "cyan_carpet": bytes((22, 150, 152)),
+    "cyan_concrete": bytes((21, 119, 136)),
+    "cyan_concrete_powder": bytes((37, 140, 154)),
+    "cyan_glazed_terracotta": bytes((21, 119, 136)),
+    "cyan_shulker_box": bytes((22, 135, 146)),
+    "cyan_stained_glass": bytes((76, 127, 153)),
+    "cyan_stained_glass_pane": bytes((76, 127, 153)),
+    "cyan_terracotta": bytes((86, 90, 90)),
+    "cyan_wall_banner": bytes((184, 148, 95)),
+    "cyan_wool": bytes((22, 150, 152)),
+    "damaged_anvil": bytes((56, 56, 56)),
+    "dandelion": bytes((255, 236, 79)),
+    "dark_oak_button": bytes((79, 50, 24)),
+    "dark_oak_door": bytes((73, 49, 22)),
+    "dark_oak_fence": bytes((79, 50, 24)),
+    "dark_oak_fence_gate": bytes((79, 50, 24)),
+    "dark_oak_leaves": bytes((183, 185, 183)),
+    "dark_oak_log": bytes((63, 49, 29)),
+    "dark_oak_planks": bytes((79, 50, 24)),
+    "dark_oak_pressure_plate": bytes((79, 50, 24)),
+    "dark_oak_sapling": bytes((16, 82, 16)),
+    "dark_oak_sign": bytes((79, 50, 24)),
+    "dark_oak_slab": bytes((79, 50, 24)),
+    "dark_oak_stairs": bytes((79, 50, 24)),
+    "dark_oak_trapdoor": bytes((73, 49, 22)),
+    "dark_oak_wall_sign": bytes((79, 50, 24)),
+    "dark_oak_wood": bytes((63, 49, 29)),
+    "dark_prismarine": bytes((49, 80, 65)),
+    "dark_prismarine_slab": bytes((49, 80, 65)),
+    "dark_prismarine_stairs": bytes((49, 80, 65)),
+    "daylight_detector": bytes((60, 51, 34)),
+    "dead_brain_coral": bytes((116, 106, 102)),
+    "dead_brain_coral_block": bytes((104, 100, 99)),
+    "dead_brain_coral_fan": bytes((134, 123, 119)),
+    "dead_brain_coral_wall_fan": bytes((134, 123, 119)),
+    "dead_bubble_coral": bytes((134, 123, 119)),
+    "dead_bubble_coral_block": bytes((134, 123, 119)),
+    "dead_bubble_coral_fan": bytes((153, 147, 141)),
+    "dead_bubble_coral_wall_fan": bytes((153, 147, 141)),
+    "dead_bush": bytes((81, 61, 36)),
+    "dead_fire_coral": bytes((116, 106, 102)),
+    "dead_fire_coral_block": bytes((134, 123, 119)),
+    "dead_fire_coral_fan": bytes((93, 90, 89)),
+    "dead_fire_coral_wall_fan": bytes((93, 90, 89)),
+    "dead_horn_coral": bytes((153, 147, 141)),
+    "dead_horn_coral_block": bytes((116, 106, 102)),
+    "dead_horn_coral_fan": bytes((134, 123, 119)),
+    "dead_horn_coral_wall_fan": bytes((134, 123, 119)),
+    "dead_tube_coral": bytes((116, 106, 102)),
+    "dead_tube_coral_block": bytes((134, 123, 119)),
+    "dead_tube_coral_fan": bytes((153, 147, 141)),
+    "dead_tube_coral_wall_fan": bytes((153, 147, 141)),
+    "deepslate": bytes((81, 81, 81)),
+    "deepslate_brick_slab": bytes((88, 88, 88)),
+    "deepslate_brick_stairs": bytes((88, 88, 88)),
+    "deepslate_brick_wall": bytes((88, 88, 88)),
+    "deepslate_bricks": bytes((88, 88, 88)),
+    "deepslate_coal_ore": bytes((81, 81, 81)),
+    "deepslate_copper_ore": bytes((81, 81, 81)),
+    "deepslate_diamond_ore": bytes((81, 81, 81)),
+    "deepslate_emerald_ore": bytes((100, 100, 100)),
+    "deepslate_gold_ore": bytes((81, 81, 81)),
+    "deepslate_iron_ore": bytes((61, 61, 67)),
+    "deepslate_lapis_ore": bytes((100, 100, 100)),
+    "deepslate_redstone_ore": bytes((81, 81, 81)),
+    "deepslate_tile_slab": bytes((45, 45, 45)),
+    "deepslate_tile_stairs": bytes((45, 45, 45)),
+    "deepslate_tile_wall": bytes((45, 45, 45)),
+    "deepslate_tiles": bytes((45, 45, 45)),
+    "detector_rail": bytes((156, 156, 156)),
+    "diamond_block": bytes((101, 245, 227)),
+    "diamond_ore": bytes((127, 127, 127)),
+    "diorite": bytes((233, 233, 233)),
+    "diorite_slab": bytes((233, 233, 233)),
+    "diorite_stairs": bytes((233, 233, 233)),
+    "diorite_wall": bytes((233, 233, 233)),
+    "dirt": bytes((121, 85, 58)),
+    "dirt_path": bytes((144, 117, 64)),
+    "dispenser": bytes((145, 145, 145)),
+    "dragon_egg": bytes((8, 8, 12)),
+    "dragon_head": bytes((73, 55, 44)),
+    "dragon_wall_head": bytes((73, 55, 44)),
+    "dried_kelp_block": bytes((35, 47, 23)),
+    "dripstone_block": bytes((146, 121, 101)),
+    "dropper": bytes((145, 145, 145)),
+    "emerald_block": bytes((23, 197, 68)),
+    "emerald_ore": bytes((127, 127, 127)),
+    "enchanting_table": bytes((162, 41, 41)),
+    "end_gateway": bytes((6, 3, 11)),
+    "end_portal": bytes((6, 3, 11)),
+    "end_portal_frame": bytes((66, 115, 103)),
+    "end_rod": bytes((246, 226, 205)),
+    "end_stone": bytes((213, 218, 148)),
+    "end_stone_brick_slab": bytes((232, 244, 178)),
+    "end_stone_brick_stairs": bytes((232, 244, 178)),
+    "end_stone_brick_wall": bytes((232, 244, 178)),
+    "end_stone_bricks": bytes((232, 244, 178)),
+    "ender_chest": bytes((6, 3, 11)),
+    "exposed_copper": bytes((168, 119, 98)),
+    "exposed_cut_copper": bytes((127, 114, 87)),
+    "exposed_cut_copper_slab": bytes((127, 114, 87)),
+    "exposed_cut_copper_stairs": bytes((127, 114, 87)),
+    "farmland": bytes((85, 46, 15)),
+    "fern": bytes((107, 110, 107)),
+    "fire": bytes((255, 255, 255)),
+    "fire_coral": bytes((121, 26, 38)),
+    "fire_coral_block": bytes((164, 34, 47)),
+    "fire_coral_fan": bytes((121, 26, 38)),
+    "fire_coral_wall_fan": bytes((121, 26, 38)),
+    "fletching_table": bytes((215, 193, 133)),
+    "flower_pot": bytes((137, 76, 59)),
+    "flowering_azalea": bytes((108, 128, 49)),
+    "flowering_azalea_leaves": bytes((80, 105, 44)),
+    "frosted_ice": bytes((128, 173, 251)),
+    "furnace": bytes((145, 145, 145)),
+    "gilded_blackstone": bytes((39, 34, 28)),
+    "glass": bytes((208, 234, 233)),
+    "glass_pane": bytes((208, 234, 233)),
+    "glow_item_frame": bytes((215, 193, 133)),
+    "glow_lichen": bytes((110, 126, 120)),
+    "glowstone": bytes((111, 69, 34)),
+    "gold_block": bytes((255, 216, 62)),
+    "gold_ore": bytes((127, 127, 127)),
+    "granite": bytes((159, 107, 88)),
+    "granite_slab": bytes((159, 107, 88)),
+    "granite_stairs": bytes((159, 107, 88)),
+    "granite_wall": bytes((159, 107, 88)),
+    "grass": bytes((160, 160, 160)),
+    "grass_block": bytes((151, 151, 151)),
+    "gravel": bytes((129, 127, 127)),
+    "gray_banner": bytes((184, 148, 95)),
+    "gray_bed": bytes((184, 148, 95)),
+    "gray_candle": bytes((74, 89, 90)),
+    "gray_candle_cake": bytes((255, 253, 254)),
+    "gray_carpet": bytes((71, 79, 82)),
+    "gray_concrete": bytes((55, 58, 62)),
+    "gray_concrete_powder": bytes((76, 80, 83)),
+    "gray_glazed_terracotta": bytes((54, 57, 61)),
+    "gray_shulker_box": bytes((62, 66, 70)),
+    "gray_stained_glass": bytes((76, 76, 76)),
+    "gray_stained_glass_pane": bytes((76, 76, 76)),
+    "gray_terracotta": bytes((58, 43, 36)),
+    "gray_wall_banner": bytes((184, 148, 95)),
+    "gray_wool": bytes((71, 79, 82)),
+    "green_banner": bytes((184, 148, 95)),
+    "green_bed": bytes((184, 148, 95)),
+    "green_candle": bytes((63, 83, 18)),
+    "green_candle_cake": bytes((255, 253, 254)),
+    "green_carpet": bytes((101, 134, 25)),
+    "green_concrete": bytes((73, 91, 36)),
+    "green_concrete_powder": bytes((93, 113, 48)),
+    "green_glazed_terracotta": bytes((73, 91, 36)),
+    "green_shulker_box": bytes((84, 109, 28)),
+    "green_stained_glass": bytes((102, 127, 51)),
+    "green_stained_glass_pane": bytes((102, 127, 51)),
+    "green_terracotta": bytes((75, 82, 41)),
+    "green_wall_banner": bytes((184, 148, 95)),
+    "green_wool": bytes((101, 134, 25)),
+    "grindstone": bytes((116, 116, 116)),
+    "hanging_roots": bytes((173, 125, 101)),
+    "hay_block": bytes((171, 146, 37)),
+    "heavy_weighted_pressure_plate": bytes((230, 230, 230)),
+    "honey_block": bytes((253, 193, 52)),
+    "honeycomb_block": bytes((232, 140, 8)),
+    "hopper": bytes((73, 72, 72)),
+    "horn_coral": bytes((209, 179, 65)),
+    "horn_coral_block": bytes((213, 203, 62)),
+    "horn_coral_fan": bytes((209, 179, 65)),
+    "horn_coral_wall_fan": bytes((209, 179, 65)),
+    "ice": bytes((146, 185, 254)),
+    "infested_chiseled_stone_bricks": bytes((90, 89, 90)),
+    "infested_cobblestone": bytes((136, 135, 136)),
+    "infested_cracked_stone_bricks": bytes((127, 127, 127)),
+    "infested_deepslate": bytes((81, 81, 81)),
+    "infested_mossy_stone_bricks": bytes((127, 127, 127)),
+    "infested_stone": bytes((127, 127, 127)),
+    "infested_stone_bricks": bytes((127, 127, 127)),
+    "iron_bars": bytes((114, 121, 110)),
+    "iron_block": bytes((230, 230, 230)),
+    "iron_door": bytes((205, 202, 202)),
+    "iron_ore": bytes((127, 127, 127)),
+    "iron_trapdoor": bytes((209, 207, 207)),
+    "item_frame": bytes((215, 193, 133)),
+    "jack_o_lantern": bytes((196, 111, 20)),
+    "jigsaw": bytes((16, 16, 16)),
+    "jukebox": bytes((123, 80, 57)),
+    "jungle_button": bytes((184, 135, 100)),
+    "jungle_door": bytes((185, 134, 97)),
+    "jungle_fence": bytes((184, 135, 100)),
+    "jungle_fence_gate": bytes((184, 135, 100)),
+    "jungle_leaves": bytes((136, 135, 135)),
+    "jungle_log": bytes((89, 70, 26)),
+    "jungle_planks": bytes((184, 135, 100)),
+    "jungle_pressure_plate": bytes((184, 135, 100)),
+    "jungle_sapling": bytes((43, 74, 12)),
+    "jungle_sign": bytes((184, 135, 100)),
+    "jungle_slab": bytes((184, 135, 100)),
+    "jungle_stairs": bytes((184, 135, 100)),
+    "jungle_trapdoor": bytes((177, 128, 92)),
+    "jungle_wall_sign": bytes((184, 135, 100)),
+    "jungle_wood": bytes((89, 70, 26)),
+    "kelp": bytes((89, 171, 48)),
+    "kelp_plant": bytes((92, 131, 50)),
+    "ladder": bytes((103, 80, 44)),
+    "lantern": bytes((62, 68, 83)),
+    "lapis_block": bytes((30, 66, 133)),
+    "lapis_ore": bytes((127, 127, 127)),
+    "large_amethyst_bud": bytes((141, 106, 204)),
+    "large_fern": bytes((115, 117, 115)),
+    "lava": bytes((209, 79, 12)),
+    "lava_cauldron": bytes((79, 79, 79)),
+    "lectern": bytes((181, 141, 80)),
+    "lever": bytes((136, 135, 136)),
+    "light": bytes((255, 251, 30)),
+    "light_blue_banner": bytes((184, 148, 95)),
+    "light_blue_bed": bytes((184, 148, 95)),
+    "light_blue_candle": bytes((32, 133, 197)),
+    "light_blue_candle_cake": bytes((255, 253, 254)),
+    "light_blue_carpet": bytes((78, 197, 231)),
+    "light_blue_concrete": bytes((35, 137, 199)),
+    "light_blue_concrete_powder": bytes((74, 182, 212)),
+    "light_blue_glazed_terracotta": bytes((58, 179, 218)),
+    "light_blue_shulker_box": bytes((59, 180, 219)),
+    "light_blue_stained_glass": bytes((102, 153, 216)),
+    "light_blue_stained_glass_pane": bytes((102, 153, 216)),
+    "light_blue_terracotta": bytes((112, 108, 138)),
+    "light_blue_wall_banner": bytes((184, 148, 95)),
+    "light_blue_wool": bytes((78, 197, 231)),
+    "light_gray_banner": bytes((184, 148, 95)),
+    "light_gray_bed": bytes((184, 148, 95)),
+    "light_gray_candle": bytes((106, 109, 98)),
+    "light_gray_candle_cake": bytes((255, 253, 254)),
+    "light_gray_carpet": bytes((153, 153, 147)),
+    "light_gray_concrete": bytes((125, 125, 115)),
+    "light_gray_concrete_powder": bytes((157, 157, 151)),
+    "light_gray_glazed_terracotta": bytes((204, 208, 210)),
+    "light_gray_shulker_box": bytes((140, 140, 131)),
+    "light_gray_stained_glass": bytes((153, 153, 153)),
+    "light_gray_stained_glass_pane": bytes((153, 153, 153)),
+    "light_gray_terracotta": bytes((135, 107, 98)),
+    "light_gray_wall_banner": bytes((184, 148, 95)),
+    "light_gray_wool": bytes((153, 153, 147)),
+    "light_weighted_pressure_plate": bytes((255, 216, 62)),
+    "lightning_rod": bytes((255, 255, 255)),
+    "lilac": bytes((211, 128, 211)),
+    "lily_of_the_valley": bytes((55, 127, 19)),
+    "lily_pad": bytes((150, 150, 150)),
+    "lime_banner": bytes((184, 148, 95)),
+    "lime_bed": bytes((184, 148, 95)),
+    "lime_candle": bytes((90, 165, 16)),
+    "lime_candle_cake": bytes((255, 253, 254)),
+    "lime_carpet": bytes((134, 204, 38)),
+    "lime_concrete": bytes((94, 169, 24)),
+    "lime_concrete_powder": bytes((122, 186, 40)),
+    "lime_glazed_terracotta": bytes((128, 199, 31)),
+    "lime_shulker_box": bytes((113, 188, 24)),
+    "lime_stained_glass": bytes((127, 204, 25)),
+    "lime_stained_glass_pane": bytes((127, 204, 25)),
+    "lime_terracotta": bytes((103, 117, 52)),
+    "lime_wall_banner": bytes((184, 148, 95)),
+    "lime_wool": bytes((134, 204, 38)),
+    "lodestone": bytes((143, 143, 143)),
+    "loom": bytes((82, 65, 39)),
+    "magenta_banner": bytes((184, 148, 95)),
+    "magenta_bed": bytes((184, 148, 95)),
+    "magenta_candle": bytes((156, 40, 148)),
+    "magenta_candle_cake": bytes((255, 253, 254)),
+    "magenta_carpet": bytes((214, 96, 209)),
+    "magenta_concrete": bytes((169, 48, 159)),
+    "magenta_concrete_powder": bytes((197, 91, 188)),
+    "magenta_glazed_terracotta": bytes((199, 78, 189)),
+    "magenta_shulker_box": bytes((186, 63, 175)),
+    "magenta_stained_glass": bytes((178, 76, 216)),
+    "magenta_stained_glass_pane": bytes((178, 76, 216)),
+    "magenta_terracotta": bytes((149, 87, 108)),
+    "magenta_wall_banner": bytes((184, 148, 95)),
+    "magenta_wool": bytes((214, 96, 209)),
+    "magma_block": bytes((101, 40, 40)),
+    "medium_amethyst_bud": bytes((207, 160, 243)),
+    "melon": bytes((167, 172, 29)),
+    "melon_stem": bytes((177, 177, 177)),
+    "moss_block": bytes((100, 114, 51)),
+    "moss_carpet": bytes((100, 114, 51)),
+    "mossy_cobblestone": bytes((82, 93, 57)),
+    "mossy_cobblestone_slab": bytes((82, 93, 57)),
+    "mossy_cobblestone_stairs": bytes((82, 93, 57)),
+    "mossy_cobblestone_wall": bytes((82, 93, 57)),
+    "mossy_stone_brick_slab": bytes((127, 127, 127)),
+    "mossy_stone_brick_stairs": bytes((127, 127, 127)),
+    "mossy_stone_brick_wall": bytes((127, 127, 127)),
+    "mossy_stone_bricks": bytes((127, 127, 127)),
+    "moving_piston": bytes((83, 81, 81)),
+    "mushroom_stem": bytes((211, 204, 196)),
+    "mycelium": bytes((151, 151, 151)),
+    "nether_brick_fence": bytes((48, 24, 28)),
+    "nether_brick_slab": bytes((48, 24, 28)),
+    "nether_brick_stairs": bytes((48, 24, 28)),
+    "nether_brick_wall": bytes((48, 24, 28)),
+    "nether_bricks": bytes((48, 24, 28)),
+    "nether_gold_ore": bytes((101, 40, 40)),
+    "nether_portal": bytes((73, 2, 185)),
+    "nether_quartz_ore": bytes((114, 50, 50)),
+    "nether_sprouts": bytes((17, 155, 133)),
+    "nether_wart": bytes((72, 0, 0)),
+    "nether_wart_block": bytes((123, 0, 0)),
+    "netherite_block": bytes((77, 73, 77)),
+    "netherrack": bytes((101, 40, 40)),
+    "note_block": bytes((41, 40, 32)),
+    "oak_button": bytes((184, 148, 95)),
+    "oak_door": bytes((150, 116, 65)),
+    "oak_fence": bytes((184, 148, 95)),
+    "oak_fence_gate": bytes((184, 148, 95)),
+    "oak_leaves": bytes((152, 153, 152)),
+    "oak_log": bytes((116, 90, 54)),
+    "oak_planks": bytes((184, 148, 95)),
+    "oak_pressure_plate": bytes((184, 148, 95)),
+    "oak_sapling": bytes((112, 83, 46)),
+    "oak_sign": bytes((184, 148, 95)),
+    "oak_slab": bytes((184, 148, 95)),
+    "oak_stairs": bytes((184, 148, 95)),
+    "oak_trapdoor": bytes((156, 121, 74)),
+    "oak_wall_sign": bytes((184, 148, 95)),
+    "oak_wood": bytes((116, 90, 54)),
+    "observer": bytes((70, 66, 66)),
+    "obsidian": bytes((6, 3, 11)),
+    "orange_banner": bytes((184, 148, 95)),
+    "orange_bed": bytes((184, 148, 95)),
+    "orange_candle": bytes((213, 89, 0)),
+    "orange_candle_cake": bytes((255, 253, 254)),
+    "orange_carpet": bytes((249, 147, 43)),
+    "orange_concrete": bytes((225, 97, 0)),
+    "orange_concrete_powder": bytes((222, 121, 19)),
+    "orange_glazed_terracotta": bytes((249, 128, 29)),
+    "orange_shulker_box": bytes((245, 116, 16)),
+    "orange_stained_glass": bytes((216, 127, 51)),
+    "orange_stained_glass_pane": bytes((216, 127, 51)),
+    "orange_terracotta": bytes((159, 82, 36)),
+    "orange_tulip": bytes((23, 124, 4)),
+    "orange_wall_banner": bytes((184, 148, 95)),
+    "orange_wool": bytes((249, 147, 43)),
+    "oxeye_daisy": bytes((247, 247, 247)),
+    "oxidized_copper": bytes((89, 178, 146)),
+    "oxidized_cut_copper": bytes((81, 164, 139)),
+    "oxidized_cut_copper_slab": bytes((81, 164, 139)),
+    "oxidized_cut_copper_stairs": bytes((81, 164, 139)),
+    "packed_ice": bytes((146, 185, 254)),
+    "peony": bytes((235, 197, 253)),
+    "petrified_oak_slab": bytes((184, 148, 95)),
+    "pink_banner": bytes((184, 148, 95)),
+    "pink_bed": bytes((184, 148, 95)),
+    "pink_candle": bytes((197, 89, 131)),
+    "pink_candle_cake": bytes((255, 253, 254)),
+    "pink_carpet": bytes((244, 178, 201)),
+    "pink_concrete": bytes((214, 101, 143)),
+    "pink_concrete_powder": bytes((230, 149, 179)),
+    "pink_glazed_terracotta": bytes((244, 181, 203)),
+    "pink_shulker_box": bytes((243, 139, 170)),
+    "pink_stained_glass": bytes((242, 127, 165)),
+    "pink_stained_glass_pane": bytes((242, 127, 165)),
+    "pink_terracotta": bytes((160, 77, 78)),
+    "pink_tulip": bytes((23, 124, 4)),
+    "pink_wall_banner": bytes((184, 148, 95)),
+    "pink_wool": bytes((244, 178, 201)),
+    "piston": bytes((83, 81, 81)),
+    "piston_head": bytes((179, 140, 81)),
+    "player_head": bytes((73, 55, 44)),
+    "player_wall_head": bytes((73, 55, 44)),
+    "podzol": bytes((151, 151, 151)),
+    "pointed_dripstone": bytes((146, 121, 101)),
+    "polished_andesite": bytes((134, 136, 135)),
+    "polished_andesite_slab": bytes((134, 136, 135)),
+    "polished_andesite_stairs": bytes((134, 136, 135)),
+    "polished_basalt": bytes((116, 116, 116)),
+    "polished_blackstone": bytes((60, 57, 71)),
+    "polished_blackstone_brick_slab": bytes((60, 57, 71)),
+    "polished_blackstone_brick_stairs": bytes((60, 57, 71)),
+    "polished_blackstone_brick_wall": bytes((60, 57, 71)),
+    "polished_blackstone_bricks": bytes((60, 57, 71)),
+    "polished_blackstone_button": bytes((60, 57, 71)),
+    "polished_blackstone_pressure_plate": bytes((60, 57, 71)),
+    "polished_blackstone_slab": bytes((60, 57, 71)),
+    "polished_blackstone_stairs": bytes((60, 57, 71)),
+    "polished_blackstone_wall": bytes((60, 57, 71)),
+    "polished_deepslate": bytes((88, 88, 88)),
+    "polished_deepslate_slab": bytes((88, 88, 88)),
+    "polished_deepslate_stairs": bytes((88, 88, 88)),
+    "polished_deepslate_wall": bytes((88, 88, 88)),
+    "polished_diorite": bytes((200, 201, 200)),
+    "polished_diorite_slab": bytes((200, 201, 200)),
+    "polished_diorite_stairs": bytes((200, 201, 200)),
+    "polished_granite": bytes((159, 107, 88)),
+    "polished_granite_slab": bytes((159, 107, 88)),
+    "polished_granite_stairs": bytes((159, 107, 88)),
+    "poppy": bytes((237, 48, 44)),
+    "potatoes": bytes((43, 112, 42)),
+    "potted_acacia_sapling": bytes((124, 94, 18)),
+    "potted_allium": bytes((210, 166, 246)),
+    "potted_azalea_bush": bytes((100, 114, 51)),
+    "potted_azure_bluet": bytes((85, 171, 45)),
+    "potted_bamboo": bytes((137, 76, 59)),
+    "potted_birch_sapling": bytes((108, 158, 56)),
+    "potted_blue_orchid": bytes((39, 169, 244)),
+    "potted_brown_mushroom": bytes((204, 153, 120)),
+    "potted_cactus": bytes((137, 76, 59)),
+    "potted_cornflower": bytes((87, 140, 77)),
+    "potted_crimson_fungus": bytes((82, 24, 16)),
+    "potted_crimson_roots": bytes((102, 6, 39)),
+    "potted_dandelion": bytes((255, 236, 79)),
+    "potted_dark_oak_sapling": bytes((16, 82, 16)),
+    "potted_dead_bush": bytes((81, 61, 36)),
+    "potted_fern": bytes((107, 110, 107)),
+    "potted_flowering_azalea_bush": bytes((100, 114, 51)),
+    "potted_jungle_sapling": bytes((43, 74, 12)),
+    "potted_lily_of_the_valley": bytes((55, 127, 19)),
+    "potted_oak_sapling": bytes((112, 83, 46)),
+    "potted_orange_tulip": bytes((23, 124, 4)),
+    "potted_oxeye_daisy": bytes((247, 247, 247)),
+    "potted_pink_tulip": bytes((23, 124, 4)),
+    "potted_poppy": bytes((237, 48, 44)),
+    "potted_red_mushroom": bytes((226, 18, 18)),
+    "potted_red_tulip": bytes((23, 124, 4)),
+    "potted_spruce_sapling": bytes((34, 53, 34)),
+    "potted_warped_fungus": bytes((20, 180, 133)),
+    "potted_warped_roots": bytes((22, 126, 134)),
+    "potted_white_tulip": bytes((85, 171, 45)),
+    "potted_wither_rose": bytes((56, 69, 26)),
+    "powder_snow": bytes((255, 255, 255)),
+    "powder_snow_cauldron": bytes((79, 79, 79)),
+    "powered_rail": bytes((156, 156, 156)),
+    "prismarine": bytes((155, 203, 191)),
+    "prismarine_brick_slab": bytes((110, 185, 174)),
+    "prismarine_brick_stairs": bytes((110, 185, 174)),
+    "prismarine_bricks": bytes((110, 185, 174)),
+    "prismarine_slab": bytes((155, 203, 191)),
+    "prismarine_stairs": bytes((155, 203, 191)),
+    "prismarine_wall": bytes((155, 203, 191)),
+    "pumpkin": bytes((227, 138, 29)),
+    "pumpkin_stem": bytes((139, 141, 139)),
+    "purple_banner": bytes((184, 148, 95)),
+    "purple_bed": bytes((184, 148, 95)),
+    "purple_candle": bytes((98, 28, 156)),
+    "purple_candle_cake": bytes((255, 253, 254)),
+    "purple_carpet": bytes((151, 67, 205)),
+    "purple_concrete": bytes((101, 32, 157)),
+    "purple_concrete_powder": bytes((124, 51, 172)),
+    "purple_glazed_terracotta": bytes((137, 50, 184)),
+    "purple_shulker_box": bytes((116, 38, 169)),
+    "purple_stained_glass": bytes((127, 63, 178)),
+    "purple_stained_glass_pane": bytes((127, 63, 178)),
+    "purple_terracotta": bytes((115, 68, 84)),
+    "purple_wall_banner": bytes((184, 148, 95)),
+    "purple_wool": bytes((151, 67, 205)),
+    "purpur_block": bytes((178, 134, 178)),
+    "purpur_pillar": bytes((178, 134, 178)),
+    "purpur_slab": bytes((178, 134, 178)),
+    "purpur_stairs": bytes((178, 134, 178)),
+    "quartz_block": bytes((238, 234, 230)),
+    "quartz_bricks": bytes((238, 234, 230)),
+    "quartz_pillar": bytes((242, 239, 237)),
+    "quartz_slab": bytes((238, 234, 230)),
+    "quartz_stairs": bytes((238, 234, 230)),
+    "rail": bytes((103, 80, 44)),
+    "raw_copper_block": bytes((157, 87, 63)),
+    "raw_gold_block": bytes((201, 140, 28)),
+    "raw_iron_block": bytes((175, 142, 119)),
+    "red_banner": bytes((184, 148, 95)),
+    "red_bed": bytes((184, 148, 95)),
+    "red_candle": bytes((144, 33, 32)),
+    "red_candle_cake": bytes((255, 253, 254)),
+    "red_carpet": bytes((184, 52, 44)),
+    "red_concrete": bytes((142, 32, 32)),
+    "red_concrete_powder": bytes((164, 51, 50)),
+    "red_glazed_terracotta": bytes((176, 46, 38)),
+    "red_mushroom": bytes((226, 18, 18)),
+    "red_mushroom_block": bytes((195, 40, 38)),
+    "red_nether_brick_slab": bytes((68, 5, 7)),
+    "red_nether_brick_stairs": bytes((68, 5, 7)),
+    "red_nether_brick_wall": bytes((68, 5, 7)),
+    "red_nether_bricks": bytes((68, 5, 7)),
+    "red_sand": bytes((191, 103, 33)),
+    "red_sandstone": bytes((187, 102, 34)),
+    "red_sandstone_slab": bytes((187, 102, 34)),
+    "red_sandstone_stairs": bytes((187, 102, 34)),
+    "red_sandstone_wall": bytes((192, 104, 34)),
+    "red_shulker_box": bytes((156, 37, 34)),
+    "red_stained_glass": bytes((153, 51, 51)),
+    "red_stained_glass_pane": bytes((153, 51, 51)),
+    "red_terracotta": bytes((141, 59, 46)),
+    "red_tulip": bytes((23, 124, 4)),
+    "red_wall_banner": bytes((184, 148, 95)),
+    "red_wool": bytes((184, 52, 44)),
+    "redstone_block": bytes((230, 32, 8)),
+    "redstone_lamp": bytes((59, 32, 21)),
+    "redstone_ore": bytes((127, 127, 127)),
+    "redstone_torch": bytes((253, 0, 0)),
+    "redstone_wall_torch": bytes((253, 0, 0)),
+    "redstone_wire": bytes((254, 254, 254)),
+    "repeater": bytes((139, 141, 139)),
+    "repeating_command_block": bytes((106, 79, 199)),
+    "respawn_anchor": bytes((87, 63, 127)),
+    "rooted_dirt": bytes((121, 85, 58)),
+    "rose_bush": bytes((191, 37, 41)),
+    "sand": bytes((218, 207, 163)),
+    "sandstone": bytes((227, 219, 176)),
+    "sandstone_slab": bytes((227, 219, 176)),
+    "sandstone_stairs": bytes((227, 219, 176)),
+    "sandstone_wall": bytes((218, 210, 163)),
+    "scaffolding": bytes((171, 115, 65)),
+    "sculk_sensor": bytes((6, 38, 45)),
+    "sea_lantern": bytes((227, 235, 228)),
+    "sea_pickle": bytes((108, 114, 42)),
+    "seagrass": bytes((47, 130, 0)),
+    "short_grass": bytes((160, 160, 160)),
+    "shroomlight": bytes((254, 172, 109)),
+    "shulker_box": bytes((151, 105, 151)),
+    "skeleton_skull": bytes((73, 55, 44)),
+    "skeleton_wall_skull": bytes((73, 55, 44)),
+    "slime_block": bytes((115, 194, 98)),
+    "small_amethyst_bud": bytes((100, 71, 158)),
+    "small_dripleaf": bytes((112, 146, 45)),
+    "smithing_table": bytes((47, 20, 17)),
+    "smoker": bytes((80, 78, 78)),
+    "smooth_basalt": bytes((79, 75, 79)),
+    "smooth_quartz": bytes((238, 234, 230)),
+    "smooth_quartz_slab": bytes((238, 234, 230)),
+    "smooth_quartz_stairs": bytes((238, 234, 230)),
+    "smooth_red_sandstone": bytes((187, 102, 34)),
+    "smooth_red_sandstone_slab": bytes((187, 102, 34)),
+    "smooth_red_sandstone_stairs": bytes((187, 102, 34)),
+    "smooth_sandstone": bytes((227, 219, 176)),
+    "smooth_sandstone_slab": bytes((227, 219, 176)),
+    "smooth_sandstone_stairs": bytes((227, 219, 176)),
+    "smooth_stone": bytes((168, 168, 168)),
+    "smooth_stone_slab": bytes((168, 168, 168)),
+    "snow": bytes((255, 255, 255)),
+    "snow_block": bytes((255, 255, 255)),
+    "soul_campfire": bytes((58, 72, 95)),
+    "soul_fire": bytes((255, 255, 255)),
+    "soul_lantern": bytes((62, 68, 83)),
+    "soul_sand": bytes((73, 55, 44)),
+    "soul_soil": bytes((73, 55, 44)),
+    "soul_torch": bytes((159, 127, 80)),
+    "soul_wall_torch": bytes((159, 127, 80)),
+    "spawner": bytes((24, 44, 57)),
+    "sponge": bytes((205, 206, 74)),
+    "spore_blossom": bytes((244, 105, 189)),
+    "spruce_button": bytes((130, 97, 58)),
+    "spruce_door": bytes((128, 94, 54)),
+    "spruce_fence": bytes((130, 97, 58)),
+    "spruce_fence_gate": bytes((130, 97, 58)),
+    "spruce_leaves": bytes((138, 138, 138)),
+    "spruce_log": bytes((59, 39, 19)),
+    "spruce_planks": bytes((130, 97, 58)),
+    "spruce_pressure_plate": bytes((130, 97, 58)),
+    "spruce_sapling": bytes((34, 53, 34)),
+    "spruce_sign": bytes((130, 97, 58)),
+    "spruce_slab": bytes((130, 97, 58)),
+    "spruce_stairs": bytes((130, 97, 58)),
+    "spruce_trapdoor": bytes((102, 77, 40)),
+    "spruce_wall_sign": bytes((130, 97, 58)),
+    "spruce_wood": bytes((59, 39, 19)),
+    "sticky_piston": bytes((83, 81, 81)),
+    "stone": bytes((127, 127, 127)),
+    "stone_brick_slab": bytes((127, 127, 127)),
+    "stone_brick_stairs": bytes((127, 127, 127)),
+    "stone_brick_wall": bytes((127, 127, 127)),
+    "stone_bricks": bytes((127, 127, 127)),
+    "stone_button": bytes((127, 127, 127)),
+    "stone_pressure_plate": bytes((127, 127, 127)),
+    "stone_slab": bytes((127, 127, 127)),
+    "stone_stairs": bytes((127, 127, 127)),
+    "stonecutter": bytes((127, 127, 127)),
+    "stripped_acacia_log": bytes((178, 91, 59)),
+    "stripped_acacia_wood": bytes((178, 91, 59)),
+    "stripped_birch_log": bytes((196, 172, 114)),
+    "stripped_birch_wood": bytes((196, 172, 114)),
+    "stripped_crimson_hyphae": bytes((137, 57, 91)),
+    "stripped_crimson_stem": bytes((137, 57, 91)),
+    "stripped_dark_oak_log": bytes((91, 72, 48)),
+    "stripped_dark_oak_wood": bytes((91, 72, 48)),
+    "stripped_jungle_log": bytes((180, 134, 90)),
+    "stripped_jungle_wood": bytes((180, 134, 90)),
+    "stripped_oak_log": bytes((185, 149, 88)),
+    "stripped_oak_wood": bytes((185, 149, 88)),
+    "stripped_spruce_log": bytes((103, 86, 49)),
+    "stripped_spruce_wood": bytes((103, 86, 49)),
+    "stripped_warped_hyphae": bytes((59, 153, 151)),
+    "stripped_warped_stem": bytes((59, 153, 151)),
+    "structure_block": bytes((38, 29, 42)),
+    "structure_void": bytes((15, 72, 78)),
+    "sugar_cane": bytes((130, 168, 89)),
+    "sunflower": bytes((254, 214, 57)),
+    "sweet_berry_bush": bytes((41, 82, 48)),
+    "tall_grass": bytes((172, 170, 172)),
+    "tall_seagrass": bytes((56, 147, 6)),
+    "target": bytes((239, 226, 208)),
+    "terracotta": bytes((150, 93, 67)),
+    "tinted_glass": bytes((39, 37, 40)),
+    "tnt": bytes((234, 67, 24)),
+    "torch": bytes((159, 127, 80)),
+    "trapped_chest": bytes((184, 148, 95)),
+    "tripwire": bytes((143, 143, 143)),
+    "tripwire_hook": bytes((184, 148, 95)),
+    "tube_coral": bytes((49, 79, 221)),
+    "tube_coral_block": bytes((49, 79, 221)),
+    "tube_coral_fan": bytes((63, 108, 229)),
+    "tube_coral_wall_fan": bytes((63, 108, 229)),
+    "tuff": bytes((106, 110, 111)),
+    "turtle_egg": bytes((247, 241, 217)),
+    "twisting_vines": bytes((20, 180, 133)),
+    "twisting_vines_plant": bytes((17, 155, 133)),
+    "vine": bytes((131, 131, 131)),
+    "wall_torch": bytes((159, 127, 80)),
+    "warped_button": bytes((57, 131, 130)),
+    "warped_door": bytes((57, 131, 130)),
+    "warped_fence": bytes((57, 131, 130)),
+    "warped_fence_gate": bytes((57, 131, 130)),
+    "warped_fungus": bytes((20, 180, 133)),
+    "warped_hyphae": bytes((69, 45, 92)),
+    "warped_nylium": bytes((22, 97, 91)),
+    "warped_planks": bytes((57, 131, 130)),
+    "warped_pressure_plate": bytes((57, 131, 130)),
+    "warped_roots": bytes((22, 126, 134)),
+    "warped_sign": bytes((57, 131, 130)),
+    "warped_slab": bytes((57, 131, 130)),
+    "warped_stairs": bytes((57, 131, 130)),
+    "warped_stem": bytes((69, 45, 92)),
+    "warped_trapdoor": bytes((46, 95, 81)),
+    "warped_wall_sign": bytes((57, 131, 130)),
+    "warped_wart_block": bytes((22, 126, 134)),
+    "water": bytes((165, 165, 165)),
+    "water_cauldron": bytes((79, 79, 79)),
+    "waxed_copper_block": bytes((200, 116, 86)),
+    "waxed_cut_copper": bytes((227, 130, 108)),
+    "waxed_cut_copper_slab": bytes((227, 130, 108)),
+    "waxed_cut_copper_stairs": bytes((227, 130, 108)),
+    "waxed_exposed_copper": bytes((168, 119, 98)),
+    "waxed_exposed_cut_copper": bytes((127, 114, 87)),
+    "waxed_exposed_cut_copper_slab": bytes((127, 114, 87)),
+    "waxed_exposed_cut_copper_stairs": bytes((127, 114, 87)),
+    "waxed_oxidized_copper": bytes((89, 178, 146)),
+    "waxed_oxidized_cut_copper": bytes((81, 164, 139)),
+    "waxed_oxidized_cut_copper_slab": bytes((81, 164, 139)),
+    "waxed_oxidized_cut_copper_stairs": bytes((81, 164, 139)),
+    "waxed_weathered_copper": bytes((100, 160, 119)),
+    "waxed_weathered_cut_copper": bytes((100, 160, 119)),
+    "waxed_weathered_cut_copper_slab": bytes((100, 160, 119)),
+    "waxed_weathered_cut_copper_stairs": bytes((100, 160, 119)),
+    "weathered_copper": bytes((100, 160, 119)),
+    "weathered_cut_copper": bytes((100, 160, 119)),
+    "weathered_cut_copper_slab": bytes((100, 160, 119)),
+    "weathered_cut_copper_stairs": bytes((100, 160, 119)),
+    "weeping_vines": bytes((90, 0, 0)),
+    "weeping_vines_plant": bytes((123, 0, 0)),
+    "wet_sponge": bytes((176, 191, 76)),
+    "wheat": bytes((166, 149, 83)),
+    "white_banner": bytes((184, 148, 95)),
+    "white_bed": bytes((184, 148, 95)),
+    "white_candle": bytes((199, 211, 211)),
+    "white_candle_cake": bytes((255, 253, 254)),
+    "white_carpet": bytes((254, 254, 254)),
+    "white_concrete": bytes((207, 213, 214)),
+    "white_concrete_powder": bytes((224, 226, 226)),
+    "white_glazed_terracotta": bytes((249, 255, 254)),
+    "white_shulker_box": bytes((230, 234, 234)),
+    "white_stained_glass": bytes((255, 255, 255)),
+    "white_stained_glass_pane": bytes((255, 255, 255)),
+    "white_terracotta": bytes((210, 177, 161)),
+    "white_tulip": bytes((85, 171, 45)),
+    "white_wall_banner": bytes((184, 148, 95)),
+    "white_wool": bytes((254, 254, 254)),
+    "wither_rose": bytes((56, 69, 26)),
+    "wither_skeleton_skull": bytes((73, 55, 44)),
+    "wither_skeleton_wall_skull": bytes((73, 55, 44)),
+    "yellow_banner": bytes((184, 148, 95)),
+    "yellow_bed": bytes((184, 148, 95)),
+    "yellow_candle": bytes((197, 152, 37)),
+    "yellow_candle_cake": bytes((255, 253, 254)),
+    "yellow_carpet": bytes((254, 217, 63)),
+    "yellow_concrete": bytes((241, 175, 21)),
+    "yellow_concrete_powder": bytes((237, 201, 51)),
+    "yellow_glazed_terracotta": bytes((255, 236, 157)),
+    "yellow_shulker_box": bytes((252, 199, 36)),
+    "yellow_stained_glass": bytes((229, 229, 51)),
+    "yellow_stained_glass_pane": bytes((229, 229, 51)),
+    "yellow_terracotta": bytes((184, 131, 34)),
+    "yellow_wall_banner": bytes((184, 148, 95)),
+    "yellow_wool": bytes((254, 217, 63)),
+    "zombie_head": bytes((73, 55, 44)),
+    "zombie_wall_head": bytes((73, 55, 44)),
+
+}
+
+# TODO: figure out how to color blocks correctly based on biome
+# These are kept when find_colors.py regenerates the colors from the game
+color_overrides = {
+
+    "acacia_leaves": bytes((0, 109, 0)),
+    "attached_melon_stem": bytes((0, 106, 0)),
+    "attached_pumpkin_stem": bytes((0, 106, 0)),
+    "birch_leaves": bytes((0, 109, 0)),
+    "dark_oak_leaves": bytes((0, 109, 0)),
+    "fire": bytes((255, 0, 0)),
+    "grass": bytes((0, 109, 0)),
+    "grass_block": bytes((109, 153, 48)),
+    "jungle_leaves": bytes((0, 109, 0)),
+    "large_fern": bytes((0, 106, 0)),
+    "melon_stem": bytes((0, 106, 0)),
+    "oak_leaves": bytes((0, 109, 0)),
+    "pumpkin_stem": bytes((0, 106, 0)),
+    "spruce_leaves": bytes((0, 109, 0)),
+    "tall_grass": bytes((0, 109, 0)),
+    "vine": bytes((0, 109, 0)),
+    "water": bytes((55, 55, 220)),
+
+}
+block_colors.update(color_overrides)
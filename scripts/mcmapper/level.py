@@ -1,52 +1,190 @@
-#!/usr/bin/env python3
-
-import nbt
-import os
-
-from datetime import datetime
-from glob import glob
-from mcmapper.filesystem import get_minecraft_basedir
-
-
-game_types = ["Survival", "Creative", "Adventure", "Spectator"]
-dimensions = {"minecraft:the_nether": "nether", "minecraft:overworld": "overworld", "minecraft:the_end": "end"}
-dimension_folders = {
-    "nether": os.path.join("DIM-1", "region"),
-    "overworld": "region",
-    "end": os.path.join("DIM1", "region"),
-    }
-
-
-class PlayerInfo(object):
-    def __init__(self, filename):
-        playerInfo = nbt.nbt.NBTFile(filename)
-        self.dimension = dimensions[playerInfo["Dimension"].value]
-        self.x, self.y, self.z = (t.value for t in playerInfo["Pos"])
-        self.yaw, self.pitch = (t.value for t in playerInfo["Rotation"])
-
-
-class LevelInfo(object):
-    def __init__(self, folder):
-        if not os.path.isdir(os.path.join(folder, "level.dat")):
-            folder = os.path.join(get_minecraft_basedir(), folder)
-        self.folder = folder
-        base = nbt.nbt.NBTFile(os.path.join(folder, "level.dat"))["Data"]
-        self.spawnX = base["SpawnX"].value
-        self.spawnZ = base["SpawnZ"].value
-        self.name = base["LevelName"]
-        self.game_type = game_types[base["Player"]["playerGameType"].value]
-        self.last_played = datetime.fromtimestamp(
-            base["LastPlayed"].value/1000).strftime("%Y-%m-%d %H:%M:%S")
-
-    def get_players(self):
-        filenames = glob(os.path.join(self.folder, "playerdata", "*.dat"))
-        return [PlayerInfo(f) for f in filenames]
-
-    def get_regions(self, dimension):
-        return glob(os.path.join(self.folder, dimension_folders[dimension], "*.mca"))
-
-    def get_region(self, dimension, x, z):
-        filename = os.path.join(self.folder, dimension_folders[dimension], "r.%s.%s.mca" % (x, z))
-        if not os.path.isfile(filename):
-            raise Exception("No such region: %s(%s, %s)" % (dimension, x, z))
-        return nbt.region.RegionFile(filename)
+#!/usr/bin/env python3
+
+import json
+import os
+import zlib
+
+from datetime import datetime
+from glob import glob
+from mcmapper import nbtreader
+from mcmapper.filesystem import get_data_root, get_minecraft_basedir, get_minecraft_savedirs
+from mcmapper.region import RegionFile
+
+
+game_types = ["Survival", "Creative", "Adventure", "Spectator"]
+dimensions = {"minecraft:the_nether": "nether", "minecraft:overworld": "overworld", "minecraft:the_end": "end"}
+dimension_folders = {
+    "nether": os.path.join("DIM-1", "region"),
+    "overworld": "region",
+    "end": os.path.join("DIM1", "region"),
+    }
+# Points of interest such as nether portals and beds, in the same region
+# layout as the chunks (worlds from 1.14 on)
+poi_folders = {
+    "nether": os.path.join("DIM-1", "poi"),
+    "overworld": "poi",
+    "end": os.path.join("DIM1", "poi"),
+    }
+
+# The parts of level.dat used by LevelInfo
+level_tags = {"Data": {
+    "SpawnX": True,
+    "SpawnZ": True,
+    "LevelName": True,
+    "LastPlayed": True,
+    "Player": {"playerGameType": True},
+    }}
+# The parts of level.dat listed for each save
+summary_tags = {"Data": {
+    "LevelName": True,
+    "LastPlayed": True,
+    "Player": {"playerGameType": True},
+    }}
+
+
+def read_nbt_file(filename, select=True):
+    """Parse a gzipped NBT file such as level.dat or a player file
+
+    The file is decompressed a piece at a time, and parsing stops as soon as
+    the selected tags have been read, so the rest of a large file is never
+    decompressed (see nbtreader.parse_prefix).
+    """
+    # 16 + MAX_WBITS expects a gzip header
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    pieces = []
+    read_size = 4096
+    with open(filename, "rb") as f:
+        while select is not True:
+            compressed = f.read(read_size)
+            if not compressed:
+                break
+            pieces.append(decompressor.decompress(compressed))
+            try:
+                return nbtreader.parse_prefix(b"".join(pieces), select)
+            except EOFError:
+                read_size *= 2
+        pieces.append(decompressor.decompress(f.read()))
+    pieces.append(decompressor.flush())
+    # Corrupt files end up here too, and get the full parser's error
+    return nbtreader.parse(b"".join(pieces), select)
+
+
+def format_last_played(last_played):
+    return datetime.fromtimestamp(last_played/1000).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def read_level_summary(folder):
+    """Return the name, game type and last played time (in milliseconds) of a world"""
+    base = read_nbt_file(os.path.join(folder, "level.dat"), summary_tags)["Data"]
+    return {
+        "folder": folder,
+        "name": base["LevelName"],
+        "game_type": game_types[base["Player"]["playerGameType"]],
+        "last_played": base["LastPlayed"],
+        }
+
+
+def iter_saves(folders=None):
+    """Yield the summary of each world in the saves folder (see read_level_summary)
+
+    Summaries are cached by the size and modification time of level.dat, so
+    the worlds that haven't been played since they were last listed are
+    yielded straight away, and only the others have their level.dat read.
+    """
+    if folders is None:
+        folders = get_minecraft_savedirs()
+    filename = os.path.join(get_data_root(), "saves.json")
+    try:
+        with open(filename) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    index, changed = {}, []
+    for folder in folders:
+        try:
+            stat = os.stat(os.path.join(folder, "level.dat"))
+        except FileNotFoundError:
+            continue
+        summary = cache.get(folder)
+        if summary and summary["size"] == stat.st_size and summary["mtime"] == stat.st_mtime_ns:
+            index[folder] = summary
+            yield summary
+        else:
+            changed.append((folder, stat))
+    for folder, stat in changed:
+        try:
+            summary = read_level_summary(folder)
+        except Exception as e:
+            print(f"Couldn't read {folder}: {e}")
+            continue
+        summary["size"] = stat.st_size
+        summary["mtime"] = stat.st_mtime_ns
+        index[folder] = summary
+        yield summary
+    if index != cache:
+        with open(filename + ".tmp", "w") as f:
+            json.dump(index, f)
+        os.replace(filename + ".tmp", filename)
+
+
+def get_saves():
+    """Return the summaries of the worlds in the saves folder, the most recently played first"""
+    return sorted(iter_saves(), key=lambda save: save["last_played"], reverse=True)
+
+
+class PlayerInfo(object):
+    def __init__(self, filename):
+        playerInfo = read_nbt_file(filename, {"Dimension": True, "Pos": True, "Rotation": True})
+        self.dimension = dimensions[playerInfo["Dimension"]]
+        self.x, self.y, self.z = playerInfo["Pos"]
+        self.yaw, self.pitch = playerInfo["Rotation"]
+
+
+class LevelInfo(object):
+    def __init__(self, folder):
+        if not os.path.isdir(os.path.join(folder, "level.dat")):
+            folder = os.path.join(get_minecraft_basedir(), folder)
+        self.folder = folder
+        base = read_nbt_file(os.path.join(folder, "level.dat"), level_tags)["Data"]
+        self.spawnX = base["SpawnX"]
+        self.spawnZ = base["SpawnZ"]
+        self.name = base["LevelName"]
+        self.game_type = game_types[base["Player"]["playerGameType"]]
+        self.last_played = format_last_played(base["LastPlayed"])
+
+    def get_players(self):
+        filenames = glob(os.path.join(self.folder, "playerdata", "*.dat"))
+        return [PlayerInfo(f) for f in filenames]
+
+    def get_last_played(self):
+        """Re-read the time the world was last saved from level.dat, in milliseconds"""
+        base = read_nbt_file(os.path.join(self.folder, "level.dat"), {"Data": {"LastPlayed": True}})
+        return base["Data"]["LastPlayed"]
+
+    def get_region_folder(self, dimension):
+        return os.path.join(self.folder, dimension_folders[dimension])
+
+    def get_regions(self, dimension):
+        return glob(os.path.join(self.get_region_folder(dimension), "*.mca"))
+
+    def get_region_filename(self, dimension, x, z):
+        return os.path.join(self.get_region_folder(dimension), "r.%s.%s.mca" % (x, z))
+
+    def get_region(self, dimension, x, z):
+        filename = self.get_region_filename(dimension, x, z)
+        if not os.path.isfile(filename):
+            raise Exception("No such region: %s(%s, %s)" % (dimension, x, z))
+        return RegionFile(filename)
+
+    def get_poi_folder(self, dimension):
+        return os.path.join(self.folder, poi_folders[dimension])
+
+    def get_poi_regions(self, dimension):
+        return glob(os.path.join(self.get_poi_folder(dimension), "*.mca"))
+
+    def get_poi_region(self, dimension, x, z):
+        """Return the POI region file for a region, or None if it has no points of interest"""
+        filename = os.path.join(self.get_poi_folder(dimension), "r.%s.%s.mca" % (x, z))
+        if not os.path.isfile(filename):
+            return None
+        return RegionFile(filename)
@@ -1,207 +1,632 @@
-import nbt
-import os
-
-from .data import map_colors, block_colors
-from .filesystem import get_data_dir
-from .level import LevelInfo, dimensions
-from PIL import Image
-
-
-def render_map(filename, verbose=False):
-    log = lambda message: None
-    if verbose:
-        log = print
-
-    log("Loading file...")
-    data = nbt.nbt.NBTFile(filename)
-    log("Map version %s" % data["DataVersion"].value)
-    colors_idxs = map_colors.get(data["DataVersion"].value, map_colors[0])
-    colors = data["data"]["colors"].value
-    pixels = []
-    missing = {}
-    log("Generating pixels...")
-    for z in range(128):
-        for x in range(128):
-            idx = z*128+x
-            color = colors_idxs.get(colors[idx])
-            # color = bytes((colors[idx], colors[idx], colors[idx]))
-            if not color:
-                missing[colors[idx]] = True
-                color = bytes((colors[idx], colors[idx], colors[idx]))
-            pixels.append(color)
-
-    if len(missing):
-        log("Missing color indexes:\n  " + "\n  ".join(map(str, sorted(missing.keys()))))
-
-    log("Generating image...")
-    return Image.frombytes("RGB", (128, 128), b"".join(pixels))
-
-
-missing_blocks = {}
-def render_chunk(chunk, layer, heightmap=False):
-    # Show an image of the chunk from above
-    if chunk["Status"].value != "minecraft:full":
-        return Image.frombytes("RGB", (16, 16),
-            b"".join(bytes((0, 0, 0)) for _ in range(256)))
-    elif isinstance(layer, int):
-        heights = [layer for _ in range(256)]
-    else:
-        # In 1.16 and up, heightmaps are 37 longs, each with 7 values of 9 bits.  The last bit of each long
-        # is unused (7*9 = 63), and the last 28 bits of the last long.
-        # The heightmap for an ocean chunk looks like this:
-        #   01: 0000111111000111111000111111000111111000111111000111111000111111
-        #   02: 0000111111000111111000111111000111111000111111000111111000111111
-        #   03: 0000111111000111111000111111000111111000111111000111111000111111
-        #   ...
-        #   37: 0000000000000000000000000000000111111000111111000111111000111111
-        height_data = chunk["Heightmaps"][layer]
-        heights = []
-        for h in height_data:
-            for i in range(7): # 64 // 9
-                # minus one since the height will be the air block above the solid block
-                heights.append((h & 0b111111111) - 1)
-                h = h >> 9
-                if len(heights) == 256:
-                    break
-
-    black = bytes((0, 0, 0))
-    pixels = []
-    sections = {}
-    for z in range(16):
-        for x in range(16):
-            pixel_idx = z*16+x
-            if heightmap:
-                pixels.append(bytes((heights[pixel_idx], heights[pixel_idx], heights[pixel_idx])))
-                continue
-            section_y = heights[pixel_idx] // 16 + chunk["yPos"].value
-            if section_y not in sections:
-                if len(chunk["sections"]) == 0 or section_y == -1:
-                    print('len(chunk["sections"]) == 0 or section_y == -1:')
-                    pixels.append(black)
-                    continue
-                try:
-                    section = next(section for section in chunk["sections"]
-                        if section["Y"].value == section_y)
-                except StopIteration:
-                    try:
-                        section = next(section for section in reversed(chunk["sections"])
-                            if "palette" in section)
-                    except StopIteration:
-                        raise Exception("Weird sections (was looking for %s): %s" % (section_y, [c.tags for c in chunk["sections"]]))
-                # Find the number of bits it takes to represent the largest index in the palette (at least 4)
-                try:
-                    index_len = max((4, len(bin(len(section["block_states"]["palette"])-1))-2))
-                    index_mask = int("1"*index_len, base=2)
-                except KeyError:
-                    pixels.append(black)
-                    continue
-                # data is a list of longs, each of which has some number of indices
-                # Many ocean chunks will have 16 zeros terminating the list of longs
-                blocks = []
-                if "data" in section["block_states"]:
-                    for bs in section["block_states"]["data"]:
-                        blocks.extend((bs & (index_mask << (i*index_len))) >> (i*index_len) for i in range(64//index_len))
-                else:
-                    blocks = [0]
-                sections[section_y] = (section, blocks)
-
-            # Get the chunk section and block states
-            section, blocks = sections[section_y]
-            # The block state is an index into the palette
-            palette_idx = 0 if len(blocks) == 1 else blocks[(heights[pixel_idx]%16)*256+z*16+x]
-            try:
-                block = section["block_states"]["palette"][palette_idx]["Name"].value.replace("minecraft:", "")
-            except IndexError:
-                color = block_colors["magenta_concrete"]
-            else:
-                if block not in block_colors:
-                    missing_blocks[block] = True
-                    color = block_colors["magenta_concrete"]
-                else:
-                    color = block_colors[block]
-            pixels.append(color)
-
-    return Image.frombytes("RGB", (16, 16), b"".join(pixels))
-
-
-def render_region(region, layer="WORLD_SURFACE"):
-    result = Image.new("RGB", (32*16, 32*16))
-    for x in range(32):
-        for z in range(32):
-            try:
-                chunk = region.get_chunk(x, z)
-            except nbt.region.InconceivedChunk:
-                pass
-            else:
-                result.paste(render_chunk(chunk, layer), (x*16, z*16))
-    return result
-
-
-def render_world(world, dimension=None, force=False):
-    print("Loading world...")
-    if type(world) is str:
-        world = LevelInfo(world)
-    dimension = dimension or world.get_players()[0].dimension
-
-    print("Getting regions...")
-    region_files = world.get_regions(dimension)
-    print("Getting bounds...")
-    xMin, xMax, zMin, zMax = 0, 0, 0, 0
-    regions = []
-    for region in region_files:
-        parts = os.path.basename(region).split(".")
-        x = int(parts[1])
-        z = int(parts[2])
-        regions.append((x, z))
-
-        if x < xMin:
-            xMin = x
-        if x > xMax:
-            xMax = x
-        if z < zMin:
-            zMin = z
-        if z > zMax:
-            zMax = z
-
-    # region store 32x32 chunks, chunks are 16x16
-    width = (xMax - xMin + 1) * 32 * 16
-    height = (zMax - zMin + 1) * 32 * 16
-
-    print("Initializing map...")
-    result = Image.new("RGB", (width, height))
-    data_dir = get_data_dir(world.folder)
-
-    renderable_regions = []
-    for idx, region in enumerate(regions):
-        print("\rChecking region %d/%d..." % (idx+1, len(regions)), end="", flush=True)
-        x, z = region
-        try:
-            region = world.get_region(dimension, x, z)
-        except Exception as e:
-            print("\n%s" % e)
-            continue
-        tile_file = os.path.join(data_dir, "%s.%s.%s.png" % (dimension, x, z))
-        if force:
-            renderable_regions.append((x, z))
-        elif os.path.isfile(tile_file) and os.path.getmtime(tile_file) > os.path.getmtime(region.filename):
-            tile = Image.open(tile_file)
-            result.paste(tile, ((x-xMin)*512, (z-zMin)*512))
-        else:
-            renderable_regions.append((x, z))
-    else:
-        print()
-
-    for idx, region in enumerate(renderable_regions):
-        print(f"Rendering region {idx+1}/{len(renderable_regions)}...")
-        x, z = region
-        region = world.get_region(dimension, x, z)
-        tile_file = os.path.join(data_dir, "%s.%s.%s.png" % (dimension, x, z))
-        tile = render_region(region)
-        tile.save(tile_file)
-        result.paste(tile, ((x-xMin)*512, (z-zMin)*512))
-    if len(renderable_regions) > 0:
-        print()
-
-    print("Saving world map...")
-    result_filename = os.path.join(data_dir, "_%s.png" % dimension)
-    result.save(result_filename, "PNG")
+import concurrent.futures
+import hashlib
+import numpy as np
+import os
+import time
+
+from .colors import get_color_table
+from .filesystem import get_data_dir
+from .level import LevelInfo, dimensions, read_nbt_file
+from .pngstream import PNGWriter
+from .region import SECTOR_SIZE, parse_region_name
+from .store import TileStore
+from io import BytesIO
+from PIL import Image
+
+
+# The parts of a map item's .dat file needed to draw it and place it in an atlas
+map_tags = {
+    "DataVersion": True,
+    "data": {"colors": True, "xCenter": True, "zCenter": True, "scale": True, "dimension": True},
+}
+# Map dimensions were numbered before 1.16
+map_dimensions = {0: "overworld", -1: "nether", 1: "end"}
+
+
+def read_map(filename):
+    """Return the colors and position of a map item
+
+    The result has the (128, 128) uint8 color indexes, the game's data
+    version, the block coordinates of the map's center, its scale (each
+    pixel covers 2**scale blocks) and its dimension.
+    """
+    data = read_nbt_file(filename, map_tags)
+    info = data["data"]
+    dimension = info.get("dimension", 0)
+    return {
+        "colors": np.asarray(info["colors"]).view(np.uint8).reshape(128, 128),
+        "version": data.get("DataVersion", 0),
+        "x": info.get("xCenter", 0),
+        "z": info.get("zCenter", 0),
+        "scale": info.get("scale", 0),
+        "dimension": dimensions.get(dimension, map_dimensions.get(dimension, str(dimension))),
+    }
+
+
+def draw_map(colors, version):
+    """Return the (128, 128, 3) pixels of a map item's color indexes, and the indexes missing from the palette
+
+    Missing indexes are drawn in gray, at the brightness of the index.
+    """
+    palette, known = get_color_table().get_map_palette(version)
+    pixels = palette[colors]
+    unknown = ~known[colors]
+    pixels[unknown] = colors[unknown][:, np.newaxis]
+    return pixels, np.unique(colors[unknown]).tolist()
+
+
+def render_map(filename, verbose=False):
+    log = lambda message: None
+    if verbose:
+        log = print
+
+    log("Loading file...")
+    data = read_map(filename)
+    log("Map version %s" % data["version"])
+    log("Generating pixels...")
+    pixels, missing = draw_map(data["colors"], data["version"])
+    if len(missing):
+        log("Missing color indexes:\n  " + "\n  ".join(map(str, missing)))
+
+    log("Generating image...")
+    return Image.fromarray(pixels, "RGB")
+
+
+missing_blocks = {}
+black = np.zeros(3, dtype=np.uint8)
+
+# Blocks are identified by their index into the color table (see
+# colors.ColorTable).  Index 0 is black (nothing to draw) and index 1 is
+# magenta (unknown block).
+BLACK, MISSING = 0, 1
+
+# The parts of a chunk needed to render it
+chunk_tags = {
+    "Status": True,
+    "yPos": True,
+    "Heightmaps": True,
+    "sections": {"Y": True, "block_states": {"palette": {"Name": True}, "data": True}},
+}
+# Stored tiles drawn by a different renderer or color table are redrawn
+RENDERER_VERSION = 1
+# Level 0 has a tile per region, level n has a tile per 2**n by 2**n regions
+PYRAMID_LEVELS = 6
+
+
+def unpack_longs(longs, bits, count):
+    """Unpack `count` values of `bits` bits each from a 1.16+ packed long array"""
+    # Values never span two longs, so each long holds 64//bits values and the
+    # leftover high bits are unused
+    per_long = 64 // bits
+    longs = np.asarray(longs, dtype=np.int64).view(np.uint64)
+    shifts = np.arange(0, per_long*bits, bits, dtype=np.uint64)
+    values = (longs[:, np.newaxis] >> shifts) & np.uint64((1 << bits) - 1)
+    return values.ravel()[:count].astype(np.uint16)
+
+
+def get_heights(chunk, layer):
+    """Return the (16, 16) array of surface heights for a chunk, indexed by [z, x]"""
+    if isinstance(layer, int):
+        return np.full((16, 16), layer, dtype=np.int32)
+    # In 1.16 and up, heightmaps are 37 longs, each with 7 values of 9 bits.  The last bit of each long
+    # is unused (7*9 = 63), and the last 28 bits of the last long.
+    # The heightmap for an ocean chunk looks like this:
+    #   01: 0000111111000111111000111111000111111000111111000111111000111111
+    #   02: 0000111111000111111000111111000111111000111111000111111000111111
+    #   03: 0000111111000111111000111111000111111000111111000111111000111111
+    #   ...
+    #   37: 0000000000000000000000000000000111111000111111000111111000111111
+    heights = unpack_longs(chunk["Heightmaps"][layer], 9, 256)
+    # minus one since the height will be the air block above the solid block
+    return heights.reshape(16, 16).astype(np.int32) - 1
+
+
+def find_section(chunk, section_y):
+    try:
+        return next(section for section in chunk["sections"]
+            if section["Y"] == section_y)
+    except StopIteration:
+        try:
+            return next(section for section in reversed(chunk["sections"])
+                if "palette" in section)
+        except StopIteration:
+            raise Exception("Weird sections (was looking for %s): %s" % (section_y, [list(c) for c in chunk["sections"]]))
+
+
+# Resolved palettes, keyed on the block names.  Most sections in a region
+# share a handful of palettes (ocean, plains, stone...), so each is only
+# resolved once.
+palette_cache = {}
+def get_palette_lut(palette, size):
+    """Return the block ids, missing-block mask and names for a palette
+
+    The arrays have `size` entries so that any palette index can be looked up;
+    indexes past the end of the palette are drawn in magenta.
+    """
+    names = tuple(block["Name"] for block in palette)
+    result = palette_cache.get((names, size))
+    if result is None:
+        block_ids = get_color_table().ids
+        ids = np.full(size, MISSING, dtype=np.uint16)
+        missing = np.zeros(size, dtype=bool)
+        short_names = tuple(name.replace("minecraft:", "") for name in names)
+        for idx, name in enumerate(short_names):
+            if name in block_ids:
+                ids[idx] = block_ids[name]
+            else:
+                missing[idx] = True
+        if len(palette_cache) > 4096:
+            palette_cache.clear()
+        result = palette_cache[(names, size)] = (ids, missing, short_names)
+    return result
+
+
+def get_top_blocks(chunk, layer, heights, ids):
+    """Fill the (16, 16) `heights` and `ids` arrays with the chunk's topmost blocks"""
+    ids[:] = BLACK
+    if chunk["Status"] != "minecraft:full":
+        heights[:] = 0
+        return
+    heights[:] = get_heights(chunk, layer)
+
+    zs, xs = np.indices((16, 16))
+    section_ys = heights // 16 + chunk["yPos"]
+    for section_y in np.unique(section_ys):
+        if len(chunk["sections"]) == 0 or section_y == -1:
+            print('len(chunk["sections"]) == 0 or section_y == -1:')
+            continue
+        section = find_section(chunk, section_y)
+        try:
+            palette = section["block_states"]["palette"]
+        except KeyError:
+            continue
+        # Find the number of bits it takes to represent the largest index in the palette (at least 4)
+        index_len = max(4, (len(palette)-1).bit_length())
+        mask = section_ys == section_y
+        # data is a list of longs, each of which has some number of indices
+        # Many ocean chunks will have 16 zeros terminating the list of longs
+        if "data" in section["block_states"]:
+            blocks = unpack_longs(section["block_states"]["data"], index_len, 4096)
+            # The block state is an index into the palette
+            palette_idxs = blocks.reshape(16, 16, 16)[heights[mask] % 16, zs[mask], xs[mask]]
+        else:
+            palette_idxs = np.zeros(np.count_nonzero(mask), dtype=np.uint16)
+        palette_ids, palette_missing, names = get_palette_lut(palette, 1 << index_len)
+        ids[mask] = palette_ids[palette_idxs]
+        if palette_missing.any():
+            used = np.unique(palette_idxs)
+            for idx in used[palette_missing[used]]:
+                missing_blocks[names[idx]] = True
+
+
+def draw_chunk(chunk, layer, out, heightmap=False):
+    """Draw the chunk as seen from above into the (16, 16, 3) uint8 array `out`"""
+    heights = np.empty((16, 16), dtype=np.int32)
+    ids = np.empty((16, 16), dtype=np.uint16)
+    get_top_blocks(chunk, layer, heights, ids)
+    if heightmap:
+        out[:] = np.clip(heights, 0, 255)[..., np.newaxis]
+    else:
+        out[:] = get_color_table().table[ids]
+    return out
+
+
+def render_chunk(chunk, layer, heightmap=False):
+    # Show an image of the chunk from above
+    pixels = np.empty((16, 16, 3), dtype=np.uint8)
+    return Image.fromarray(draw_chunk(chunk, layer, pixels, heightmap), "RGB")
+
+
+def render_chunk_reference(chunk, layer, heightmap=False):
+    """Pure-Python version of render_chunk, which check_render.py compares it against"""
+    colors = get_color_table()
+    if chunk["Status"] != "minecraft:full":
+        return Image.frombytes("RGB", (16, 16),
+            b"".join(bytes((0, 0, 0)) for _ in range(256)))
+    elif isinstance(layer, int):
+        heights = [layer for _ in range(256)]
+    else:
+        # In 1.16 and up, heightmaps are 37 longs, each with 7 values of 9 bits.  The last bit of each long
+        # is unused (7*9 = 63), and the last 28 bits of the last long.
+        # The heightmap for an ocean chunk looks like this:
+        #   01: 0000111111000111111000111111000111111000111111000111111000111111
+        #   02: 0000111111000111111000111111000111111000111111000111111000111111
+        #   03: 0000111111000111111000111111000111111000111111000111111000111111
+        #   ...
+        #   37: 0000000000000000000000000000000111111000111111000111111000111111
+        height_data = chunk["Heightmaps"][layer]
+        heights = []
+        for h in map(int, height_data):
+            for i in range(7): # 64 // 9
+                # minus one since the height will be the air block above the solid block
+                heights.append((h & 0b111111111) - 1)
+                h = h >> 9
+                if len(heights) == 256:
+                    break
+
+    black = bytes((0, 0, 0))
+    pixels = []
+    sections = {}
+    for z in range(16):
+        for x in range(16):
+            pixel_idx = z*16+x
+            if heightmap:
+                pixels.append(bytes((heights[pixel_idx], heights[pixel_idx], heights[pixel_idx])))
+                continue
+            section_y = heights[pixel_idx] // 16 + chunk["yPos"]
+            if section_y not in sections:
+                if len(chunk["sections"]) == 0 or section_y == -1:
+                    print('len(chunk["sections"]) == 0 or section_y == -1:')
+                    pixels.append(black)
+                    continue
+                try:
+                    section = next(section for section in chunk["sections"]
+                        if section["Y"] == section_y)
+                except StopIteration:
+                    try:
+                        section = next(section for section in reversed(chunk["sections"])
+                            if "palette" in section)
+                    except StopIteration:
+                        raise Exception("Weird sections (was looking for %s): %s" % (section_y, [list(c) for c in chunk["sections"]]))
+                # Find the number of bits it takes to represent the largest index in the palette (at least 4)
+                try:
+                    index_len = max((4, len(bin(len(section["block_states"]["palette"])-1))-2))
+                    index_mask = int("1"*index_len, base=2)
+                except KeyError:
+                    pixels.append(black)
+                    continue
+                # data is a list of longs, each of which has some number of indices
+                # Many ocean chunks will have 16 zeros terminating the list of longs
+                blocks = []
+                if "data" in section["block_states"]:
+                    for bs in map(int, section["block_states"]["data"]):
+                        blocks.extend((bs & (index_mask << (i*index_len))) >> (i*index_len) for i in range(64//index_len))
+                else:
+                    blocks = [0]
+                sections[section_y] = (section, blocks)
+
+            # Get the chunk section and block states
+            section, blocks = sections[section_y]
+            # The block state is an index into the palette
+            palette_idx = 0 if len(blocks) == 1 else blocks[(heights[pixel_idx]%16)*256+z*16+x]
+            try:
+                block = section["block_states"]["palette"][palette_idx]["Name"].replace("minecraft:", "")
+            except IndexError:
+                color = colors.table[MISSING].tobytes()
+            else:
+                if block not in colors.ids:
+                    missing_blocks[block] = True
+                    color = colors.table[MISSING].tobytes()
+                else:
+                    color = colors.table[colors.ids[block]].tobytes()
+            pixels.append(color)
+
+    return Image.frombytes("RGB", (16, 16), b"".join(pixels))
+
+
+def get_chunk_blocks(chunk):
+    """Return the names of the blocks in the palettes of a chunk's sections"""
+    return {block["Name"] for section in chunk.get("sections", [])
+        for block in section.get("block_states", {}).get("palette", [])}
+
+
+def render_region(region, layer="WORLD_SURFACE", heightmap=False, chunks=None, base=None, blocks=None):
+    """Render a region as seen from above
+
+    If `chunks` is given, only the chunks set in that (32, 32) mask (indexed by
+    [chunk z, chunk x]) are drawn, and the rest of the tile is copied from the
+    `base` image.  If `blocks` is given, the names of the blocks in each drawn
+    chunk are added to it, keyed by (chunk x, chunk z).
+    """
+    # Gather the top blocks of every chunk, indexed by [chunk z, chunk x, z, x],
+    # then color the whole region in one pass
+    heights = np.zeros((32, 32, 16, 16), dtype=np.int32)
+    ids = np.zeros((32, 32, 16, 16), dtype=np.uint16)
+    for x, z in region.get_chunks():
+        if chunks is None or chunks[z, x]:
+            chunk = region.get_chunk(x, z, chunk_tags)
+            get_top_blocks(chunk, layer, heights[z, x], ids[z, x])
+            if blocks is not None:
+                blocks[(x, z)] = get_chunk_blocks(chunk)
+    if heightmap:
+        pixels = np.clip(heights, 0, 255).astype(np.uint8)[..., np.newaxis].repeat(3, axis=-1)
+    else:
+        pixels = get_color_table().table[ids]
+    if base is not None:
+        base = np.asarray(base.convert("RGB")).reshape(32, 16, 32, 16, 3).transpose(0, 2, 1, 3, 4)
+        pixels[~chunks] = base[~chunks]
+    pixels = pixels.transpose(0, 2, 1, 3, 4).reshape(32*16, 32*16, 3)
+    return Image.fromarray(np.ascontiguousarray(pixels), "RGB")
+
+
+def get_layer(dimension):
+    """Return the layer the tiles of a dimension are rendered from"""
+    if dimension == "nether":
+        # Render a horizontal slice of the nether at the surface of the lava lake
+        return 31
+    return "WORLD_SURFACE"
+
+
+def open_tile_store(world):
+    """Open the tile store of a world, invalidating tiles drawn by an older renderer"""
+    if type(world) is not str:
+        world = world.folder
+    store = TileStore(os.path.join(get_data_dir(world), "tiles.sqlite3"))
+    store.check_version(RENDERER_VERSION, get_color_table().hash)
+    return store
+
+
+def encode_tile(tile):
+    data = BytesIO()
+    tile.save(data, "PNG")
+    return data.getvalue()
+
+
+def get_changed_chunks(region, store, dimension):
+    """Return a (32, 32) mask of the chunks saved since the region's tile was rendered"""
+    # Each tile keeps a copy of the region's chunk timestamp table from when
+    # it was rendered, which is more reliable than the file timestamps
+    rendered = store.get_chunk_timestamps(dimension, region.x, region.z)
+    if rendered is None:
+        return np.ones((32, 32), dtype=bool)
+    return region.timestamps != rendered
+
+
+def get_header_hash(data):
+    """Return a hash of a region's location and timestamp tables, which change whenever a chunk is saved"""
+    header = data[:2*SECTOR_SIZE]
+    # Regions too small to have a header are treated as empty, like RegionFile does
+    if len(header) < 2*SECTOR_SIZE:
+        header = b""
+    return hashlib.sha1(header).hexdigest()
+
+
+def get_stale_regions(world, dimension, store, force=False):
+    """Return the (x, z) coordinates of every region of a dimension, and of
+    those that may have changed since they were rendered
+
+    The region folder is listed once, and regions whose size and modification
+    time match the manifest aren't opened at all.  The others only have their
+    headers read, so that a region that was touched without any chunks being
+    saved isn't rendered again.
+    """
+    manifest = {} if force else store.get_region_manifest(dimension)
+    regions, stale = [], []
+    try:
+        entries = list(os.scandir(world.get_region_folder(dimension)))
+    except FileNotFoundError:
+        entries = []
+    for entry in entries:
+        key = parse_region_name(entry.name)
+        if key is None:
+            continue
+        regions.append(key)
+        stat = entry.stat()
+        rendered = manifest.get(key)
+        if rendered is not None and rendered[:2] == (stat.st_size, stat.st_mtime):
+            continue
+        if rendered is not None:
+            with open(entry.path, "rb") as f:
+                header = get_header_hash(f.read(2*SECTOR_SIZE))
+            if header == rendered[2]:
+                store.put_region_manifest(dimension, key[0], key[1], stat.st_size, stat.st_mtime, header)
+                continue
+        stale.append(key)
+    return regions, stale
+
+
+def update_tile(world, dimension, x, z, force=False, store=None):
+    """Re-render the chunks of a region that were saved since its tile was last rendered
+
+    Returns the tile and the number of chunks drawn, or (None, 0) if the tile
+    was already up to date.
+    """
+    if store is None:
+        with open_tile_store(world) as store:
+            return update_tile(world, dimension, x, z, force, store)
+    with world.get_region(dimension, x, z) as region:
+        if force:
+            changed = np.ones((32, 32), dtype=bool)
+        else:
+            changed = get_changed_chunks(region, store, dimension)
+        if not changed.any():
+            update_region_manifest(store, dimension, region)
+            return None, 0
+        base = None
+        if not changed.all():
+            base = Image.open(BytesIO(store.get_tile(dimension, x, z)))
+        blocks = {}
+        tile = render_region(region, get_layer(dimension), chunks=changed, base=base, blocks=blocks)
+        # Save the index first, so that it's redone along with the tile if
+        # anything goes wrong in between
+        update_block_index(store, dimension, x, z, changed, blocks)
+        store.put_tile(dimension, x, z, encode_tile(tile), region.timestamps)
+        update_region_manifest(store, dimension, region)
+        return tile, int(np.count_nonzero(changed & region.exists))
+
+
+def update_region_manifest(store, dimension, region):
+    """Record the region file as it was when it was opened to bring its tile up to date"""
+    store.put_region_manifest(dimension, region.x, region.z, region.size, region.mtime,
+        get_header_hash(region.header))
+
+
+def update_block_index(store, dimension, x, z, changed, blocks):
+    """Update the block index of the chunks in the `changed` mask of a region
+
+    `blocks` has the block names of each changed chunk that still exists,
+    keyed by (chunk x, chunk z).
+    """
+    index = store.get_block_index(dimension, x, z)
+    for mask in index.values():
+        mask &= ~changed
+    for (cx, cz), names in blocks.items():
+        for name in names:
+            index.setdefault(name, np.zeros((32, 32), dtype=bool))[cz, cx] = True
+    store.put_block_index(dimension, x, z, {name: mask for name, mask in index.items() if mask.any()})
+
+
+def find_block(world, dimension, name):
+    """Return the (x, z) coordinates of the chunks whose palettes have a block
+
+    Chunks are indexed as they are rendered, so only rendered chunks are
+    found.  The "minecraft:" prefix of the name is optional.
+    """
+    if ":" not in name:
+        name = "minecraft:" + name
+    result = []
+    with open_tile_store(world) as store:
+        for x, z, mask in store.find_block(dimension, name):
+            result.extend((x*32+int(cx), z*32+int(cz)) for cz, cx in zip(*np.nonzero(mask)))
+    return sorted(result)
+
+
+def run_tile_jobs(folder, dimension, regions, force, jobs):
+    """Update the tiles of the regions, yielding the results as they complete"""
+    # The render processes' entry point imports this module
+    from . import worker
+    if jobs == 1:
+        worker.init_worker(folder)
+        for x, z in regions:
+            yield worker.update_tile_job(dimension, x, z, force)
+        return
+    with concurrent.futures.ProcessPoolExecutor(jobs, initializer=worker.init_worker,
+            initargs=(folder,)) as executor:
+        futures = {executor.submit(worker.update_tile_job, dimension, x, z, force): (x, z)
+            for x, z in regions}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # Such as a render process dying
+                x, z = futures[future]
+                yield x, z, False, 0, [], "%s: %s" % (type(e).__name__, e)
+
+
+def save_world_map(store, dimension, regions, bounds, filename):
+    """Save the tiles of the regions as a single image
+
+    The image is written one row of regions at a time, so only one row of
+    tiles is ever in memory, and empty areas are never allocated.
+    """
+    xMin, xMax, zMin, zMax = bounds
+    rows = {}
+    for x, z in regions:
+        rows.setdefault(z, []).append(x)
+    # region store 32x32 chunks, chunks are 16x16
+    width = (xMax - xMin + 1) * 32 * 16
+    height = (zMax - zMin + 1) * 32 * 16
+    with PNGWriter(filename, width, height) as writer:
+        for z in range(zMin, zMax+1):
+            if z not in rows:
+                writer.write_blank_rows(32*16)
+                continue
+            rowMin, rowMax = min(rows[z]), max(rows[z])
+            band = np.zeros((32*16, (rowMax - rowMin + 1) * 32 * 16, 3), dtype=np.uint8)
+            for (x, _), image in store.get_tiles(dimension, rowMin, rowMax, z, z).items():
+                tile = np.asarray(Image.open(BytesIO(image)).convert("RGB"))
+                band[:, (x-rowMin)*512:(x-rowMin+1)*512] = tile
+            writer.write_band(band, (rowMin-xMin)*512)
+
+
+def update_pyramid(store, dimension, keys):
+    """Redraw the scaled down tiles above the given level 0 tiles
+
+    Each tile above level 0 is its four children pasted together and scaled
+    down by half, so only the parents of the changed tiles need redrawing.
+    Returns {level: set of redrawn (x, z)}.
+    """
+    result = {}
+    for level in range(1, PYRAMID_LEVELS):
+        keys = {(x >> 1, z >> 1) for x, z in keys}
+        for x, z in keys:
+            children = store.get_tiles(dimension, 2*x, 2*x+1, 2*z, 2*z+1, level=level-1)
+            if not children:
+                store.delete_tile(dimension, x, z, level)
+                continue
+            tile = Image.new("RGB", (1024, 1024))
+            for (cx, cz), image in children.items():
+                tile.paste(Image.open(BytesIO(image)).convert("RGB"), ((cx-2*x)*512, (cz-2*z)*512))
+            store.put_tile(dimension, x, z, encode_tile(tile.reduce(2)), level=level)
+        result[level] = keys
+    return result
+
+
+def render_world(world, dimension=None, force=False, jobs=None):
+    """Update the tiles of a dimension and save the map of the whole dimension
+
+    Only the chunks saved since the tiles were last drawn are rendered, unless
+    `force` is set.  The regions are spread across `jobs` processes (one per
+    CPU by default).
+    """
+    print("Loading world...")
+    if type(world) is str:
+        world = LevelInfo(world)
+    dimension = dimension or world.get_players()[0].dimension
+
+    data_dir = get_data_dir(world.folder)
+    result_filename = os.path.join(data_dir, "_%s.png" % dimension)
+    # Read before checking the regions, so that anything saved while
+    # rendering is picked up next time
+    last_played = str(world.get_last_played())
+    map_time = os.path.getmtime(result_filename) if os.path.isfile(result_filename) else None
+    with open_tile_store(world) as store:
+        # The viewer also updates the tiles, but not the world map, so the map
+        # is saved again if any tile is newer than it
+        map_outdated = map_time is None or store.get_last_update(dimension) > map_time
+        if (not force and not map_outdated
+                and store.get_meta("map_last_played:" + dimension) == last_played):
+            print("The world hasn't been saved since the last render")
+            return
+        print("Checking regions...")
+        regions, stale = get_stale_regions(world, dimension, store, force)
+    print("Getting bounds...")
+    xMin, xMax, zMin, zMax = 0, 0, 0, 0
+    for x, z in regions:
+        if x < xMin:
+            xMin = x
+        if x > xMax:
+            xMax = x
+        if z < zMin:
+            zMin = z
+        if z > zMax:
+            zMax = z
+
+    jobs = jobs or os.cpu_count() or 1
+    start_time = time.time()
+    rendered_regions, rendered_chunks = 0, 0
+    changed = set()
+    failed = []
+    results = run_tile_jobs(world.folder, dimension, stale, force, jobs)
+    for idx, (x, z, rendered, chunk_count, missing, error) in enumerate(results, 1):
+        print("\rRendering regions %d/%d..." % (idx, len(stale)), end="", flush=True)
+        missing_blocks.update(dict.fromkeys(missing, True))
+        if error:
+            print("\nError rendering region %s,%s:\n%s" % (x, z, error))
+            failed.append((x, z))
+        if rendered:
+            rendered_regions += 1
+            rendered_chunks += chunk_count
+            changed.add((x, z))
+    print()
+    duration = max(time.time() - start_time, 0.001)
+    print(f"Rendered {rendered_regions} regions ({rendered_chunks} chunks) in {duration:.1f}s "
+        f"with {jobs} processes: {rendered_regions/duration:.1f} regions/s, "
+        f"{rendered_chunks/duration:.0f} chunks/s")
+
+    with open_tile_store(world) as store:
+        # Also fill in any parents that are missing, e.g. after an interrupted run
+        parents = set(store.get_tile_keys(dimension, level=1))
+        changed.update(key for key in regions if (key[0] >> 1, key[1] >> 1) not in parents)
+        if changed:
+            print("Updating zoomed out tiles...")
+            update_pyramid(store, dimension, changed)
+        if changed or map_outdated:
+            print("Saving world map...")
+            save_world_map(store, dimension, regions, (xMin, xMax, zMin, zMax), result_filename)
+        # Regions that failed (such as while the game was writing them) are
+        # retried next time
+        if failed:
+            print("Failed to render %d regions" % len(failed))
+        else:
+            store.set_meta("map_last_played:" + dimension, last_played)
@@ -0,0 +1,162 @@
+"""Render the map items of a world, and stitch them into one image per dimension
+
+A map item covers 128x128 pixels, each of which is 2**scale blocks across,
+centered on (xCenter, zCenter).  Maps are only redrawn when their .dat
+file has changed since the last run, which is tracked in maps.json in the
+output folder.  Each map's color indexes are kept next to its image, so the
+atlas can be drawn without reading the .dat files again.
+"""
+
+import concurrent.futures
+import glob
+import json
+import numpy as np
+import os
+
+from .mapper import read_map, draw_map
+from .pngstream import PNGWriter
+from PIL import Image
+
+
+MANIFEST_NAME = "maps.json"
+# Color indexes below this are transparent (the map hasn't been explored there)
+TRANSPARENT = 4
+
+
+def get_map_filenames(folder):
+    return sorted(glob.glob(os.path.join(folder, "map_*.dat")))
+
+
+def get_output_filename(filename, output, extension=".png"):
+    return os.path.join(output, os.path.basename(filename) + extension)
+
+
+def get_map_info(data):
+    return {key: data[key] for key in ("x", "z", "scale", "dimension", "version")}
+
+
+def render_map_job(filename, output):
+    """Save a map as a PNG in the output folder, returning its position and missing color indexes"""
+    data = read_map(filename)
+    pixels, missing = draw_map(data["colors"], data["version"])
+    Image.fromarray(pixels, "RGB").save(get_output_filename(filename, output))
+    np.save(get_output_filename(filename, output, ".npy"), data["colors"])
+    result = get_map_info(data)
+    result["missing"] = missing
+    return result
+
+
+def load_manifest(output):
+    try:
+        with open(os.path.join(output, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output, manifest):
+    filename = os.path.join(output, MANIFEST_NAME)
+    with open(filename + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(filename + ".tmp", filename)
+
+
+def render_maps(filenames, output, jobs=None, force=False):
+    """Render the maps that changed since the last run into the output folder
+
+    Returns {filename: info} for all of the maps, where info has the map's
+    position and scale, and `rendered` says whether it was drawn this time.
+    """
+    os.makedirs(output, exist_ok=True)
+    manifest = load_manifest(output)
+    result, todo = {}, {}
+    for filename in filenames:
+        stat = os.stat(filename)
+        key = os.path.basename(filename)
+        entry = manifest.get(key)
+        if (not force and entry and entry["size"] == stat.st_size
+                and entry["mtime"] == stat.st_mtime_ns
+                and os.path.isfile(get_output_filename(filename, output))
+                and os.path.isfile(get_output_filename(filename, output, ".npy"))):
+            result[filename] = dict(entry["info"], rendered=False)
+        else:
+            todo[filename] = (key, stat)
+
+    if todo:
+        with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+            futures = {executor.submit(render_map_job, filename, output): filename for filename in todo}
+            for future in concurrent.futures.as_completed(futures):
+                filename = futures[future]
+                key, stat = todo[filename]
+                try:
+                    info = future.result()
+                except Exception as e:
+                    print("Failed to render %s: %s" % (filename, e))
+                    manifest.pop(key, None)
+                    continue
+                if info.pop("missing"):
+                    print("%s has color indexes missing from the palette" % filename)
+                manifest[key] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "info": info}
+                result[filename] = dict(info, rendered=True)
+
+    # Forget the maps that have been deleted
+    keys = {os.path.basename(filename) for filename in filenames}
+    for key in [key for key in manifest if key not in keys]:
+        del manifest[key]
+    save_manifest(output, manifest)
+    return result
+
+
+def save_map_atlas(maps, output, filename):
+    """Stitch maps of the same dimension into one image
+
+    `maps` is {filename: info} as returned by render_maps, whose color
+    indexes are loaded from the output folder.  The image has the
+    resolution of the most detailed map, and more detailed maps are drawn
+    over less detailed ones.  The unexplored parts of a map don't cover the
+    maps under it.  Only the 128x128 color indexes of each map are kept in
+    memory; the image is written a band of rows at a time, and each map is
+    only scaled up where it overlaps the band being written.  Returns the
+    block coordinates of the image's top left corner and the blocks per
+    pixel.
+    """
+    if not maps:
+        raise Exception("No maps to stitch into %s" % filename)
+
+    unit = 1 << min(info["scale"] for info in maps.values())
+    placed = []
+    # Coarser maps first, so that finer ones are drawn over them
+    for map_filename, info in sorted(maps.items(), key=lambda item: -item[1]["scale"]):
+        colors = np.load(get_output_filename(map_filename, output, ".npy"))
+        factor = (1 << info["scale"]) // unit
+        size = 128 << info["scale"]
+        # Atlas pixel coordinates of the map's top left corner
+        left, top = (info["x"] - size//2) // unit, (info["z"] - size//2) // unit
+        placed.append((left, top, 128*factor, factor, colors, info["version"]))
+
+    xMin = min(left for left, _, _, _, _, _ in placed)
+    xMax = max(left + width for left, _, width, _, _, _ in placed)
+    zMin = min(top for _, top, _, _, _, _ in placed)
+    zMax = max(top + width for _, top, width, _, _, _ in placed)
+    band_height = 512
+    with PNGWriter(filename, xMax - xMin, zMax - zMin) as writer:
+        for bandTop in range(zMin, zMax, band_height):
+            bandBottom = min(bandTop + band_height, zMax)
+            rows = [m for m in placed if m[1] < bandBottom and m[1] + m[2] > bandTop]
+            if not rows:
+                writer.write_blank_rows(bandBottom - bandTop)
+                continue
+            bandLeft = min(left for left, _, _, _, _, _ in rows)
+            bandRight = max(left + width for left, _, width, _, _, _ in rows)
+            band = np.zeros((bandBottom - bandTop, bandRight - bandLeft, 3), dtype=np.uint8)
+            for left, top, width, factor, colors, version in rows:
+                start, stop = max(top, bandTop), min(top + width, bandBottom)
+                # The map's rows in this band, scaled up
+                indexes = colors[np.arange(start - top, stop - top) // factor]
+                indexes = indexes[:, np.arange(width) // factor]
+                pixels, _ = draw_map(indexes, version)
+                visible = indexes >= TRANSPARENT
+                target = band[start-bandTop:stop-bandTop, left-bandLeft:left-bandLeft+width]
+                target[visible] = pixels[visible]
+            writer.write_band(band, bandLeft - xMin)
+    return xMin * unit, zMin * unit, unit
@@ -0,0 +1,197 @@
+"""A minimal NBT reader that only builds the tags it is asked for
+
+`select` describes which tags to keep: True keeps a tag and everything below
+it, and a dict keeps only the named children of a compound (or of each
+compound in a list).  Everything else is skipped without creating Python
+objects for it.  Numbers and strings become plain Python values, compounds
+become dicts, lists become lists, and the array tags become read-only NumPy
+views over the source buffer.
+"""
+
+import numpy as np
+import struct
+
+
+TAG_END = 0
+TAG_BYTE = 1
+TAG_SHORT = 2
+TAG_INT = 3
+TAG_LONG = 4
+TAG_FLOAT = 5
+TAG_DOUBLE = 6
+TAG_BYTE_ARRAY = 7
+TAG_STRING = 8
+TAG_LIST = 9
+TAG_COMPOUND = 10
+TAG_INT_ARRAY = 11
+TAG_LONG_ARRAY = 12
+
+scalars = {
+    TAG_BYTE: struct.Struct(">b"),
+    TAG_SHORT: struct.Struct(">h"),
+    TAG_INT: struct.Struct(">i"),
+    TAG_LONG: struct.Struct(">q"),
+    TAG_FLOAT: struct.Struct(">f"),
+    TAG_DOUBLE: struct.Struct(">d"),
+}
+arrays = {
+    TAG_BYTE_ARRAY: np.dtype(">i1"),
+    TAG_INT_ARRAY: np.dtype(">i4"),
+    TAG_LONG_ARRAY: np.dtype(">i8"),
+}
+ushort = struct.Struct(">H")
+int32 = struct.Struct(">i")
+
+
+class NBTReader(object):
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def read_tag_type(self):
+        tag_type = self.data[self.pos]
+        self.pos += 1
+        return tag_type
+
+    def read_string(self):
+        length = ushort.unpack_from(self.data, self.pos)[0]
+        start = self.pos + 2
+        self.pos = start + length
+        # Strings are Java's "modified UTF-8", which only differs from UTF-8
+        # for NUL and characters outside the BMP
+        return bytes(self.data[start:self.pos]).decode("utf-8", errors="replace")
+
+    def skip_string(self):
+        self.pos += 2 + ushort.unpack_from(self.data, self.pos)[0]
+
+    def read_value(self, tag_type, select=True):
+        if tag_type in scalars:
+            fmt = scalars[tag_type]
+            value = fmt.unpack_from(self.data, self.pos)[0]
+            self.pos += fmt.size
+            return value
+        elif tag_type in arrays:
+            dtype = arrays[tag_type]
+            length = int32.unpack_from(self.data, self.pos)[0]
+            self.pos += 4
+            value = np.frombuffer(self.data, dtype=dtype, count=length, offset=self.pos)
+            self.pos += length*dtype.itemsize
+            return value
+        elif tag_type == TAG_STRING:
+            return self.read_string()
+        elif tag_type == TAG_LIST:
+            item_type = self.read_tag_type()
+            length = int32.unpack_from(self.data, self.pos)[0]
+            self.pos += 4
+            return [self.read_value(item_type, select) for _ in range(length)]
+        elif tag_type == TAG_COMPOUND:
+            result = {}
+            while True:
+                child_type = self.read_tag_type()
+                if child_type == TAG_END:
+                    return result
+                name = self.read_string()
+                if select is True:
+                    result[name] = self.read_value(child_type)
+                elif name in select:
+                    result[name] = self.read_value(child_type, select[name])
+                else:
+                    self.skip_value(child_type)
+        raise ValueError("Unknown tag type %s at offset %s" % (tag_type, self.pos-1))
+
+    def skip_value(self, tag_type):
+        if tag_type in scalars:
+            self.pos += scalars[tag_type].size
+        elif tag_type in arrays:
+            length = int32.unpack_from(self.data, self.pos)[0]
+            self.pos += 4 + length*arrays[tag_type].itemsize
+        elif tag_type == TAG_STRING:
+            self.skip_string()
+        elif tag_type == TAG_LIST:
+            item_type = self.read_tag_type()
+            length = int32.unpack_from(self.data, self.pos)[0]
+            self.pos += 4
+            if item_type in scalars:
+                self.pos += length*scalars[item_type].size
+            else:
+                for _ in range(length):
+                    self.skip_value(item_type)
+        elif tag_type == TAG_COMPOUND:
+            # Compounds have no length prefix, but their children can mostly
+            # be stepped over by length
+            while True:
+                child_type = self.read_tag_type()
+                if child_type == TAG_END:
+                    return
+                self.skip_string()
+                self.skip_value(child_type)
+        else:
+            raise ValueError("Unknown tag type %s at offset %s" % (tag_type, self.pos-1))
+
+
+class PartialNBTReader(NBTReader):
+    """An NBTReader that stops as soon as every selected tag has been read
+
+    Whatever comes after the last selected tag is never looked at, so the
+    data can be just the start of a payload.  The count of selected tags
+    doesn't account for lists of compounds, so `select` mustn't go through
+    any.
+    """
+    def __init__(self, data, select):
+        NBTReader.__init__(self, data)
+        self.remaining = count_selected(select)
+
+    def read_value(self, tag_type, select=True):
+        if tag_type != TAG_COMPOUND or select is True:
+            return NBTReader.read_value(self, tag_type, select)
+        result = {}
+        while self.remaining:
+            child_type = self.read_tag_type()
+            if child_type == TAG_END:
+                break
+            name = self.read_string()
+            if name in select:
+                result[name] = self.read_value(child_type, select[name])
+                if select[name] is True:
+                    self.remaining -= 1
+            else:
+                self.skip_value(child_type)
+        return result
+
+
+def count_selected(select):
+    """Return the number of tags kept whole by a selection"""
+    if select is True:
+        return 1
+    return sum(count_selected(child) for child in select.values())
+
+
+def parse(data, select=True):
+    """Return the root compound of an uncompressed NBT payload as a dict"""
+    reader = NBTReader(data)
+    tag_type = reader.read_tag_type()
+    if tag_type != TAG_COMPOUND:
+        raise ValueError("NBT data does not start with a compound (found tag type %s)" % tag_type)
+    reader.skip_string()
+    return reader.read_value(tag_type, select)
+
+
+def parse_prefix(data, select):
+    """Parse the selected tags from the start of an uncompressed NBT payload
+
+    Raises EOFError if the data ends before all of them have been read, see
+    PartialNBTReader.
+    """
+    reader = PartialNBTReader(data, select)
+    try:
+        tag_type = reader.read_tag_type()
+        if tag_type != TAG_COMPOUND:
+            raise ValueError("NBT data does not start with a compound (found tag type %s)" % tag_type)
+        reader.skip_string()
+        result = reader.read_value(tag_type, select)
+    except (IndexError, struct.error, ValueError) as e:
+        # Truncated arrays make NumPy raise ValueError
+        raise EOFError("NBT data ends before the selected tags") from e
+    if reader.pos > len(data):
+        raise EOFError("NBT data ends before the selected tags")
+    return result
@@ -0,0 +1,74 @@
+import numpy as np
+import struct
+import zlib
+
+
+class PNGWriter(object):
+    """Writes an RGB PNG a few rows at a time
+
+    Only the rows being written need to be in memory, and black areas are
+    never allocated at all, so the image can be far larger than memory.
+    """
+    def __init__(self, filename, width, height, level=6):
+        self.width = width
+        self.height = height
+        self.rows = 0
+        self.compressor = zlib.compressobj(level)
+        self.zeros = memoryview(bytes(width*3))
+        self.file = open(filename, "wb")
+        self.file.write(b"\x89PNG\r\n\x1a\n")
+        # 8 bits per channel, RGB, no interlacing
+        self.write_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def write_chunk(self, chunk_type, data):
+        self.file.write(struct.pack(">I", len(data)))
+        self.file.write(chunk_type)
+        self.file.write(data)
+        self.file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(chunk_type))))
+
+    def compress(self, data):
+        compressed = self.compressor.compress(data)
+        if compressed:
+            self.write_chunk(b"IDAT", compressed)
+
+    def write_blank_rows(self, count):
+        """Append `count` black rows"""
+        for _ in range(count):
+            # Each row starts with its filter type, 0 is "None"
+            self.compress(b"\x00")
+            self.compress(self.zeros)
+        self.rows += count
+
+    def write_band(self, pixels, x=0):
+        """Append rows whose only non-black pixels are the (rows, width, 3) `pixels`, starting at column `x`"""
+        rows, width = pixels.shape[:2]
+        right = self.width - x - width
+        # Use the "Sub" filter, which stores each byte as the difference from
+        # the same channel of the pixel to its left.  The first black pixel on
+        # the right is included, since it differs from the last pixel of the band.
+        band = np.zeros((rows, (width + min(right, 1))*3), dtype=np.uint8)
+        band[:, :width*3] = pixels.reshape(rows, width*3)
+        filtered = band.copy()
+        filtered[:, 3:] -= band[:, :-3]
+        right_zeros = self.zeros[:max(right-1, 0)*3]
+        for row in filtered:
+            self.compress(b"\x01")
+            self.compress(self.zeros[:x*3])
+            self.compress(row.tobytes())
+            self.compress(right_zeros)
+        self.rows += rows
+
+    def close(self):
+        if self.file.closed:
+            return
+        if self.rows < self.height:
+            self.write_blank_rows(self.height - self.rows)
+        self.write_chunk(b"IDAT", self.compressor.flush())
+        self.write_chunk(b"IEND", b"")
+        self.file.close()
@@ -0,0 +1,149 @@
+import concurrent.futures
+import heapq
+import os
+import threading
+import traceback
+
+from . import worker
+from multiprocessing import shared_memory
+
+
+def get_worker_count():
+    """Return the number of render processes to use, leaving a core for the viewer"""
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 2
+    return max(1, cores - 1)
+
+
+class RenderPool(object):
+    """Render processes that are started once and reused for every tile
+
+    At most `max_in_flight` tiles are queued or being rendered at a time, and
+    submit() blocks until a slot is free, so memory use stays flat no matter
+    how many regions need rendering.
+    """
+    def __init__(self, folder, workers=None, max_in_flight=None):
+        self.workers = workers or get_worker_count()
+        self.executor = concurrent.futures.ProcessPoolExecutor(self.workers,
+            initializer=worker.init_worker, initargs=(folder,))
+        self.slots = threading.BoundedSemaphore(max_in_flight or 2*self.workers)
+
+    def submit(self, dimension, x, z, callback, force=False):
+        """Queue a tile update and call `callback` with the result in a background thread
+
+        The result is the dict returned by worker.render_tile_job, with the
+        tile's RGB data copied out of the shared memory into "tile" (None if
+        the tile was already up to date).  The returned future completes once the
+        callback has run.
+        """
+        self.slots.acquire()
+        handled = concurrent.futures.Future()
+        try:
+            future = self.executor.submit(worker.render_tile_job, dimension, x, z, force)
+        except Exception:
+            self.slots.release()
+            raise
+        def _done(future):
+            try:
+                if future.cancelled():
+                    return
+                try:
+                    result = future.result()
+                except Exception:
+                    result = {"dimension": dimension, "x": x, "z": z, "chunks": 0,
+                        "shm": None, "tile": None, "missing": [], "error": traceback.format_exc()}
+                if result["shm"]:
+                    try:
+                        shm = shared_memory.SharedMemory(name=result["shm"])
+                        try:
+                            result["tile"] = bytes(shm.buf[:worker.TILE_SIZE])
+                        finally:
+                            shm.close()
+                            shm.unlink()
+                    except Exception:
+                        result["error"] = traceback.format_exc()
+                callback(result)
+            finally:
+                self.slots.release()
+                handled.set_result(None)
+        future.add_done_callback(_done)
+        return handled
+
+    def submit_job(self, fn, *args):
+        """Once a slot is free, queue any other job for the render processes
+
+        The job is run by the processes' initialized world and store (see
+        worker.init_worker), and the returned future has its result.
+        """
+        self.slots.acquire()
+        try:
+            future = self.executor.submit(fn, *args)
+        except Exception:
+            self.slots.release()
+            raise
+        future.add_done_callback(lambda future: self.slots.release())
+        return future
+
+    def submit_next(self, scheduler, dimension, callback, force=False):
+        """Once a slot is free, submit the scheduler's most urgent region
+
+        Returns None when the scheduler has nothing left.
+        """
+        # Wait for a slot before choosing, so that the choice reflects the
+        # focus at the time the region is actually rendered
+        self.slots.acquire()
+        region = scheduler.pop()
+        self.slots.release()
+        if region is None:
+            return None
+        return self.submit(dimension, region[0], region[1], callback, force)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+class RenderScheduler(object):
+    """The regions waiting to be rendered, handed out most urgent first
+
+    The focus is the tile bounds of the viewport and a list of (x, z) points
+    in region coordinates, such as the center of the view and the player.
+    Regions in the viewport come first, then the ones closest to any of the
+    points.  The focus can be changed from another thread while regions are
+    being handed out.
+    """
+    def __init__(self, regions, focus):
+        self.lock = threading.Lock()
+        self.pending = set(regions)
+        self.focus = focus
+        # Rebuilt on the next pop() whenever the focus changes
+        self.queue = None
+
+    def __len__(self):
+        return len(self.pending)
+
+    def set_focus(self, focus):
+        with self.lock:
+            if focus != self.focus:
+                self.focus = focus
+                self.queue = None
+
+    def get_priority(self, region):
+        (minX, maxX, minZ, maxZ), points = self.focus
+        x, z = region
+        visible = minX <= x <= maxX and minZ <= z <= maxZ
+        distance = min(((x-px)**2 + (z-pz)**2 for px, pz in points), default=0)
+        return (not visible, distance)
+
+    def pop(self):
+        """Return the most urgent region, or None if there are none left"""
+        with self.lock:
+            if self.queue is None:
+                self.queue = [(self.get_priority(region), region) for region in self.pending]
+                heapq.heapify(self.queue)
+            if not self.queue:
+                return None
+            region = heapq.heappop(self.queue)[1]
+            self.pending.remove(region)
+            return region
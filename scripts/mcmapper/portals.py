@@ -0,0 +1,103 @@
+import numpy as np
+import os
+
+
+# The parts of a chunk needed to find portals
+portal_tags = {
+    "sections": {"block_states": {"palette": {"Name": True}}},
+}
+# The parts of a POI chunk needed to find portals.  Its sections are named by
+# their y coordinate, so all of them are kept.
+poi_tags = {"Sections": True}
+
+
+def has_portal(chunk):
+    """Return True if any section of a chunk has nether portal blocks in its palette"""
+    for section in chunk.get("sections", []):
+        try:
+            palette = section["block_states"]["palette"]
+        except KeyError:
+            continue
+        if any(block["Name"] == "minecraft:nether_portal" for block in palette):
+            return True
+    return False
+
+
+def get_portal_chunks(region_x, region_z, found):
+    """Return the (x, z) chunk coordinates marked in a region's portal mask"""
+    return [(region_x*32+int(x), region_z*32+int(z)) for z, x in zip(*np.nonzero(found))]
+
+
+def update_region_portals(world, dimension, x, z, store):
+    """Return the chunks of a region that contain nether portals
+
+    Only the chunks saved since the region was last searched are read, and
+    the results are kept in the tile store for the next search.
+    """
+    with world.get_region(dimension, x, z) as region:
+        changed = region.exists.copy()
+        found = np.zeros((32, 32), dtype=bool)
+        previous = store.get_portal_scan(dimension, x, z)
+        if previous is not None:
+            timestamps, previous_found = previous
+            changed &= region.timestamps != timestamps
+            # Chunks that have been deleted since don't have portals any more
+            found = previous_found & region.exists
+        for cz, cx in zip(*np.nonzero(changed)):
+            found[cz, cx] = has_portal(region.get_chunk(int(cx), int(cz), portal_tags))
+        if previous is None or changed.any() or (found != previous[1]).any():
+            store.put_portal_scan(dimension, x, z, region.timestamps, found)
+    return get_portal_chunks(x, z, found)
+
+
+def read_poi_portals(world, dimension, x, z):
+    """Return the (x, y, z) positions of the portal blocks in a region's POI records"""
+    region = world.get_poi_region(dimension, x, z)
+    if region is None:
+        return []
+    result = []
+    with region:
+        for cx, cz in region.get_chunks():
+            chunk = region.get_chunk(cx, cz, poi_tags)
+            for section in chunk.get("Sections", {}).values():
+                for record in section.get("Records", []):
+                    if record.get("type") == "minecraft:nether_portal":
+                        result.append(tuple(int(value) for value in record["pos"]))
+    return result
+
+
+def group_portal_blocks(blocks):
+    """Return the (x, z) center of each portal, given the positions of its blocks"""
+    remaining = set(blocks)
+    result = []
+    while remaining:
+        pending = [remaining.pop()]
+        portal = []
+        while pending:
+            bx, by, bz = pending.pop()
+            portal.append((bx, bz))
+            for dx, dy, dz in ((1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1)):
+                neighbour = (bx+dx, by+dy, bz+dz)
+                if neighbour in remaining:
+                    remaining.remove(neighbour)
+                    pending.append(neighbour)
+        result.append((sum(p[0] for p in portal)/len(portal) + 0.5, sum(p[1] for p in portal)/len(portal) + 0.5))
+    return sorted(result)
+
+
+def chunk_centers(chunks):
+    return [(x*16+8, z*16+8) for x, z in chunks]
+
+
+def find_region_portals(world, dimension, x, z, store):
+    """Return the (x, z) block coordinates of the portals in a region
+
+    Worlds with POI data (1.14 on) record where every portal block is, so
+    only those records are read and the portals are placed exactly.  Older
+    worlds fall back to searching the chunks (see update_region_portals),
+    and their portals are placed at the center of each chunk with portal
+    blocks.
+    """
+    if os.path.isdir(world.get_poi_folder(dimension)):
+        return group_portal_blocks(read_poi_portals(world, dimension, x, z))
+    return chunk_centers(update_region_portals(world, dimension, x, z, store))
@@ -0,0 +1,121 @@
+import gzip
+import mmap
+import numpy as np
+import os
+import zlib
+
+from mcmapper import nbtreader
+
+
+SECTOR_SIZE = 4096
+# Compression types used in the chunk headers
+GZIP, ZLIB, UNCOMPRESSED = 1, 2, 3
+# Set on the compression type when the chunk is too large for the region and
+# is stored in a separate c.x.z.mcc file instead
+EXTERNAL = 128
+
+
+def parse_region_name(name):
+    """Return the (x, z) coordinates of a region from a file name such as "r.-1.2.mca", or None"""
+    parts = name.split(".")
+    if len(parts) != 4 or parts[0] != "r" or parts[3] != "mca":
+        return None
+    try:
+        return int(parts[1]), int(parts[2])
+    except ValueError:
+        return None
+
+
+class InconceivedChunk(LookupError):
+    """The chunk has not been generated yet"""
+    pass
+
+
+class RegionFile(object):
+    """A read-only, memory-mapped Anvil (.mca) region file
+
+    The location and timestamp tables are exposed as (32, 32) arrays indexed by
+    [chunk z, chunk x], matching the layout of the rendered region tile.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.x, self.z = map(int, os.path.basename(filename).split(".")[1:3])
+        self.data = b""
+        with open(filename, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self.size = stat.st_size
+            self.mtime = stat.st_mtime
+            # Freshly created regions can be empty until the game saves them
+            if self.size >= 2*SECTOR_SIZE:
+                self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # A copy of the header as it was when the file was opened, since the
+        # game can rewrite it while the region is being read
+        self.header = bytes(self.data[:2*SECTOR_SIZE])
+        if self.header:
+            # The first 4 KiB has a big-endian entry per chunk: a 3 byte sector
+            # offset followed by a 1 byte sector count.  The next 4 KiB has the
+            # time each chunk was last saved, in seconds.
+            locations = np.frombuffer(self.header, dtype=">u4", count=1024).astype(np.uint32)
+            timestamps = np.frombuffer(self.header, dtype=">u4", count=1024, offset=SECTOR_SIZE)
+            timestamps = timestamps.astype(np.uint32)
+        else:
+            locations = np.zeros(1024, dtype=np.uint32)
+            timestamps = np.zeros(1024, dtype=np.uint32)
+        self.offsets = (locations >> 8).reshape(32, 32)
+        self.sectors = (locations & 0xff).reshape(32, 32)
+        self.timestamps = timestamps.reshape(32, 32)
+        self.exists = self.offsets >= 2
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            try:
+                self.data.close()
+            except BufferError:
+                # Some chunk payloads are still referenced, the map will be
+                # released once they are garbage collected
+                pass
+        self.data = b""
+
+    def get_chunks(self):
+        """Return the (x, z) coordinates of the chunks present in the region"""
+        return [(int(x), int(z)) for z, x in zip(*np.nonzero(self.exists))]
+
+    def get_chunk_data(self, x, z):
+        """Return the compression type and the compressed payload of a chunk
+
+        The payload is a memoryview into the mapped file, so nothing is copied
+        until the chunk is decompressed.
+        """
+        if not self.exists[z, x]:
+            raise InconceivedChunk("Chunk %s,%s is not present in %s" % (x, z, self.filename))
+        start = int(self.offsets[z, x]) * SECTOR_SIZE
+        length = int.from_bytes(self.data[start:start+4], "big")
+        compression = self.data[start+4]
+        if compression & EXTERNAL:
+            filename = os.path.join(os.path.dirname(self.filename),
+                "c.%s.%s.mcc" % (self.x*32+x, self.z*32+z))
+            with open(filename, "rb") as f:
+                return compression & ~EXTERNAL, memoryview(f.read())
+        return compression, memoryview(self.data)[start+5:start+4+length]
+
+    def get_chunk_bytes(self, x, z):
+        """Return the decompressed NBT data of a chunk"""
+        compression, payload = self.get_chunk_data(x, z)
+        if compression == ZLIB:
+            return zlib.decompress(payload)
+        elif compression == GZIP:
+            return gzip.decompress(payload)
+        elif compression == UNCOMPRESSED:
+            return bytes(payload)
+        raise Exception("Unsupported compression type %s for chunk %s,%s in %s" % (
+            compression, x, z, self.filename))
+
+    def get_chunk(self, x, z, select=True):
+        """Parse a chunk, keeping only the tags in `select` (see nbtreader)"""
+        return nbtreader.parse(self.get_chunk_bytes(x, z), select)
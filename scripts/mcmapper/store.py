@@ -0,0 +1,229 @@
+import numpy as np
+import sqlite3
+import time
+
+
+# Bumped whenever the existing tables change.  The store is only a cache, so a
+# store with another version is emptied and rebuilt.  New tables are simply
+# added to existing stores.
+SCHEMA_VERSION = 2
+# Tables that are filled in as regions are rendered, so when one is added to
+# an existing store, its tiles are redrawn to fill it in
+RENDERED_TABLES = ("blocks",)
+schema = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS tiles (
+    dimension TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    x INTEGER NOT NULL,
+    z INTEGER NOT NULL,
+    image BLOB NOT NULL,
+    chunks BLOB,
+    updated REAL NOT NULL,
+    PRIMARY KEY (dimension, level, x, z)
+);
+CREATE TABLE IF NOT EXISTS portals (
+    dimension TEXT NOT NULL,
+    x INTEGER NOT NULL,
+    z INTEGER NOT NULL,
+    chunks BLOB NOT NULL,
+    found BLOB NOT NULL,
+    PRIMARY KEY (dimension, x, z)
+);
+CREATE TABLE IF NOT EXISTS blocks (
+    dimension TEXT NOT NULL,
+    name TEXT NOT NULL,
+    x INTEGER NOT NULL,
+    z INTEGER NOT NULL,
+    chunks BLOB NOT NULL,
+    PRIMARY KEY (dimension, name, x, z)
+);
+CREATE INDEX IF NOT EXISTS blocks_region ON blocks (dimension, x, z);
+CREATE TABLE IF NOT EXISTS regions (
+    dimension TEXT NOT NULL,
+    x INTEGER NOT NULL,
+    z INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    header TEXT NOT NULL,
+    PRIMARY KEY (dimension, x, z)
+);
+"""
+
+
+class TileStore(object):
+    """Rendered region tiles and their chunk timestamps, in a single SQLite file
+
+    Each tile is stored as a PNG along with the region's chunk timestamp table
+    from when it was rendered.  The results of portal searches are kept the
+    same way, as a mask of the chunks containing portals, and so is the
+    block index, a mask of the chunks containing each block.  The region
+    manifest has the size, modification time and header hash of each region
+    file as of its last render.  Level 0 has a tile per region, and each level
+    above it is the one below scaled down by half, so that a level n tile
+    covers 2**n by 2**n regions.  Connections can't be shared between
+    threads, so each thread or process should open its own store.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        # Several render processes write to the same store, so wait for the
+        # others rather than failing when the database is locked
+        self.db = sqlite3.connect(filename, timeout=60)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        # Take the write lock first, so that only one process sets up the tables
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            if self.db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                tables = self.db.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+                for (table,) in tables:
+                    self.db.execute('DROP TABLE "%s"' % table)
+                self.db.execute("PRAGMA user_version = %d" % SCHEMA_VERSION)
+            tables = {name for (name,) in self.db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            for statement in schema.split(";"):
+                if statement.strip():
+                    self.db.execute(statement)
+            if "tiles" in tables and any(table not in tables for table in RENDERED_TABLES):
+                self.mark_tiles_stale()
+            self.db.commit()
+        except:
+            self.db.rollback()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def get_meta(self, key, default=None):
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def set_meta(self, key, value):
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def check_version(self, renderer_version, colors_hash):
+        """Mark every tile as stale if it was drawn by another renderer or color table"""
+        version = "%s:%s" % (renderer_version, colors_hash)
+        if self.get_meta("version") != version:
+            with self.db:
+                self.mark_tiles_stale()
+                self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (version,))
+
+    def mark_tiles_stale(self):
+        """Have every region rendered again, in the current transaction"""
+        # Keep the old images around to display until they are redrawn
+        self.db.execute("UPDATE tiles SET chunks = NULL")
+        # Otherwise unchanged regions would never be checked again
+        self.db.execute("DELETE FROM regions")
+        self.db.execute("DELETE FROM meta WHERE key LIKE '%last_played:%'")
+
+    def get_tile_keys(self, dimension, level=0):
+        """Return the (x, z) coordinates of every tile in a dimension"""
+        return [tuple(row) for row in self.db.execute(
+            "SELECT x, z FROM tiles WHERE dimension = ? AND level = ?", (dimension, level))]
+
+    def get_tile(self, dimension, x, z, level=0):
+        """Return the PNG data of a tile, or None"""
+        row = self.db.execute("SELECT image FROM tiles WHERE dimension = ? AND level = ? "
+            "AND x = ? AND z = ?", (dimension, level, x, z)).fetchone()
+        return None if row is None else row[0]
+
+    def get_tiles(self, dimension, xMin, xMax, zMin, zMax, keys=None, level=0):
+        """Return {(x, z): PNG data} for the tiles within the bounds (inclusive)
+
+        If `keys` is given, only those tiles are returned.
+        """
+        rows = self.db.execute("SELECT x, z, image FROM tiles WHERE dimension = ? AND level = ? "
+            "AND x BETWEEN ? AND ? AND z BETWEEN ? AND ?", (dimension, level, xMin, xMax, zMin, zMax))
+        return {(x, z): image for x, z, image in rows if keys is None or (x, z) in keys}
+
+    def get_chunk_timestamps(self, dimension, x, z):
+        """Return the (32, 32) chunk timestamps a tile was rendered from, or None"""
+        row = self.db.execute("SELECT chunks FROM tiles WHERE dimension = ? AND level = 0 "
+            "AND x = ? AND z = ?", (dimension, x, z)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.uint32).reshape(32, 32)
+
+    def put_tile(self, dimension, x, z, image, timestamps=None, level=0):
+        """Save a tile's PNG data and the chunk timestamps it was rendered from"""
+        if timestamps is not None:
+            timestamps = np.ascontiguousarray(timestamps, dtype=np.uint32).tobytes()
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO tiles (dimension, level, x, z, image, chunks, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", (dimension, level, x, z, image, timestamps, time.time()))
+
+    def get_last_update(self, dimension, level=0):
+        """Return the time the most recently drawn tile of a level was saved, or 0"""
+        row = self.db.execute("SELECT MAX(updated) FROM tiles WHERE dimension = ? AND level = ?",
+            (dimension, level)).fetchone()
+        return row[0] or 0
+
+    def delete_tile(self, dimension, x, z, level=0):
+        with self.db:
+            self.db.execute("DELETE FROM tiles WHERE dimension = ? AND level = ? AND x = ? AND z = ?",
+                (dimension, level, x, z))
+
+    def get_portal_scan(self, dimension, x, z):
+        """Return the chunk timestamps and (32, 32) portal mask of a region's last portal search, or None"""
+        row = self.db.execute("SELECT chunks, found FROM portals WHERE dimension = ? AND x = ? AND z = ?",
+            (dimension, x, z)).fetchone()
+        if row is None:
+            return None
+        return (np.frombuffer(row[0], dtype=np.uint32).reshape(32, 32),
+            np.frombuffer(row[1], dtype=bool).reshape(32, 32))
+
+    def get_portal_scans(self):
+        """Return {(dimension, x, z): portal mask} for every region that has been searched"""
+        rows = self.db.execute("SELECT dimension, x, z, found FROM portals")
+        return {(dimension, x, z): np.frombuffer(found, dtype=bool).reshape(32, 32)
+            for dimension, x, z, found in rows}
+
+    def put_portal_scan(self, dimension, x, z, timestamps, found):
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO portals (dimension, x, z, chunks, found) VALUES (?, ?, ?, ?, ?)",
+                (dimension, x, z, np.ascontiguousarray(timestamps, dtype=np.uint32).tobytes(),
+                np.ascontiguousarray(found, dtype=bool).tobytes()))
+
+    def get_block_index(self, dimension, x, z):
+        """Return {block name: (32, 32) mask of the chunks containing it} for a region"""
+        rows = self.db.execute("SELECT name, chunks FROM blocks WHERE dimension = ? AND x = ? AND z = ?",
+            (dimension, x, z))
+        return {name: unpack_mask(chunks) for name, chunks in rows}
+
+    def put_block_index(self, dimension, x, z, index):
+        """Replace a region's block index, see get_block_index"""
+        with self.db:
+            self.db.execute("DELETE FROM blocks WHERE dimension = ? AND x = ? AND z = ?", (dimension, x, z))
+            self.db.executemany("INSERT INTO blocks (dimension, name, x, z, chunks) VALUES (?, ?, ?, ?, ?)",
+                [(dimension, name, x, z, np.packbits(mask).tobytes()) for name, mask in index.items()])
+
+    def find_block(self, dimension, name):
+        """Return [(region x, region z, chunk mask)] for the regions containing a block"""
+        rows = self.db.execute("SELECT x, z, chunks FROM blocks WHERE dimension = ? AND name = ?",
+            (dimension, name))
+        return [(x, z, unpack_mask(chunks)) for x, z, chunks in rows]
+
+    def get_region_manifest(self, dimension):
+        """Return {(x, z): (size, mtime, header hash)} for the region files of a dimension as they were last rendered"""
+        rows = self.db.execute("SELECT x, z, size, mtime, header FROM regions WHERE dimension = ?", (dimension,))
+        return {(x, z): (size, mtime, header) for x, z, size, mtime, header in rows}
+
+    def put_region_manifest(self, dimension, x, z, size, mtime, header):
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO regions (dimension, x, z, size, mtime, header) "
+                "VALUES (?, ?, ?, ?, ?, ?)", (dimension, x, z, size, mtime, header))
+
+
+def unpack_mask(data):
+    """Return a (32, 32) chunk mask stored with np.packbits"""
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8)).astype(bool).reshape(32, 32)
@@ -0,0 +1,133 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import time
+
+from .region import parse_region_name
+
+
+# From <sys/inotify.h>
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+# struct inotify_event: wd, mask, cookie and the length of the name that follows
+inotify_event = struct.Struct("iIII")
+
+
+def open_inotify(folder):
+    """Return an inotify file descriptor watching the writes to a folder, or None if inotify isn't available"""
+    if not hasattr(os, "uname") or os.uname().sysname != "Linux":
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    # The game writes chunks into regions that it keeps open, so IN_MODIFY is
+    # needed as well as IN_CLOSE_WRITE
+    mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+    if libc.inotify_add_watch(fd, os.fsencode(folder), mask) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class RegionWatcher(threading.Thread):
+    """Watches a region folder and reports the regions the game saves
+
+    The game saves a region's chunks one at a time, so the regions written
+    are collected until the folder has been quiet for `delay` seconds (or
+    for at most `max_delay`, while it's saving continuously), and `callback`
+    is then called from this thread with the set of (x, z) coordinates.
+    inotify is used on Linux, elsewhere the folder is listed every
+    `interval` seconds.
+    """
+    def __init__(self, folder, callback, delay=2.0, max_delay=10.0, interval=2.0):
+        threading.Thread.__init__(self, daemon=True)
+        self.folder = folder
+        self.callback = callback
+        self.delay = delay
+        self.max_delay = max_delay
+        self.interval = interval
+        self.stopping = threading.Event()
+        self.fd = open_inotify(folder)
+        self.snapshot = None if self.fd is not None else self.scan()
+
+    def stop(self):
+        self.stopping.set()
+
+    def run(self):
+        pending = set()
+        first = last = 0
+        try:
+            while not self.stopping.is_set():
+                timeout = 1.0 if self.fd is not None else self.interval
+                if pending:
+                    timeout = min(timeout, max(last + self.delay - time.monotonic(), 0))
+                changed = self.wait(timeout)
+                now = time.monotonic()
+                if changed:
+                    if not pending:
+                        first = now
+                    pending.update(changed)
+                    last = now
+                if pending and (now - last >= self.delay or now - first >= self.max_delay):
+                    if self.stopping.is_set():
+                        break
+                    self.callback(pending)
+                    pending = set()
+        finally:
+            if self.fd is not None:
+                os.close(self.fd)
+
+    def wait(self, timeout):
+        """Return the regions written within the next `timeout` seconds"""
+        if self.fd is None:
+            if self.stopping.wait(timeout):
+                return set()
+            snapshot = self.scan()
+            changed = {key for key, stat in snapshot.items() if self.snapshot.get(key) != stat}
+            self.snapshot = snapshot
+            return changed
+        changed = set()
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return changed
+        try:
+            data = os.read(self.fd, 64*1024)
+        except BlockingIOError:
+            return changed
+        pos = 0
+        while pos < len(data):
+            length = inotify_event.unpack_from(data, pos)[3]
+            pos += inotify_event.size
+            name = data[pos:pos+length].rstrip(b"\0").decode("utf-8", errors="replace")
+            pos += length
+            key = parse_region_name(name)
+            if key is not None:
+                changed.add(key)
+        return changed
+
+    def scan(self):
+        """Return {(x, z): (size, mtime)} for the regions in the folder"""
+        result = {}
+        try:
+            entries = list(os.scandir(self.folder))
+        except FileNotFoundError:
+            return result
+        for entry in entries:
+            key = parse_region_name(entry.name)
+            if key is not None:
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                result[key] = (stat.st_size, stat.st_mtime_ns)
+        return result
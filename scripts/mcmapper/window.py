@@ -0,0 +1,954 @@
+"""The map viewer's window, and the classes that load and draw its tiles
+
+This imports pyglet and OpenGL, so it is only imported once the window is
+opened; the render processes never need it.
+"""
+
+import collections
+import concurrent.futures
+import math
+import os
+import pyglet
+import queue
+import threading
+import time
+
+from io import BytesIO
+from .mapper import get_stale_regions, open_tile_store
+from .mapper import update_pyramid, find_block, PYRAMID_LEVELS
+from .pool import RenderPool, RenderScheduler
+from .portals import chunk_centers, get_portal_chunks
+from .watcher import RegionWatcher
+from .worker import find_portals_job
+from .colors import get_color_table
+from pyglet.gl import *
+from pyglet.window import key as KEY
+
+
+
+class TextureCache(object):
+    """Keeps the tile textures of every SpriteManager within a memory budget
+
+    Textures are tracked from least to most recently in view, and once they
+    add up to more than `budget` bytes the oldest ones that are out of view
+    are deleted.  Deleted tiles are loaded from the store again when needed.
+    """
+    def __init__(self, budget):
+        self.budget = budget
+        self.size = 0
+        # (SpriteManager, key) -> texture size in bytes
+        self.entries = collections.OrderedDict()
+        # The SpriteManager being drawn
+        self.current = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def add(self, manager, key, sprite):
+        self.remove(manager, key)
+        # Textures are stored as RGBA whatever the image format
+        size = sprite.image.width*sprite.image.height*4
+        self.entries[(manager, key)] = size
+        self.size += size
+
+    def remove(self, manager, key):
+        self.size -= self.entries.pop((manager, key), 0)
+
+    def touch(self, manager, keys):
+        for key in keys:
+            if (manager, key) in self.entries:
+                self.entries.move_to_end((manager, key))
+
+    def evict(self):
+        """Delete the least recently used textures that aren't in view"""
+        for manager, key in list(self.entries):
+            if self.size <= self.budget:
+                break
+            if manager is self.current and key in manager.visible:
+                continue
+            manager.unload(key)
+            self.evictions += 1
+
+    def get_stats(self):
+        return {"textures": len(self.entries), "bytes": self.size, "budget": self.budget,
+            "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+# Marks the tiles the TileLoader is reading
+LOADING = object()
+# Seconds per frame that can be spent uploading loaded tiles to the GPU
+UPLOAD_BUDGET = 0.008
+# The shortest time between redraws, so dragging doesn't draw more frames
+# than the display can show
+FRAME_TIME = 1/60
+
+
+class TileLoader(threading.Thread):
+    """Reads and decodes tiles in the background, so drawing never waits for the disk
+
+    SpriteManagers request the tiles they need, and the decoded images are
+    handed back to be uploaded on the GL thread.  Tiles that have left the
+    view by the time their request comes up are skipped.
+    """
+    def __init__(self, world, lock, callback):
+        super().__init__(daemon=True)
+        self.world = world
+        # The window's sprite lock, which guards the SpriteManagers
+        self.lock = lock
+        # Called (from this thread) whenever tiles have been loaded
+        self.callback = callback
+        self.requests = queue.Queue()
+
+    def request(self, manager, keys):
+        self.requests.put((manager, keys))
+
+    def stop(self):
+        self.requests.put(None)
+
+    def run(self):
+        with open_tile_store(self.world) as store:
+            while True:
+                request = self.requests.get()
+                if request is None:
+                    break
+                manager, keys = request
+                with self.lock:
+                    keys = manager.check_requested(keys)
+                if not keys:
+                    continue
+                xs, zs = [key[0] for key in keys], [key[1] for key in keys]
+                tiles = store.get_tiles(manager.dimension, min(xs), max(xs), min(zs), max(zs),
+                    keys, manager.level)
+                images = {key: manager.decode_tile(key, data) for key, data in tiles.items()}
+                with self.lock:
+                    manager.set_loaded(keys, images)
+                self.callback()
+
+
+class SpriteManager(object):
+    """The tiles of one level of a dimension's tile pyramid"""
+    def __init__(self, store, dimension, level, cache, loader):
+        self.dimension = dimension
+        self.level = level
+        self.cache = cache
+        self.loader = loader
+        # Tiles that haven't been loaded yet (or need reloading) map to None,
+        # then to LOADING while they are read and to their ImageData until
+        # they are uploaded
+        self.sprites = {key: None for key in store.get_tile_keys(dimension, level)}
+        # Only the sprites in view are in the batch, so drawing costs a call
+        # per visible texture however many tiles have been loaded
+        self.batch = pyglet.graphics.Batch()
+        self.visible = set()
+        self.bounds = None
+        # Tiles in view that aren't ready yet are drawn as plain rectangles
+        self.placeholder_batch = pyglet.graphics.Batch()
+        self.placeholders = {}
+        # The bounds last drawn, which unlike self.bounds aren't reset when tiles change
+        self.view = None
+        # Replaced sprites, which can only be deleted on the GL thread
+        self.retired = []
+
+    def set_visible(self, minX, maxX, minY, maxY):
+        """Put the tiles within the bounds, and only those, in the batch
+
+        Returns True if there are loaded tiles in view left to upload.
+        """
+        bounds = (minX, maxX, minY, maxY)
+        if bounds == self.bounds and not self.retired and self.cache.current is self and not self.placeholders:
+            return False
+        self.cache.current = self
+        self.bounds = bounds
+        self.view = bounds
+        for sprite in self.retired:
+            sprite.delete()
+        self.retired = []
+        self.load(minX, maxX, minY, maxY)
+        visible, waiting = set(), set()
+        for key, sprite in self.sprites.items():
+            if minX <= key[0] <= maxX and minY <= key[1] <= maxY:
+                (visible if isinstance(sprite, pyglet.sprite.Sprite) else waiting).add(key)
+        for key in self.visible - visible:
+            if isinstance(self.sprites.get(key), pyglet.sprite.Sprite):
+                self.sprites[key].batch = None
+        for key in visible:
+            self.sprites[key].batch = self.batch
+        self.visible = visible
+        for key in set(self.placeholders) - waiting:
+            self.placeholders.pop(key).delete()
+        size = 512 << self.level
+        for key in waiting - set(self.placeholders):
+            self.placeholders[key] = pyglet.shapes.Rectangle(size*key[0], -size*(key[1]+1), size, size,
+                color=(48, 48, 48), batch=self.placeholder_batch)
+        self.cache.touch(self, visible)
+        self.cache.evict()
+        return any(isinstance(self.sprites[key], pyglet.image.ImageData) for key in waiting)
+
+    def draw(self):
+        self.placeholder_batch.draw()
+        self.batch.draw()
+
+    def load(self, minX, maxX, minY, maxY):
+        """Request the unloaded tiles within the bounds, and upload the loaded ones
+
+        Uploading stops once UPLOAD_BUDGET has been spent, and carries on in
+        the next frame.
+        """
+        pending = set()
+        deadline = time.perf_counter() + UPLOAD_BUDGET
+        for key, sprite in list(self.sprites.items()):
+            if not (minX <= key[0] <= maxX and minY <= key[1] <= maxY):
+                continue
+            if sprite is None:
+                pending.add(key)
+                self.sprites[key] = LOADING
+                self.cache.misses += 1
+            elif isinstance(sprite, pyglet.image.ImageData):
+                if time.perf_counter() < deadline:
+                    self.sprites[key] = self.create_sprite(key, sprite)
+            elif sprite is not LOADING:
+                self.cache.hits += 1
+        if pending:
+            self.loader.request(self, pending)
+
+    def in_view(self, key):
+        return bool(self.view) and self.view[0] <= key[0] <= self.view[1] and self.view[2] <= key[1] <= self.view[3]
+
+    def check_requested(self, keys):
+        """Return the requested tiles that are still waiting and in view
+
+        The others will be requested again if they come back into view.
+        """
+        result = set()
+        for key in keys:
+            if self.sprites.get(key) is LOADING:
+                if self.in_view(key):
+                    result.add(key)
+                else:
+                    self.sprites[key] = None
+        return result
+
+    def set_loaded(self, keys, images):
+        """Hand over the images read for the requested `keys`"""
+        for key in keys:
+            # Tiles replaced in the meantime keep their new value
+            if self.sprites.get(key) is not LOADING:
+                continue
+            if key in images:
+                self.sprites[key] = images[key]
+            else:
+                # No longer in the store
+                del self.sprites[key]
+        self.bounds = None
+
+    def invalidate(self, keys):
+        """Reload the given tiles from the store the next time they are drawn"""
+        for key in keys:
+            self.replace(key, None)
+
+    def set_tile(self, key, data):
+        """Replace a tile with raw RGB data, such as a tile from a render process"""
+        # Only the sprite creation needs the GL context, so this can be called
+        # from any thread.  Tiles out of view are reloaded from the store when
+        # they are needed rather than keeping their data around.
+        if self.in_view(key):
+            self.replace(key, pyglet.image.ImageData(512, 512, "RGB", data, pitch=-512*3))
+        else:
+            self.replace(key, None)
+
+    def replace(self, key, value):
+        old = self.sprites.get(key)
+        if isinstance(old, pyglet.sprite.Sprite):
+            self.retired.append(old)
+            self.visible.discard(key)
+            self.cache.remove(self, key)
+        self.sprites[key] = value
+        # Recheck the visible tiles on the next draw
+        self.bounds = None
+
+    def create_sprite(self, key, image):
+        texture = image.get_texture()
+        glBindTexture(texture.target, texture.id)
+        glTexParameteri(texture.target, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        result = pyglet.sprite.Sprite(img=texture)
+        # Tiles above level 0 cover 2**level regions on each side
+        result.scale = 1 << self.level
+        result.x = result.width*key[0]
+        result.y = -result.height*(key[1]+1)
+        self.cache.add(self, key, result)
+        return result
+
+    def unload(self, key):
+        """Delete a tile's texture, it will be loaded from the store if it's drawn again"""
+        self.sprites[key].delete()
+        self.sprites[key] = None
+        self.cache.remove(self, key)
+        if key in self.visible:
+            self.visible.discard(key)
+            self.bounds = None
+
+    def decode_tile(self, key, data):
+        return pyglet.image.load("%s.%s.png" % key, file=BytesIO(data))
+
+
+class MarkerGroup(pyglet.graphics.Group):
+    """Draws its shapes at a point on the map, at the same size on screen at any zoom"""
+    def __init__(self, window, size, parent=None):
+        super().__init__(parent)
+        self.window = window
+        self.size = size
+        self.x, self.y, self.r = 0, 0, 0
+
+    def set_state(self):
+        glPushMatrix()
+        glTranslatef(self.x, self.y, 0)
+        glRotatef(self.r, 0, 0, 1)
+        glScalef(self.size/self.window.scale, self.size/self.window.scale, 1)
+
+    def unset_state(self):
+        glPopMatrix()
+
+
+class Indicator(object):
+    def __init__(self, window, batch):
+        self.window = window
+        self.group = MarkerGroup(window, 2)
+        center_y = -10/3
+        self.parts = [
+            pyglet.shapes.Triangle(0, 10-center_y, -5, -10-center_y, 5, -10-center_y, color=(255,0,0),
+                batch=batch, group=self.group),
+            pyglet.shapes.Line(0, 10-center_y, -5, -10-center_y, 1, color=(0,0,0), batch=batch, group=self.group),
+            pyglet.shapes.Line(0, 10-center_y, 5, -10-center_y, 1, color=(0,0,0), batch=batch, group=self.group),
+            pyglet.shapes.Line(-5, -10-center_y, 5, -10-center_y, 1, color=(0,0,0), batch=batch, group=self.group),
+        ]
+
+    def update(self, player):
+        self.group.x = player.x
+        self.group.y = -player.z
+        self.group.r = -player.yaw+180
+
+
+class PortalIndicator(object):
+    def __init__(self, window, dimension, x, z, batch):
+        self.window = window
+        self.dimension = dimension
+        self.x, self.z = x, z
+        self.group = MarkerGroup(window, 6)
+        self.group.x = x
+        self.group.y = -z
+        print(f"Portal at {(x, z)}")
+        self.parts = [
+            pyglet.shapes.Rectangle(-2, -3, 4, 6, color=get_color_table().get_color("nether_portal"),
+                batch=batch, group=self.group),
+            pyglet.shapes.Line(-2, 3, 2, 3, 1.5, color=(0,0,0), batch=batch, group=self.group),
+            pyglet.shapes.Line(-2, 3, -2, -3, 1.5, color=(0,0,0), batch=batch, group=self.group),
+            pyglet.shapes.Line(2, -3, -2, -3, 1.5, color=(0,0,0), batch=batch, group=self.group),
+            pyglet.shapes.Line(2, -3, 2, 3, 1.5, color=(0,0,0), batch=batch, group=self.group),
+        ]
+
+    def delete(self):
+        for part in self.parts:
+            part.delete()
+        self.parts = []
+
+
+class MapViewerWindow(pyglet.window.Window):
+    def __init__(self, world, *args, texture_memory=256*1024*1024, **kwargs):
+        pyglet.window.Window.__init__(self, *args, **kwargs)
+        self.level = world
+        self.store = open_tile_store(world)
+        # Every dimension's tiles are kept (within the texture budget), so
+        # switching back to a dimension doesn't reload it
+        self.texture_cache = TextureCache(texture_memory)
+        self.sprite_managers = {}
+        self.sprite_lock = threading.Lock()
+        self.tile_loader = TileLoader(world, self.sprite_lock, self.post_redraw)
+        self.tile_loader.start()
+        self._player = None
+        self._dimension = None
+        self.marker_batch = pyglet.graphics.Batch()
+        self.indicator = Indicator(self, self.marker_batch)
+        # {(dimension, region x, region z): [PortalIndicator]}
+        self.portals = {}
+        # Portals found by the search thread, waiting for their markers
+        self.found_portals = {}
+        self.portal_lock = threading.Lock()
+        self.portal_thread = None
+        # The batch and shapes highlighting the chunks found by find_block, per dimension
+        self.highlights = {}
+        # Watches the current dimension's regions while following the world
+        self.watcher = None
+        self.dimension = None
+        self.scale = 2.0
+        # Some additional attributes will be set by player.setter
+        self.player = self.level.get_players()[0]
+        self.locate_player()
+        self.gui = self.setup_gui()
+        self.progress_lock = threading.Lock()
+        self.setup_progress()
+        self.set_progress(None)
+        self.cancel_render = False
+        # Only redraw when something has changed: input events don't redraw
+        # by themselves, see request_redraw
+        self.invalid = False
+        self.last_frame = 0
+        self.redraw_scheduled = False
+        self.request_redraw()
+        self.render_pool = None
+        self.render_pool_lock = threading.Lock()
+        self.render_scheduler = None
+        self.render_thread = None
+        # Held while rendering, so that refreshes and followed saves take turns
+        self.render_lock = threading.Lock()
+        # self.render_thread = threading.Thread(target=self.render_world)
+        # self.render_thread.start()
+
+    @property
+    def player(self):
+        return self._player
+
+    @player.setter
+    def player(self, value):
+        self._player = value
+        if value.dimension != self.dimension:
+            self.dimension = value.dimension
+            self.locate_player()
+        self.player_location = (value.x, value.z)
+        self.indicator.update(value)
+        self.update_markers()
+
+    @property
+    def dimension(self):
+        return self._dimension
+
+    @dimension.setter
+    def dimension(self, value):
+        self._dimension = value
+        if value not in self.sprite_managers:
+            self.sprite_managers[value] = [SpriteManager(self.store, value, level,
+                self.texture_cache, self.tile_loader) for level in range(PYRAMID_LEVELS)]
+        self.sprites = self.sprite_managers[value]
+        self.set_caption(f"Map Viewer - {self.level.name} - {self._dimension}")
+        self.update_markers()
+        if self.watcher:
+            self.follow()
+
+    def update_markers(self):
+        """Show only the markers in the current dimension"""
+        if self._player:
+            self.indicator.group.visible = self._player.dimension == self._dimension
+        for portals in self.portals.values():
+            for portal in portals:
+                portal.group.visible = portal.dimension == self._dimension
+
+    def locate_player(self):
+        self.x = self._player.x-self.width/(2*self.scale)
+        self.y = -self._player.z-self.height/(2*self.scale)
+
+    def setup_gui(self):
+        self.font_spacing = None
+        btn_height = None
+        self.gui = []
+        self.gui_batch = pyglet.graphics.Batch()
+        # The outlines go over the buttons and the labels over both
+        backgrounds = pyglet.graphics.OrderedGroup(0)
+        outlines = pyglet.graphics.OrderedGroup(1)
+        labels = pyglet.graphics.OrderedGroup(2)
+        self.button_regions = {}
+        self.rectangles = {}
+        self.pressed_button = None
+        y = 0
+        for text in ("REFRESH MAP", "LOCATE PLAYER", "CHANGE DIMENSION", "FIND PORTALS"):
+            label = pyglet.text.Label(text, bold=True, color=(0,0,0, 255), anchor_y="center",
+                batch=self.gui_batch, group=labels)
+            if self.font_spacing is None:
+                self.font_height = label.content_height
+                self.font_spacing = label.content_height/2
+                btn_height = label.content_height*2
+            y -= self.font_spacing+btn_height
+            label.x = self.font_spacing*2
+            label.y = y + btn_height/2
+            xMin, yMin, xMax, yMax = (self.font_spacing, y, label.content_width+self.font_spacing*3, y+btn_height)
+            self.button_regions[(xMin, yMin, xMax, yMax)] = text
+            self.gui.append(pyglet.shapes.Rectangle(xMin, yMin, xMax-xMin, yMax-yMin, color=(192,192,192),
+                batch=self.gui_batch, group=backgrounds))
+            self.rectangles[text] = self.gui[-1]
+            self.gui.append(pyglet.shapes.Line(xMin, yMin, xMax, yMin, 5, color=(0,0,0),
+                batch=self.gui_batch, group=outlines))
+            self.gui.append(pyglet.shapes.Line(xMin, yMin, xMin, yMax, 5, color=(0,0,0),
+                batch=self.gui_batch, group=outlines))
+            self.gui.append(pyglet.shapes.Line(xMin, yMax, xMax, yMax, 5, color=(0,0,0),
+                batch=self.gui_batch, group=outlines))
+            self.gui.append(pyglet.shapes.Line(xMax, yMin, xMax, yMax, 5, color=(0,0,0),
+                batch=self.gui_batch, group=outlines))
+            self.gui.append(label)
+        return self.gui
+
+    def setup_progress(self):
+        """Create the progress bar, which is updated in place while it's shown"""
+        self.progress_batch = pyglet.graphics.Batch()
+        background = pyglet.graphics.OrderedGroup(0)
+        foreground = pyglet.graphics.OrderedGroup(1)
+        height = 3*self.font_height+self.font_spacing
+        self.progress_widgets = {
+            "background": pyglet.shapes.Rectangle(0, 0, self.width, height, color=(192,192,192),
+                batch=self.progress_batch, group=background),
+            "border": pyglet.shapes.Line(0, height, self.width, height, 5, color=(0,0,0),
+                batch=self.progress_batch, group=background),
+            "track": pyglet.shapes.Rectangle(self.font_spacing, self.font_spacing,
+                self.width-2*self.font_spacing, self.font_height, color=(255,255,255),
+                batch=self.progress_batch, group=background),
+            "bar": pyglet.shapes.Rectangle(self.font_spacing, self.font_spacing,
+                0, self.font_height, color=(64, 255, 64), batch=self.progress_batch, group=foreground),
+            "label": pyglet.text.Label("", bold=True, x=self.font_spacing, y=self.font_height*2+self.font_spacing,
+                anchor_y="center", color=(0,0,0,255), batch=self.progress_batch, group=foreground),
+        }
+        # The progress and window width the widgets were last updated for
+        self.progress_shown = None
+
+    def update_progress(self):
+        """Update the progress bar to the current progress and window size"""
+        with self.progress_lock:
+            progress = self.progress
+        if not progress or (progress, self.width) == self.progress_shown:
+            return
+        self.progress_shown = (progress, self.width)
+        widgets = self.progress_widgets
+        widgets["background"].width = self.width
+        widgets["border"].x2 = self.width
+        widgets["track"].width = self.width-2*self.font_spacing
+        widgets["bar"].width = progress[1][0] / progress[1][1] * (self.width-2*self.font_spacing)
+        if widgets["label"].text != progress[0].upper():
+            widgets["label"].text = progress[0].upper()
+
+    def set_progress(self, progress):
+        with self.progress_lock:
+            self.progress = progress
+        self.post_redraw()
+
+    def request_redraw(self, *args):
+        """Redraw the window once, as soon as FRAME_TIME has passed since the last frame
+
+        Must be called from the event loop's thread, use post_redraw elsewhere.
+        """
+        if self.redraw_scheduled:
+            return
+        self.redraw_scheduled = True
+        def _redraw(dt):
+            # The event loop redraws the windows after any scheduled call
+            self.redraw_scheduled = False
+        wait = self.last_frame + FRAME_TIME - time.perf_counter()
+        pyglet.clock.schedule_once(_redraw, max(wait, 0))
+
+    def post_redraw(self):
+        """Request a redraw from any thread"""
+        pyglet.app.platform_event_loop.post_event(self, "on_redraw_requested")
+
+    def on_redraw_requested(self):
+        self.request_redraw()
+
+    def render_world(self):
+        """Render the stale regions of the current dimension, in the render thread"""
+        with self.render_lock:
+            self.render_regions(self.dimension)
+
+        def _clear_progress(*args, **kwargs):
+            self.set_progress(None)
+        pyglet.clock.schedule_once(_clear_progress, 1, None)
+        self.render_thread = None
+
+    def render_regions(self, dimension, regions=None):
+        """Bring the tiles of a dimension up to date, showing the new tiles as they finish
+
+        With `regions`, only those are rendered and the progress isn't shown,
+        otherwise the stale regions are found first (see get_stale_regions).
+        Either way, only the chunks saved since the tiles were drawn are read.
+        """
+        set_progress = self.set_progress if regions is None else lambda progress: None
+        set_progress(("Checking regions...", (0, 1)))
+        with open_tile_store(self.level) as store:
+            if regions is not None:
+                renderable_regions = list(regions)
+            else:
+                # Read before checking the regions, so that anything saved
+                # while rendering is picked up by the next refresh
+                last_played = str(self.level.get_last_played())
+                if store.get_meta("tiles_last_played:" + dimension) == last_played:
+                    renderable_regions = []
+                else:
+                    renderable_regions = get_stale_regions(self.level, dimension, store)[1]
+        set_progress(("Checking regions...", (1, 1)))
+
+        all_missing_blocks = set()
+        rendered = set()
+        completed = 0
+        failed = False
+        results_lock = threading.Lock()
+        def _tile_done(result):
+            nonlocal completed, failed
+            with results_lock:
+                completed += 1
+                all_missing_blocks.update(result["missing"])
+                set_progress((f"Rendering {len(renderable_regions)} regions...", (completed, len(renderable_regions))))
+            if result["error"]:
+                failed = True
+                print(f"Error rendering region {result['x']},{result['z']}:\n{result['error']}")
+            elif result["tile"] is not None:
+                with results_lock:
+                    rendered.add((result["x"], result["z"]))
+                with self.sprite_lock:
+                    if result["dimension"] in self.sprite_managers:
+                        self.sprite_managers[result["dimension"]][0].set_tile(
+                            (result["x"], result["z"]), result["tile"])
+                self.post_redraw()
+
+        if len(renderable_regions) > 0:
+            set_progress((f"Rendering {len(renderable_regions)} regions...", (0, len(renderable_regions))))
+            # Regions are handed out nearest to the view first, and on_draw
+            # keeps the scheduler's focus up to date as the view moves
+            self.render_scheduler = RenderScheduler(renderable_regions, self.get_render_focus())
+            futures = []
+            try:
+                pool = self.get_render_pool()
+                while not self.cancel_render:
+                    future = pool.submit_next(self.render_scheduler, dimension, _tile_done)
+                    if future is None:
+                        break
+                    futures.append(future)
+            except concurrent.futures.process.BrokenProcessPool as e:
+                # Start new processes on the next refresh
+                print(f"Render processes stopped: {e}")
+                self.render_pool = None
+                failed = True
+            self.render_scheduler = None
+            concurrent.futures.wait(futures)
+        with open_tile_store(self.level) as store:
+            if rendered:
+                set_progress(("Updating zoomed out tiles...", (0, 1)))
+                changed = update_pyramid(store, dimension, rendered)
+                with self.sprite_lock:
+                    if dimension in self.sprite_managers:
+                        for level, keys in changed.items():
+                            self.sprite_managers[dimension][level].invalidate(keys)
+                set_progress(("Updating zoomed out tiles...", (1, 1)))
+            if regions is None and not failed and not self.cancel_render:
+                store.set_meta("tiles_last_played:" + dimension, last_played)
+        if all_missing_blocks:
+            print("Missing blocks:\n  "+"\n  ".join(sorted(all_missing_blocks)))
+        return rendered
+
+    def follow(self, enabled=True):
+        """Start or stop re-rendering the current dimension's regions as the game saves them"""
+        if self.watcher:
+            self.watcher.stop()
+            self.watcher = None
+        if enabled:
+            dimension = self.dimension
+            self.watcher = RegionWatcher(self.level.get_region_folder(dimension),
+                lambda regions: self.follow_world(dimension, regions))
+            self.watcher.start()
+
+    def follow_world(self, dimension, regions):
+        """Render the regions the game has saved, in the watcher's thread"""
+        regions = [(x, z) for x, z in regions
+            if os.path.isfile(self.level.get_region_filename(dimension, x, z))]
+        with self.render_lock:
+            if self.cancel_render:
+                return
+            self.render_regions(dimension, regions)
+        # The player files are saved along with the regions
+        pyglet.app.platform_event_loop.post_event(self, "on_world_saved")
+
+    def on_world_saved(self):
+        self.update_player()
+
+    def find_portals(self):
+        if not self.portal_thread:
+            self.portal_thread = threading.Thread(target=self.find_portals_thread)
+            self.portal_thread.start()
+
+    def find_portals_thread(self):
+        """Search every region for portals in the render processes
+
+        The portals found by earlier searches are shown straight away, and
+        each region's portals are replaced as its search finishes.  Only
+        the chunks saved since the last search are read.
+        """
+        self.set_progress(("Finding portals...", (0, 1)))
+        regions = []
+        for dimension in ("overworld", "nether"):
+            for filename in self.level.get_regions(dimension):
+                parts = os.path.basename(filename).split(".")
+                regions.append((dimension, int(parts[1]), int(parts[2])))
+        with open_tile_store(self.level) as store:
+            for (dimension, x, z), found in store.get_portal_scans().items():
+                self.add_portals(dimension, x, z, chunk_centers(get_portal_chunks(x, z, found)))
+
+        completed = 0
+        progress_lock = threading.Lock()
+        def _region_done(future):
+            nonlocal completed
+            if future.cancelled():
+                return
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Error finding portals: {e}")
+                return
+            if result["error"]:
+                print(f"Error finding portals in region {result['x']},{result['z']}:\n{result['error']}")
+            else:
+                self.add_portals(result["dimension"], result["x"], result["z"], result["portals"])
+            with progress_lock:
+                completed += 1
+                self.set_progress(("Finding portals...", (completed, len(regions))))
+
+        futures = []
+        try:
+            pool = self.get_render_pool()
+            for dimension, x, z in regions:
+                if self.cancel_render:
+                    break
+                future = pool.submit_job(find_portals_job, dimension, x, z)
+                future.add_done_callback(_region_done)
+                futures.append(future)
+        except concurrent.futures.process.BrokenProcessPool as e:
+            print(f"Render processes stopped: {e}")
+            self.render_pool = None
+        concurrent.futures.wait(futures)
+        self.set_progress(None)
+        self.portal_thread = None
+
+    def add_portals(self, dimension, x, z, positions):
+        """Replace the (x, z) positions of the portals shown for a region, from any thread"""
+        with self.portal_lock:
+            self.found_portals[(dimension, x, z)] = positions
+        self.post_redraw()
+
+    def update_portals(self):
+        """Create the markers for the portals found since the last frame"""
+        with self.portal_lock:
+            found, self.found_portals = self.found_portals, {}
+        for region, positions in found.items():
+            old = self.portals.get(region, [])
+            if [(portal.x, portal.z) for portal in old] == list(positions):
+                continue
+            for portal in old:
+                portal.delete()
+            self.portals[region] = [PortalIndicator(self, region[0], x, z, self.marker_batch)
+                for x, z in positions]
+        if found:
+            self.update_markers()
+
+    def find_block(self, name):
+        """Highlight the chunks that contain a block, according to the block index"""
+        self.highlights = {}
+        for dimension in ("overworld", "nether", "end"):
+            chunks = find_block(self.level, dimension, name)
+            if not chunks:
+                continue
+            print(f"{len(chunks)} chunks with {name} in the {dimension}:")
+            print("  " + "\n  ".join(f"{x*16},{z*16}" for x, z in chunks))
+            batch = pyglet.graphics.Batch()
+            shapes = [pyglet.shapes.Rectangle(x*16, -(z+1)*16, 16, 16, color=(255, 255, 0), batch=batch)
+                for x, z in chunks]
+            for shape in shapes:
+                shape.opacity = 128
+            self.highlights[dimension] = (batch, shapes)
+        if not self.highlights:
+            print(f"No chunks with {name} have been rendered")
+        self.request_redraw()
+
+    def get_render_pool(self):
+        # Render processes are started when first needed and kept until exit
+        with self.render_pool_lock:
+            if self.render_pool is None:
+                self.render_pool = RenderPool(self.level.folder)
+            return self.render_pool
+
+    def on_key_press(self, key, modifiers):
+        if key == KEY.ESCAPE:
+            self.minimize()
+            return pyglet.event.EVENT_HANDLED
+
+    def on_key_release(self, key, modifiers):
+        if key == KEY.I:
+            print("window top left:", (self.x, self.y))
+            print("player location:", self.player_location)
+            print("texture cache:", self.texture_cache.get_stats())
+        elif key == KEY.F:
+            self.follow(not self.watcher)
+            print("Following the world" if self.watcher else "Stopped following the world")
+        elif key == KEY.PAGEUP or key == KEY.PAGEDOWN: # page up or page down
+            scroll_y = -1 if key == KEY.PAGEDOWN else 1
+            mouse_x = self.x + self.width/2/self.scale
+            mouse_y = self.y + self.height/2/self.scale
+            self.scale *= pow(1.1, scroll_y)
+            self.x = mouse_x - self.width/2/self.scale
+            self.y = mouse_y - self.height/2/self.scale
+        elif key == KEY.LEFT or key == KEY.RIGHT:
+            dx = self.width/self.scale/4
+            dx = -dx if key == KEY.LEFT else dx
+            self.x += dx
+            if modifiers & KEY.MOD_CTRL:
+                self.x += dx
+        elif key == KEY.UP or key == KEY.DOWN:
+            dy = self.height/self.scale/4
+            dy = -dy if key == KEY.UP else dy
+            self.y -= dy
+            if modifiers & KEY.MOD_CTRL:
+                self.y -= dy
+        else:
+            print("Unhandled key: %s,%s" % (key, modifiers))
+            return
+        self.request_redraw()
+
+    def on_activate(self):
+        self.update_player()
+
+    def update_player(self):
+        new_player = self.level.get_players()[0]
+        if self.dimension == new_player.dimension:
+            self.player = new_player
+            self.request_redraw()
+
+    def on_resize(self, width, height):
+        pyglet.window.Window.on_resize(self, width, height)
+        self.request_redraw()
+
+    def on_expose(self):
+        self.request_redraw()
+
+    def on_draw(self, dt=None):
+        # starttime = time.time()
+        self.clear()
+        glLoadIdentity()
+        glScalef(self.scale, self.scale, 1)
+        glTranslatef(-self.x, -self.y, 0)
+
+        scheduler = self.render_scheduler
+        if scheduler:
+            scheduler.set_focus(self.get_render_focus())
+        # Use the level with about one texel per pixel, so that zooming out
+        # doesn't draw (and load) thousands of full size tiles
+        level = 0 if self.scale >= 1 else min(int(math.log2(1/self.scale)), PYRAMID_LEVELS-1)
+        minX, maxX, minY, maxY = self.get_tile_bounds(level)
+        with self.sprite_lock:
+            # Only does any work when the view or the loaded tiles have changed
+            uploading = self.sprites[level].set_visible(minX, maxX, minY, maxY)
+            self.sprites[level].draw()
+        if self.dimension in self.highlights:
+            self.highlights[self.dimension][0].draw()
+        self.update_portals()
+        self.marker_batch.draw()
+
+        glLoadIdentity()
+        glTranslatef(0, self.height, 0)
+        self.gui_batch.draw()
+
+        self.update_progress()
+        if self.progress:
+            glLoadIdentity()
+            self.progress_batch.draw()
+
+        self.last_frame = time.perf_counter()
+        if uploading:
+            # Carry on uploading in the next frame
+            self.request_redraw()
+
+        # duration = time.time()-starttime
+        # print(f"\r{duration:.3f}", end="")
+
+    def on_mouse_drag(self, x, y, dx, dy, buttons, modifiers):
+        if self.pressed_button:
+            return
+        self.x -= dx/self.scale
+        self.y -= dy/self.scale
+        self.request_redraw()
+
+    def on_mouse_press(self, x, y, button, modifiers):
+        for region, command in self.button_regions.items():
+            xMin, yMin, xMax, yMax = region
+            if xMin < x < xMax and yMin < y-self.height < yMax:
+                self.pressed_button = command
+                self.rectangles[command].color = (255,255,255)
+                self.request_redraw()
+
+    def on_mouse_release(self, x, y, button, modifiers):
+        for region, command in self.button_regions.items():
+            xMin, yMin, xMax, yMax = region
+            if command == self.pressed_button and xMin < x < xMax and yMin < y-self.height < yMax:
+                if command == "REFRESH MAP":
+                    if not self.render_thread:
+                        self.render_thread = threading.Thread(target=self.render_world)
+                        self.render_thread.start()
+                elif command == "LOCATE PLAYER":
+                    self.player = self.level.get_players()[0]
+                    self.locate_player()
+                elif command == "CHANGE DIMENSION":
+                    dimensions = {"overworld":"nether","nether":"end","end":"overworld"}
+                    self.dimension = dimensions[self.dimension]
+                elif command == "FIND PORTALS":
+                    self.find_portals()
+
+        if self.pressed_button:
+            self.rectangles[self.pressed_button].color = (192, 192, 192)
+            self.pressed_button = None
+            self.request_redraw()
+
+        # Select a chunk for debugging
+        if modifiers & 2: # CTRL is pressed
+            print("mouse click:", (x, y))
+            world_x = self.x + (self.width*(x/self.width)/self.scale)
+            world_z = -(self.y + (self.height*(y/self.height)/self.scale))
+            region_x = int(world_x // 512)
+            region_z = int(world_z // 512)
+            region_origin_x = region_x * 512
+            region_origin_z = region_z * 512
+            chunk_x = (world_x - region_origin_x) // 16
+            chunk_z = (world_z - region_origin_z) // 16
+            chunk = self.level.get_region("overworld", region_x, region_z).get_chunk(int(chunk_x), int(chunk_z))
+            print((world_x, world_z), (region_x, region_z), (chunk_x, chunk_z))
+            binn = lambda i: ("%64s" % bin(i).replace("-", "")[2:]).replace(" ", "0")
+            # print("Heightmap:")
+            # print("\n".join(binn(e) for e in chunk["Heightmaps"]["WORLD_SURFACE"]))
+            # sea level section
+            section = next(section for section in chunk["sections"] if section["Y"] == 3)
+            print("Palette:")
+            print("\n".join(str(e) for e in section["block_states"]["palette"]))
+            # print("Blocks:")
+            # print("\n".join(binn(e) for e in section["block_states"]["data"]))
+            print("Palette length:", len(bin(len(section["block_states"]["palette"])-1))-2)
+            # import pdb; pdb.set_trace()
+
+    def on_mouse_scroll(self, x, y, scroll_x, scroll_y):
+        mouse_x = self.x + x/self.scale
+        mouse_y = self.y + y/self.scale
+        self.scale *= pow(1.1, scroll_y)
+        self.x = mouse_x - x/self.scale
+        self.y = mouse_y - y/self.scale
+        self.request_redraw()
+
+    def get_render_focus(self):
+        """Return the viewport bounds and the points that should be rendered first"""
+        # Points are in region coordinates, offset so that they can be
+        # compared with the regions' top left corners
+        center_x = (self.x + self.width/2/self.scale) / 512 - 0.5
+        center_z = -(self.y + self.height/2/self.scale) / 512 - 0.5
+        points = [(center_x, center_z)]
+        if self.dimension == self.player.dimension:
+            points.append((self.player.x/512 - 0.5, self.player.z/512 - 0.5))
+        return self.get_tile_bounds(), points
+
+    def get_tile_bounds(self, level=0):
+        """Return the tile indexes of a pyramid level for the current viewport"""
+        size = 512 << level
+        minX = int(self.x // size)
+        maxX = int(minX + ((self.width/self.scale)//size))+1
+        maxY = -int(self.y // size)
+        minY = int(maxY - ((self.height/self.scale)//size))-2
+        return minX, maxX, minY, maxY
+
+
+MapViewerWindow.register_event_type("on_redraw_requested")
+MapViewerWindow.register_event_type("on_world_saved")
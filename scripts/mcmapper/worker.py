@@ -0,0 +1,73 @@
+"""The jobs run by the render processes
+
+Only what rendering needs is imported here, never the viewer's GUI modules,
+so that processes which have to import it (rather than being forked from
+the viewer) start quickly.
+"""
+
+import os
+import traceback
+
+from . import mapper, portals
+from .level import LevelInfo
+from multiprocessing import resource_tracker, shared_memory
+
+
+TILE_SIZE = 32*16*32*16*3
+
+# Each render process keeps its own world and tile store connection
+worker_world = None
+worker_store = None
+def init_worker(folder):
+    global worker_world, worker_store
+    worker_world = LevelInfo(folder)
+    worker_store = mapper.open_tile_store(worker_world)
+
+
+def update_tile_job(dimension, x, z, force):
+    """Update a tile in a render process, returning whether it was redrawn and any error"""
+    try:
+        tile, chunk_count = mapper.update_tile(worker_world, dimension, x, z, force, worker_store)
+    except Exception:
+        return x, z, False, 0, list(mapper.missing_blocks), traceback.format_exc()
+    return x, z, tile is not None, chunk_count, list(mapper.missing_blocks), None
+
+
+def render_tile_job(dimension, x, z, force=False):
+    """Update a tile in a render process
+
+    The RGB data of a redrawn tile is left in a shared memory block, whose name
+    is returned along with the missing blocks and any error.  On Windows,
+    where a block is destroyed as soon as this process closes it, the data
+    is returned in "tile" instead.
+    """
+    result = {"dimension": dimension, "x": x, "z": z, "chunks": 0,
+        "shm": None, "tile": None, "missing": [], "error": None}
+    try:
+        tile, result["chunks"] = mapper.update_tile(worker_world,
+            dimension, x, z, force, worker_store)
+        if tile is not None and os.name != "posix":
+            result["tile"] = tile.tobytes()
+        elif tile is not None:
+            shm = shared_memory.SharedMemory(create=True, size=TILE_SIZE)
+            shm.buf[:TILE_SIZE] = tile.tobytes()
+            result["shm"] = shm.name
+            shm.close()
+            # The viewer unlinks the block once it has copied the tile, so this
+            # process mustn't clean it up when it exits
+            resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        result["error"] = traceback.format_exc()
+    result["missing"] = sorted(mapper.missing_blocks)
+    return result
+
+
+def find_portals_job(dimension, x, z):
+    """Search a region for portals in a render process"""
+    result = {"dimension": dimension, "x": x, "z": z, "portals": [], "error": None}
+    try:
+        result["portals"] = portals.find_region_portals(worker_world,
+            dimension, x, z, worker_store)
+    except Exception:
+        result["error"] = traceback.format_exc()
+    return result
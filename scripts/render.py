@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Update the tiles and world map of a world without starting the viewer
+
+Nothing from the GUI is imported, so this starts quickly, and so do the
+render processes where they are spawned (and re-run this script) rather
+than forked.
+"""
+
+import argparse
+
+from mcmapper.filesystem import get_minecraft_basedir
+from mcmapper.level import LevelInfo, get_saves
+from mcmapper.mapper import render_world, missing_blocks, update_tile
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("world", nargs="?",
+        help="The world to render (default: the most recently played)")
+    parser.add_argument("--force", action="store_true",
+        help="Redraw every tile instead of only the changed chunks")
+    parser.add_argument("--jobs", type=int,
+        help="The number of render processes (default: one per CPU)")
+    parser.add_argument("--dimension", default="overworld",
+        choices=("overworld", "nether", "end"),
+        help="Which dimension to process")
+    parser.add_argument("--region",
+        help="Only render a certain region, given as x,z")
+    args = parser.parse_args()
+
+    if args.world:
+        world = LevelInfo(args.world)
+    else:
+        saves = get_saves()
+        if not saves:
+            parser.error("no saved worlds found in %s" % get_minecraft_basedir())
+        world = LevelInfo(saves[0]["folder"])
+    if args.region:
+        x, z = map(int, args.region.strip().split(","))
+        update_tile(world, args.dimension, x, z, args.force)
+    else:
+        render_world(world, args.dimension, force=args.force, jobs=args.jobs)
+    if len(missing_blocks):
+        print("Missing blocks:")
+        print("  " + "\n  ".join(sorted(missing_blocks)))
+
+
+if __name__ == '__main__':
+    main()